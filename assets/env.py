@@ -1,8 +1,67 @@
-tree = ([0b00011000],
-        [0b00111100],
-        [0b01111110],
-        [0b01111111],
-        [0b11111110],
-        [0b01111110],
-        [0b00011000],
-        [0b00011000],)
\ No newline at end of file
+tree = ((8, 8),
+bytearray([
+0b00011000,
+0b00111100,
+0b01111110,
+0b01111111,
+0b11111110,
+0b01111110,
+0b00011000,
+0b00011000]))
+
+grass_left = ((16, 16),
+bytearray([
+0b00000100, 0b00000100,
+0b00001100, 0b00001100,
+0b00001000, 0b00111000,
+0b00001000, 0b01100000,
+0b00001000, 0b01000000,
+0b00100100, 0b01000000,
+0b00110100, 0b11001111,
+0b11010110, 0b10011000,
+0b01010011, 0b11100000,
+0b01011101, 0b10000000,
+0b01000101, 0b10111111,
+0b01100110, 0b11100000,
+0b00011010, 0b11100000,
+0b00001111, 0b11100000,
+0b00000111, 0b11000000,
+0b00000111, 0b11000000]))
+
+grass_mid = ((16, 16),
+bytearray([
+0b00000000, 0b00010000,
+0b00000000, 0b00110000,
+0b00000000, 0b00100000,
+0b00111000, 0b01100000,
+0b00001000, 0b01000000,
+0b00000100, 0b01000110,
+0b00000100, 0b11011100,
+0b00000110, 0b10010000,
+0b00110011, 0b11100000,
+0b00011101, 0b10001111,
+0b11000101, 0b10111000,
+0b01110110, 0b11100000,
+0b00011010, 0b11100000,
+0b00001111, 0b11100000,
+0b00000111, 0b11000000,
+0b00000111, 0b11000000]))
+
+grass_right = ((16, 16),
+bytearray([
+0b00000011, 0b00000000,
+0b00000001, 0b00000000,
+0b00000000, 0b10000000,
+0b00000000, 0b10000000,
+0b11111000, 0b10000110,
+0b00001100, 0b01001100,
+0b00000100, 0b11011000,
+0b00000110, 0b10010000,
+0b11110011, 0b11100110,
+0b00011101, 0b10001100,
+0b11100101, 0b10111000,
+0b00110110, 0b11100000,
+0b00011010, 0b11100000,
+0b00001111, 0b11100000,
+0b00000111, 0b11000000,
+0b00000111, 0b11000000]))
@@ -0,0 +1,32 @@
+# MONO_VLSB copy of assets/env.py, generated by host/sprite_convert.py --masks
+# One line per 8 pixel page, one byte per column. Do not edit.
+
+tree = ((8, 8),
+bytearray([
+0x10, 0x3c, 0x3e, 0xff, 0xff, 0x3e, 0x3c, 0x08]),
+bytearray([
+0x10, 0x3c, 0x3e, 0xff, 0xff, 0x3e, 0x3c, 0x08]))
+
+grass_left = ((16, 16),
+bytearray([
+0x80, 0x80, 0x60, 0xc0, 0x1e, 0xe3, 0x80, 0x00, 0xc0, 0x78, 0x0c, 0x84, 0xc6, 0x43, 0x40, 0x40,
+0x00, 0x0f, 0x08, 0x13, 0x32, 0xee, 0xf9, 0xe7, 0xff, 0xf9, 0x3d, 0x04, 0x04, 0x04, 0x04, 0x04]),
+bytearray([
+0x80, 0x80, 0xe0, 0xc0, 0x1e, 0xe3, 0x80, 0x00, 0xc0, 0x78, 0x0c, 0x84, 0xc6, 0x43, 0x40, 0x40,
+0x00, 0x0f, 0x0f, 0x1f, 0x3e, 0xfe, 0xff, 0xff, 0xff, 0xf9, 0x3d, 0x04, 0x04, 0x04, 0x04, 0x04]))
+
+grass_mid = ((16, 16),
+bytearray([
+0x00, 0x00, 0x08, 0x08, 0x18, 0xe0, 0x80, 0x00, 0xc0, 0x78, 0x0e, 0xc3, 0x40, 0x60, 0x20, 0x00,
+0x04, 0x0c, 0x09, 0x1b, 0x32, 0xee, 0xf9, 0xe7, 0xff, 0xf9, 0x3d, 0x04, 0x06, 0x02, 0x02, 0x02]),
+bytearray([
+0x00, 0x00, 0x08, 0x08, 0x18, 0xe0, 0x80, 0x00, 0xc0, 0x78, 0x0e, 0xc3, 0x40, 0x60, 0x20, 0x00,
+0x04, 0x0c, 0x09, 0x1b, 0x32, 0xfe, 0xff, 0xff, 0xff, 0xf9, 0x3d, 0x04, 0x06, 0x02, 0x02, 0x02]))
+
+grass_right = ((16, 16),
+bytearray([
+0x10, 0x10, 0x10, 0x10, 0x30, 0xe0, 0x81, 0x03, 0xdc, 0x60, 0x00, 0xc0, 0x60, 0x30, 0x10, 0x00,
+0x05, 0x05, 0x0d, 0x1b, 0x32, 0xee, 0xf9, 0xe7, 0xff, 0xf9, 0x3d, 0x04, 0x06, 0x03, 0x01, 0x00]),
+bytearray([
+0x10, 0x10, 0x10, 0x10, 0x30, 0xe0, 0x81, 0x03, 0xdc, 0x60, 0x00, 0xc0, 0x60, 0x30, 0x10, 0x00,
+0x05, 0x05, 0x0d, 0x1f, 0x3e, 0xfe, 0xff, 0xff, 0xff, 0xf9, 0x3d, 0x04, 0x06, 0x03, 0x01, 0x00]))
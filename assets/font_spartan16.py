@@ -0,0 +1,324 @@
+# Generated by host/font_compile.py from LeagueSpartan-Bold-16.bdf, do not edit
+# FONT -FreeType-League Spartan-Bold-R-Normal--22-160-100-100-P-111-ISO10646-1
+# COPYRIGHT "OFL"
+# SPDX-FileCopyrightText: 2016-2020, Tyler Finck
+# SPDX-FileCopyrightText: 2014, Micah Rich <micah@micahrich.com>, with Reserved Font Name: "League Spartan".
+# SPDX-License-Identifier: OFL-1.1-RFN
+# Index: 5 bytes per character from first to last, strip offset (LE),
+# strip width, x offset (signed) and advance. Strips are MONO_VLSB,
+# pages * 8 rows tall.
+
+height = 19
+baseline = 15
+pages = 3
+first = 32
+last = 126
+
+index = (
+    b'\x00\x00\x00\x00\x06\x00\x00\x04\x01\x07\x0c\x00\x07\x01\x09\x21\x00\x0c\x01\x0f\x45\x00\x0b\x00\x0c\x66\x00\x10\x01\x12'
+    b'\x96\x00\x0f\x00\x0f\xc3\x00\x03\x01\x05\xcc\x00\x05\x01\x07\xdb\x00\x05\x01\x07\xea\x00\x07\x01\x09\xff\x00\x09\x01\x0c'
+    b'\x1a\x01\x04\x01\x06\x26\x01\x06\x01\x08\x38\x01\x04\x01\x07\x44\x01\x09\x01\x0b\x5f\x01\x0c\x00\x0d\x83\x01\x06\x00\x07'
+    b'\x95\x01\x0b\x00\x0d\xb6\x01\x0b\x00\x0c\xd7\x01\x0b\x00\x0c\xf8\x01\x0a\x01\x0c\x16\x02\x0a\x01\x0c\x34\x02\x0b\x01\x0c'
+    b'\x55\x02\x0a\x01\x0c\x73\x02\x0a\x01\x0c\x91\x02\x04\x01\x06\x9d\x02\x04\x01\x06\xa9\x02\x0a\x01\x0c\xc7\x02\x09\x01\x0c'
+    b'\xe2\x02\x0a\x01\x0c\x00\x03\x0a\x00\x0b\x1e\x03\x0f\x01\x11\x4b\x03\x0f\x00\x0f\x78\x03\x0a\x01\x0c\x96\x03\x0c\x01\x0e'
+    b'\xba\x03\x0b\x01\x0d\xdb\x03\x09\x01\x0c\xf6\x03\x08\x01\x0b\x0e\x04\x0f\x00\x10\x3b\x04\x0c\x01\x0e\x5f\x04\x03\x01\x06'
+    b'\x68\x04\x08\x00\x09\x80\x04\x0b\x01\x0d\xa1\x04\x09\x01\x0b\xbc\x04\x0f\x01\x12\xe9\x04\x0d\x01\x10\x10\x05\x0f\x00\x10'
+    b'\x3d\x05\x0a\x01\x0c\x5b\x05\x0f\x00\x10\x88\x05\x0b\x01\x0d\xa9\x05\x0b\x00\x0c\xca\x05\x0a\x00\x0b\xe8\x05\x0c\x01\x0e'
+    b'\x0c\x06\x0e\x00\x0f\x36\x06\x13\x00\x14\x6f\x06\x0f\x00\x10\x9c\x06\x0d\x00\x0d\xc3\x06\x0d\x00\x0e\xea\x06\x06\x01\x08'
+    b'\xfc\x06\x09\x01\x0b\x17\x07\x06\x01\x08\x29\x07\x08\x01\x09\x41\x07\x09\x00\x09\x5c\x07\x05\x01\x07\x6b\x07\x0b\x00\x0d'
+    b'\x8c\x07\x0b\x01\x0c\xad\x07\x08\x01\x09\xc5\x07\x0b\x00\x0c\xe6\x07\x0a\x00\x0b\x04\x08\x08\x00\x08\x1c\x08\x0b\x00\x0d'
+    b'\x3d\x08\x0a\x01\x0c\x5b\x08\x04\x01\x06\x67\x08\x06\xff\x06\x79\x08\x0a\x01\x0b\x97\x08\x03\x01\x06\xa0\x08\x10\x01\x12'
+    b'\xd0\x08\x0a\x01\x0c\xee\x08\x0b\x00\x0b\x0f\x09\x0b\x01\x0d\x30\x09\x0b\x01\x0d\x51\x09\x08\x01\x09\x69\x09\x08\x01\x0a'
+    b'\x81\x09\x07\x00\x08\x96\x09\x0a\x01\x0c\xb4\x09\x0b\x00\x0c\xd5\x09\x10\x00\x10\x05\x0a\x0a\x01\x0c\x23\x0a\x0b\x00\x0b'
+    b'\x44\x0a\x09\x00\x0a\x5f\x0a\x06\x01\x08\x71\x0a\x03\x01\x05\x7a\x0a\x06\x01\x08\x8c\x0a\x0b\x01\x0d')
+
+bitmap = (
+    b'\x00\xff\xff\x7f\x30\x7b\x7b\x78\x00\x00\x00\x00\x1f\x3f\x07\x00\x1f\x3f\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x20\x30\xf0\xfe\x3f\x33\xb0\xf8\xff\x3f\x30\x04\x76\x7f\x1f\x07\x06\x7e\x7f\x0f\x06\x06\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x18\x7e\xfe\xff\xe7\xc7\xc7\x87\x8e\x02\x20\x38\x38\x78\x70\xf0\xf1\x73\x7f\x3f\x1f\x00\x00\x00\x00\x00'
+    b'\x01\x01\x00\x00\x00\x00\x3e\x3f\x63\x63\x63\x3e\x3e\xc0\xe0\x38\x1e\x07\x03\x00\x00\x00\x00\x00\x40\x60\x78\x1e\x07\x03\x1c\x3e'
+    b'\x7f\x63\x63\x77\x3e\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\xfe\xfe\xff\xc7\xc7\xff\x7f'
+    b'\x3e\x00\x00\x00\x00\x0c\x3e\x3f\x7f\x73\x71\x73\x73\x3f\x3e\x3c\x7e\x7f\x66\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x1f\x3f\x0f\x00\x00\x00\x00\x00\x00\xe0\xfc\xff\x0f\x01\x3f\xff\xff\x00\x00\x00\x01\x07\x07\x04\x01\x0f\xff\xfc\xe0'
+    b'\x00\x80\xff\xff\x3f\x04\x07\x07\x01\x00\x02\x12\x1e\x0f\x1e\x12\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0'
+    b'\xc0\xc0\xf8\xf8\xf8\xc0\xc0\xc0\x01\x01\x01\x0f\x0f\x0f\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x78'
+    b'\xf8\xf0\x00\x03\x01\x00\x00\x00\x00\x00\x00\x00\x07\x07\x07\x07\x07\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x78\x78\x78'
+    b'\x00\x00\x00\x00\x00\x00\x00\x80\xf0\xfc\x3f\x07\x01\xc0\xf8\x7e\x1f\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80'
+    b'\xf8\xfc\xfe\x0f\x07\x07\x07\x0f\xfe\xfc\xf8\x00\x0f\x1f\x3f\x78\x70\x70\x70\x78\x3f\x1f\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x1c\x1c\x0e\xff\xff\xff\x00\x00\x00\x7f\x7f\x7f\x00\x00\x00\x00\x00\x00\x08\x1c\x1e\x1e\x07\x07\x07\xc7\xff\xfe\xfc'
+    b'\x00\x70\x78\x7c\x7c\x7e\x7f\x77\x73\x71\x70\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x0e\x0f\x07\xc7\xc7\xef\xfe\xfe'
+    b'\x18\x08\x18\x3c\x78\x70\x70\x70\x79\x3f\x3f\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xe0\xf0\x7c\x1f\xff\xff\xff'
+    b'\x00\x00\x0e\x0f\x0f\x0f\x0e\x0e\x7f\x7f\x7f\x0e\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\xff\xff\xdf\xe7\xe7\xe7\xe7'
+    b'\xc7\x80\x18\x38\x79\x70\x70\x70\x79\x3f\x3f\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xe0\xf0\xfc\xfe\xff\xe7\xc3\xc1\x80'
+    b'\x1f\x3f\x3f\x71\x70\x70\x70\x3f\x3f\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x07\x07\x07\x87\xe7\xff\xff\x3f\x0f\x03\x40'
+    b'\x70\x78\x7e\x1f\x07\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\xbe\xfe\xef\xc7\xc7\xe7\xfe\xfe\x18\x1f'
+    b'\x3f\x3f\x79\x71\x71\x71\x7f\x3f\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xfe\xfe\x87\x87\x87\x87\xfe\xfe\xfc\x00\x41\x63'
+    b'\x73\x7b\x3f\x1f\x0f\x03\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xe0\xe0\xc0\x30\x79\x79\x70\x00\x00\x00\x00\xc0\xe0\xe0'
+    b'\xc0\x70\x79\xf9\x70\x02\x03\x01\x00\xc0\xc0\xe0\xe0\x70\x70\x30\x38\x38\x1c\x01\x03\x03\x03\x07\x07\x0e\x0e\x1c\x1c\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x70\x70\x70\x70\x70\x70\x70\x70\x70\x07\x07\x07\x07\x07\x07\x07\x07\x07\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x1c\x38\x38\x70\x70\x60\xe0\xe0\xc0\xc0\x1c\x0c\x0e\x0e\x07\x07\x03\x03\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x04\x0e\x0e\x07\xc7\xc7\xff\x7f\x3e\x1c\x00\x00\x00\x33\x7b\x7b\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\xfc'
+    b'\x1c\xce\xe6\xf7\x33\x33\x63\xf7\xf7\x0e\x1c\xfc\xf0\x07\x1f\x1c\x39\x73\x77\x76\x66\x76\x73\x3f\x36\x06\x07\x03\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xf8\xff\x3f\x1f\x7f\xfe\xf0\x80\x00\x00\x00\x60\x78\x7f\x7f\x0f\x0f'
+    b'\x0e\x0e\x0e\x0f\x1f\x7f\x7e\x70\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xc7\xc7\xc7\xff\xff'
+    b'\xbe\x1c\x7f\x7f\x7f\x71\x71\x71\x71\x7f\x3f\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\xf8\xfc\x3e\x0e\x0f\x07\x07\x07\x0f'
+    b'\x0f\x06\x07\x0f\x1f\x3e\x38\x78\x70\x70\x70\x78\x78\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x07\x07\x07'
+    b'\x0f\x1e\xfe\xfc\xf0\x7f\x7f\x7f\x70\x70\x70\x78\x3c\x3f\x1f\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xc7\xc7'
+    b'\xc7\xc7\xc7\xc7\x7f\x7f\x7f\x71\x71\x71\x71\x71\x71\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xc7\xc7\xc7\xc7\xc7\x7f\x7f'
+    b'\x7f\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xf8\xfc\xfe\x1e\x0f\x07\x07\x87\x87\x8f\x9e\x8e\x8c\x80\x00\x07\x1f'
+    b'\x3f\x3c\x78\x70\x70\x71\x71\x79\x3d\x3f\x1f\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xc0\xc0'
+    b'\xc0\xc0\xc0\xff\xff\xff\xff\x7f\x7f\x7f\x01\x01\x01\x01\x01\x7f\x7f\x7f\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff'
+    b'\xff\xff\x7f\x7f\x7f\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\x30\x78\x70\x70\x7f\x3f\x3f\x0f\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\xff\xff\xff\xe0\xf0\xfc\x3e\x1f\x07\x03\x01\x7f\x7f\x7f\x01\x07\x0f\x3f\x7c\x78\x70\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\xff\xff\xff\x00\x00\x00\x00\x00\x00\x7f\x7f\x7f\x70\x70\x70\x70\x70\x70\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x3f'
+    b'\xff\xf8\x80\x00\x00\xe0\xfe\x7f\xff\xff\xff\x7f\x7f\x7f\x00\x01\x0f\x3f\x3c\x3f\x1f\x03\x00\x7f\x7f\x7f\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x0f\x3f\xfc\xf0\xc0\x00\x00\xff\xff\xff\x7f\x7f\x7f\x00\x00\x00\x03\x0f\x3f\x7c'
+    b'\x7f\x7f\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xf0\xfc\xfe\x1e\x0f\x07\x07\x07\x07\x0f\x1e\xfe\xfc\xf0\x00'
+    b'\x07\x1f\x3f\x3c\x78\x70\x70\x70\x70\x78\x3c\x3f\x1f\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff'
+    b'\x87\x87\x87\xcf\xff\xfe\xfc\x7f\x7f\x7f\x03\x03\x03\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xf0\xfc\xfe\x1e'
+    b'\x0f\x07\x07\x07\x07\x0f\x1e\xfe\xfc\xf0\x01\x0f\x1f\x3f\xbc\xf8\xf0\xf0\xf0\xf0\xf8\x3c\x3f\x9f\x8f\x00\x00\x00\x01\x03\x01\x01'
+    b'\x01\x03\x03\x07\x07\x07\x07\x03\xff\xff\xff\x87\x87\x87\xc7\xff\xfe\x7c\x00\x7f\x7f\x7f\x01\x03\x0f\x3f\x7f\x78\x60\x40\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x7e\xfe\xff\xe7\xc7\xc7\x87\x8e\x02\x20\x38\x38\x78\x70\x70\x71\x73\x7f\x3f\x1f\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x07\x07\x07\xff\xff\xff\x07\x07\x07\x00\x00\x00\x00\x7f\x7f\x7f\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x00\x00\x00\x00\x00\xff\xff\xff\xff\x0f\x1f\x3f\x78\x70\x70\x70\x78\x3f\x3f\x1f\x07'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x0f\x7f\xff\xfc\xc0\x00\x00\xc0\xf8\xff\xff\x1f\x03\x00\x00\x00\x03\x1f\x7f'
+    b'\x7e\x7c\x7f\x3f\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x3f\xff\xff\xf8\x00\x00\xf0\xff\x7f'
+    b'\xff\xfc\xc0\x00\xc0\xff\xff\xff\x07\x00\x00\x03\x7f\x7f\x7e\x7f\x7f\x07\x00\x01\x1f\x7f\x7c\x7f\x7f\x0f\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x07\x0f\x3f\xfe\xf8\xf0\xf8\xfe\x1f\x0f\x03\x01\x00\x40\x60'
+    b'\x78\x7c\x3f\x1f\x07\x03\x0f\x1f\x7f\x7c\x78\x60\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x0f\x1f\x7f'
+    b'\xfc\xf0\xe0\xf8\xfe\x7f\x1f\x07\x01\x00\x00\x00\x00\x01\x7f\x7f\x7f\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x07\x07\x07\x07\xc7\xf7\xff\xff\x3f\x0f\x07\x01\x40\x60\x78\x7e\x7f\x7f\x77\x71\x70\x70\x70\x70\x70\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x01\x01\x01\xff\xff\xff\x00\x00\x00\x07\x07\x07\x04\x04\x04\x01\x0f\x3f\xfc'
+    b'\xf0\x80\x00\x00\x00\x00\x00\x00\x00\x03\x0f\x7e\x78\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\xff\xff\xff\x00\x00\x00'
+    b'\xff\xff\xff\x04\x04\x04\x07\x07\x07\x08\x0e\x07\x03\x07\x0e\x0c\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x80\x80\x80\x80\x80\x80\x80\x80\x01\x01\x01\x01\x01\x01\x01\x01\x01\x02\x07\x06\x0c'
+    b'\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xc0\xc0\xc0\xc0\x80\xc0\xc0\xc0\x04\x1f\x3f\x7f\x71\x71\x71\x31\x7f\x7f'
+    b'\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x80\xc0\xc0\xc0\xc0\x80\x80\x00\x7f\x7f\x7f\x3b\x71\x71\x71\x7f\x3f'
+    b'\x3f\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xc0\xc0\xc0\xc0\xc0\x80\x1f\x3f\x7f\x71\x71\x71\x71\x20\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x80\xc0\xc0\xc0\xc0\x80\xff\xff\xff\x04\x1f\x3f\x7f\x71\x71\x71\x31\x7f\x7f\x7f\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x80\xc0\xc0\xc0\xc0\xc0\x80\x00\x04\x1f\x3f\x7f\x76\x66\x66\x77\x77\x27\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\xc0\xc0\xfe\xff\xff\xc3\xc3\x01\x01\x01\x7f\x7f\x7f\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xc0'
+    b'\xc0\xc0\xc0\x80\xc0\xc0\xc0\x04\x1f\x3f\x7f\x71\x71\x71\x31\xff\xff\xff\x00\x06\x07\x06\x06\x06\x06\x06\x07\x07\x03\xff\xff\xff'
+    b'\x80\xc0\xc0\xc0\xc0\x80\x80\x7f\x7f\x7f\x01\x01\x00\x01\x7f\x7f\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\xcf\xcf\x06\x7f'
+    b'\x7f\x7f\x00\x00\x00\x00\x00\x00\x00\xc6\xcf\xcf\xc6\x00\x00\xff\xff\xff\xff\x06\x06\x07\x07\x07\x01\xff\xff\xff\x00\x00\x80\xc0'
+    b'\xc0\x40\x00\x7f\x7f\x7f\x0e\x1f\x3f\x79\x70\x60\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x7f\x7f\x7f\x00\x00\x00'
+    b'\xc0\xc0\xc0\x80\xc0\xc0\xc0\xc0\x80\x80\xc0\xc0\xc0\xc0\x80\x00\x7f\x7f\x7f\x01\x00\x00\x7f\x7f\x7f\x03\x01\x00\x01\x7f\x7f\x7f'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xc0\xc0\x80\xc0\xc0\xc0\xc0\x80\x00\x7f\x7f\x7f\x01\x00\x00'
+    b'\x01\x7f\x7f\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xc0\xc0\xc0\xc0\xc0\x80\x00\x00\x04\x1f\x3f\x7f\x71\x71\x71'
+    b'\x7f\x3f\x1f\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xc0\xc0\x80\xc0\xc0\xc0\xc0\xc0\x80\x00\xff\xff\xff\x3b\x71\x71'
+    b'\x71\x7b\x3f\x3f\x0e\x07\x07\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xc0\xc0\xc0\xc0\x80\xc0\xc0\xc0\xc0\x1f\x3f\x7f\x71\x71'
+    b'\x71\x31\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x07\x07\x07\x07\xc0\xc0\xc0\x80\xc0\xc0\xc0\x40\x7f\x7f\x7f\x01\x01\x01\x01'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xc0\xc0\xc0\xc0\xc0\xc0\x00\x73\x77\x67\x66\x7e\x7c\x3d\x18\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\xc0\xc0\xfc\xfc\xfc\xc0\xc0\x01\x01\x3f\x7f\x7f\x71\x71\x00\x00\x00\x00\x00\x00\x00\xc0\xc0\xc0\x00\x00\x00\x00\xc0\xc0\xc0'
+    b'\x1f\x3f\x7f\x70\x70\x70\x78\x3f\x3f\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\xc0\xc0\xc0\x00\x00\x00\x00\xc0\xc0\xc0\x00'
+    b'\x01\x0f\x3f\x7f\x78\x7c\x7f\x1f\x07\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xc0\xc0\x80\x00\x00\x80\xc0\xc0\x80\x00'
+    b'\x00\xc0\xc0\xc0\xc0\x00\x07\x3f\x7f\x78\x7c\x1f\x07\x07\x3f\x7c\x7c\x7f\x3f\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x40\xc0\xc0\xc0\x00\x00\xc0\xc0\xc0\x40\x60\x70\x7b\x3f\x1f\x1f\x3f\x79\x70\x40\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x40\xc0\xc0\x80\x00\x00\x00\x80\xc0\xc0\xc0\x00\x03\x0f\x7f\xfe\xf0\xfc\x3f\x0f\x03\x00\x00\x00\x04\x07\x07\x07\x01'
+    b'\x00\x00\x00\x00\x00\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\x40\x60\x78\x7c\x7f\x6f\x67\x61\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\xfe\xff\xff\x01\x01\x03\xff\xff\xfd\x00\x00\x00\x03\x07\x07\x04\x04\xff\xff\xff\xff\xff\xff\x03\x03\x03\x01\x01\xff\xff\xfe\x00'
+    b'\x00\x00\xfd\xff\xff\x03\x04\x04\x07\x07\x03\x00\x00\x80\xc0\xc0\xc0\x80\x80\x80\x80\x80\x80\x01\x01\x01\x00\x01\x03\x03\x03\x03'
+    b'\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
+
+kern = {
+    0x2c31: -2,  # ',1'
+    0x2c54: -2,  # ',T'
+    0x2c56: -2,  # ',V'
+    0x2c57: -2,  # ',W'
+    0x2c59: -2,  # ',Y'
+    0x2e31: -2,  # '.1'
+    0x2e39: -2,  # '.9'
+    0x2e54: -2,  # '.T'
+    0x2e56: -2,  # '.V'
+    0x2e57: -2,  # '.W'
+    0x2e59: -2,  # '.Y'
+    0x2e66: -2,  # '.f'
+    0x2e74: -2,  # '.t'
+    0x2e76: -2,  # '.v'
+    0x2e79: -2,  # '.y'
+    0x372c: -2,  # '7,'
+    0x372e: -2,  # '7.'
+    0x3734: -2,  # '74'
+    0x3736: -2,  # '76'
+    0x3741: -2,  # '7A'
+    0x374a: -2,  # '7J'
+    0x3761: -2,  # '7a'
+    0x3763: -2,  # '7c'
+    0x3764: -2,  # '7d'
+    0x3765: -2,  # '7e'
+    0x3767: -2,  # '7g'
+    0x376f: -2,  # '7o'
+    0x3771: -2,  # '7q'
+    0x3773: -2,  # '7s'
+    0x392c: -2,  # '9,'
+    0x392e: -2,  # '9.'
+    0x4154: -2,  # 'AT'
+    0x4156: -2,  # 'AV'
+    0x4159: -2,  # 'AY'
+    0x462c: -2,  # 'F,'
+    0x462e: -2,  # 'F.'
+    0x4641: -2,  # 'FA'
+    0x464a: -2,  # 'FJ'
+    0x4b43: -2,  # 'KC'
+    0x4b47: -2,  # 'KG'
+    0x4b4f: -2,  # 'KO'
+    0x4b76: -2,  # 'Kv'
+    0x4b79: -2,  # 'Ky'
+    0x4c31: -2,  # 'L1'
+    0x4c54: -2,  # 'LT'
+    0x4c56: -2,  # 'LV'
+    0x4c57: -2,  # 'LW'
+    0x4c59: -2,  # 'LY'
+    0x502c: -2,  # 'P,'
+    0x502e: -2,  # 'P.'
+    0x504a: -2,  # 'PJ'
+    0x542c: -2,  # 'T,'
+    0x542e: -2,  # 'T.'
+    0x5434: -2,  # 'T4'
+    0x5436: -2,  # 'T6'
+    0x5441: -2,  # 'TA'
+    0x544a: -2,  # 'TJ'
+    0x5461: -2,  # 'Ta'
+    0x5463: -2,  # 'Tc'
+    0x5464: -2,  # 'Td'
+    0x5465: -2,  # 'Te'
+    0x5467: -2,  # 'Tg'
+    0x546d: -2,  # 'Tm'
+    0x546e: -2,  # 'Tn'
+    0x546f: -2,  # 'To'
+    0x5470: -2,  # 'Tp'
+    0x5471: -2,  # 'Tq'
+    0x5472: -2,  # 'Tr'
+    0x5473: -2,  # 'Ts'
+    0x5475: -2,  # 'Tu'
+    0x5476: -2,  # 'Tv'
+    0x5477: -2,  # 'Tw'
+    0x5478: -2,  # 'Tx'
+    0x5479: -2,  # 'Ty'
+    0x547a: -2,  # 'Tz'
+    0x562c: -2,  # 'V,'
+    0x562e: -2,  # 'V.'
+    0x5634: -2,  # 'V4'
+    0x5636: -2,  # 'V6'
+    0x5641: -2,  # 'VA'
+    0x564a: -2,  # 'VJ'
+    0x5661: -2,  # 'Va'
+    0x5663: -2,  # 'Vc'
+    0x5664: -2,  # 'Vd'
+    0x5665: -2,  # 'Ve'
+    0x5667: -2,  # 'Vg'
+    0x566d: -2,  # 'Vm'
+    0x566e: -2,  # 'Vn'
+    0x566f: -2,  # 'Vo'
+    0x5670: -2,  # 'Vp'
+    0x5671: -2,  # 'Vq'
+    0x5672: -2,  # 'Vr'
+    0x5673: -2,  # 'Vs'
+    0x5675: -2,  # 'Vu'
+    0x5678: -2,  # 'Vx'
+    0x567a: -2,  # 'Vz'
+    0x572c: -2,  # 'W,'
+    0x572e: -2,  # 'W.'
+    0x5741: -2,  # 'WA'
+    0x5830: -2,  # 'X0'
+    0x5843: -2,  # 'XC'
+    0x5847: -2,  # 'XG'
+    0x584f: -2,  # 'XO'
+    0x5851: -2,  # 'XQ'
+    0x5876: -2,  # 'Xv'
+    0x5879: -2,  # 'Xy'
+    0x592c: -2,  # 'Y,'
+    0x592e: -2,  # 'Y.'
+    0x5934: -2,  # 'Y4'
+    0x5936: -2,  # 'Y6'
+    0x5941: -2,  # 'YA'
+    0x594a: -2,  # 'YJ'
+    0x5961: -2,  # 'Ya'
+    0x5963: -2,  # 'Yc'
+    0x5964: -2,  # 'Yd'
+    0x5965: -2,  # 'Ye'
+    0x5967: -2,  # 'Yg'
+    0x596d: -2,  # 'Ym'
+    0x596e: -2,  # 'Yn'
+    0x596f: -2,  # 'Yo'
+    0x5970: -2,  # 'Yp'
+    0x5971: -2,  # 'Yq'
+    0x5972: -2,  # 'Yr'
+    0x5973: -2,  # 'Ys'
+    0x5975: -2,  # 'Yu'
+    0x5978: -2,  # 'Yx'
+    0x597a: -2,  # 'Yz'
+    0x6131: -2,  # 'a1'
+    0x6154: -2,  # 'aT'
+    0x6156: -2,  # 'aV'
+    0x6159: -2,  # 'aY'
+    0x6254: -2,  # 'bT'
+    0x6259: -2,  # 'bY'
+    0x6354: -2,  # 'cT'
+    0x6531: -2,  # 'e1'
+    0x6554: -2,  # 'eT'
+    0x6556: -2,  # 'eV'
+    0x6559: -2,  # 'eY'
+    0x662c: -2,  # 'f,'
+    0x662e: -2,  # 'f.'
+    0x6731: -2,  # 'g1'
+    0x6754: -2,  # 'gT'
+    0x6756: -2,  # 'gV'
+    0x6759: -2,  # 'gY'
+    0x6831: -2,  # 'h1'
+    0x6854: -2,  # 'hT'
+    0x6859: -2,  # 'hY'
+    0x6b54: -2,  # 'kT'
+    0x6b59: -2,  # 'kY'
+    0x6d31: -2,  # 'm1'
+    0x6d54: -2,  # 'mT'
+    0x6d56: -2,  # 'mV'
+    0x6d59: -2,  # 'mY'
+    0x6e31: -2,  # 'n1'
+    0x6e54: -2,  # 'nT'
+    0x6e56: -2,  # 'nV'
+    0x6e59: -2,  # 'nY'
+    0x6f54: -2,  # 'oT'
+    0x6f59: -2,  # 'oY'
+    0x7031: -2,  # 'p1'
+    0x7054: -2,  # 'pT'
+    0x7056: -2,  # 'pV'
+    0x7059: -2,  # 'pY'
+    0x7131: -2,  # 'q1'
+    0x7154: -2,  # 'qT'
+    0x7159: -2,  # 'qY'
+    0x722c: -2,  # 'r,'
+    0x722e: -2,  # 'r.'
+    0x7232: -2,  # 'r2'
+    0x7233: -2,  # 'r3'
+    0x7237: -2,  # 'r7'
+    0x724a: -2,  # 'rJ'
+    0x7254: -2,  # 'rT'
+    0x7258: -2,  # 'rX'
+    0x725a: -2,  # 'rZ'
+    0x7331: -2,  # 's1'
+    0x7354: -2,  # 'sT'
+    0x7356: -2,  # 'sV'
+    0x7359: -2,  # 'sY'
+    0x7531: -2,  # 'u1'
+    0x7554: -2,  # 'uT'
+    0x7559: -2,  # 'uY'
+    0x762c: -2,  # 'v,'
+    0x762e: -2,  # 'v.'
+    0x7631: -2,  # 'v1'
+    0x7632: -2,  # 'v2'
+    0x7637: -2,  # 'v7'
+    0x7654: -2,  # 'vT'
+    0x7658: -2,  # 'vX'
+    0x7659: -2,  # 'vY'
+    0x765a: -2,  # 'vZ'
+    0x7754: -2,  # 'wT'
+    0x7831: -2,  # 'x1'
+    0x7854: -2,  # 'xT'
+    0x7859: -2,  # 'xY'
+    0x7937: -2,  # 'y7'
+    0x7954: -2,  # 'yT'
+    0x7a31: -2,  # 'z1'
+    0x7a54: -2,  # 'zT'
+    0x7a59: -2,  # 'zY'
+}
@@ -81,6 +81,7 @@ class PixelArtApp:
         bytearray_export.add_command(label="As bin (better visual)", command=lambda:self.dump_bytearray('bin'))
         bytearray_export.add_command(label="As hex (more compact)", command=lambda:self.dump_bytearray('hex'))
         file_menu.add_cascade(label="Copy as Bytearray", menu=bytearray_export)
+        file_menu.add_command(label="Copy as VLSB Bytearray (SSD1306)", command=self.dump_vlsb_bytearray)
 
         menu.add_cascade(label="Canvas", menu=canvas_menu)
         # Saving this for next release
@@ -184,6 +185,27 @@ class PixelArtApp:
                 data.append(byte)
         return data
     
+    def _to_vlsb_bytearray(self):
+        # SSD1306 page layout: 8 rows per byte, LSB on top, one byte per column
+        data = bytearray(self.width * ((self.height + 7) // 8))
+        for y in range(self.height):
+            for x in range(self.width):
+                if self.pixels[y][x]:
+                    data[(y // 8) * self.width + x] |= 1 << (y % 8)
+        return data
+
+    def dump_vlsb_bytearray(self):
+        data = self._to_vlsb_bytearray()
+        data_str = ''
+        for ind, byte in enumerate(data):
+            if (ind != 0) and (ind % self.width == 0):
+                data_str += '\n'
+            data_str += f'0x{byte:02x}, '
+        self.root.clipboard_clear()
+        self.root.clipboard_append(f"(({self.width}, {self.height}),\nbytearray([\n{data_str.strip(', ')}]))")
+        messagebox.showinfo("Copy as VLSB Bytearray", "Bytearray copied to clipboard")
+        self.root.update()
+
     def dump_bytearray(self, dtype='bin'):
         data = self._to_bytearray()
         data_str = ''
@@ -2,65 +2,62 @@ import sys
 if '/lib' not in sys.path:
     sys.path.append('/lib')
 
-import math
 import ssd1306
-from machine import Pin, I2C, Timer
+from machine import Pin, I2C
 import time
-import _thread
 
 # Set up I2C and OLED display
 i2c = I2C(0, sda=Pin(0), scl=Pin(1), freq=400000)
 oled = ssd1306.SSD1306_I2C(128, 64, i2c)
 
 # Ball position and speed
-fps = 60  # Frames per second
-xpos = 0
 speed = 115  # Pixels per second
-frame_time = 1000 // fps  # Frame time in milliseconds
+frames = 200  # Frames rendered per run
 
-# Shared lock for thread-safe access to variables
-lock = _thread.allocate_lock()
+def draw_ball(xpos):
+    # Clear the display
+    oled.fill(0)
 
-def draw_ball():
-    global xpos
-    last_time = time.ticks_ms()
-    
-    while True:
+    # Some static text so every frame has a bit of rendering work
+    for row in range(0, 24, 8):
+        oled.text('fps tester', 0, row)
+
+    # Draw the ball as a small filled rectangle
+    oled.text('o', int(xpos), 30)  # A 4x4 "ball"
+
+def run(frames):
+    # Renders and flushes `frames` frames as fast as possible, returns the fps
+    xpos = 0
+    start = time.ticks_ms()
+    last_time = start
+
+    for _ in range(frames):
         # Get the current time
         current_time = time.ticks_ms()
-        
-        # Calculate the elapsed time in seconds
-        elapsed_time = time.ticks_diff(current_time, last_time) / 1000.0  # Convert milliseconds to seconds
-        
+
         # Update ball position based on elapsed time
-        with lock:  # Ensure thread-safe update
-            xpos += speed * elapsed_time
-            if xpos > 128:  # Reset if out of bounds
-                xpos = 0
-        
-        # Clear the display
-        oled.fill(0)
-        
-        # Draw the ball as a small filled rectangle
-        with lock:  # Ensure thread-safe read
-            oled.text('o', int(xpos), 30)  # A 4x4 "ball"
-        
-        oled.show()
-        
-        # Update last_time
+        xpos += speed * time.ticks_diff(current_time, last_time) / 1000.0
+        if xpos > 128:  # Reset if out of bounds
+            xpos = 0
         last_time = current_time
-        
-        # Delay for the frame time
-        time.sleep_ms(frame_time)
 
-# Main function to start the second core
-def main():
-    # Start the ball-drawing routine on the second core
-    _thread.start_new_thread(draw_ball, ())
-    
-    # Main loop (can handle other tasks here)
-    while True:
-        pass  # Add main-core tasks here if needed
+        draw_ball(xpos)
+        oled.show()
+
+    oled.wait()
+    return frames * 1000 / time.ticks_diff(time.ticks_ms(), start)
+
+# Single buffer: rendering and the I2C transfer both run on core 0
+single = run(frames)
+
+# Double buffer: core 0 renders the next frame while core 1 sends the last
+oled.start_worker()
+double = run(frames)
+oled.stop_worker()
 
-# Run the main function
-main()
+print("single buffer: %.1f fps" % single)
+print("double buffer: %.1f fps" % double)
+oled.fill(0)
+oled.text("1x %.1f fps" % single, 0, 20)
+oled.text("2x %.1f fps" % double, 0, 36)
+oled.show()
@@ -9,14 +9,23 @@ import ds3231
 import ssd1306
 import aht20
 import mfs
-from machine import Pin, ADC, I2C, Timer
+from machine import Pin, ADC, I2C
 import neopixel
-import time
-import env
-import framebuf
+import env_masked
+from array import array
+import masked
+from scene import Scene
+from entities import EntityStore
+import sched
+from ring import Ring
+from dualcore import Runtime
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
 
 # Initializing I2C
-i2c=machine.I2C(0,sda=Pin(0), scl=Pin(1), freq=400000)
+i2c=I2C(0,sda=Pin(0), scl=Pin(1), freq=400000)
 
 ptr = ADC(Pin(29))
 button = Pin(24, Pin.IN, Pin.PULL_UP)
@@ -36,86 +45,182 @@ display_status = True
 flag = True
 l = 0
 
-frame_series = [env.grass_left, env.grass_mid, env.grass_right, env.grass_mid]
+# Masked sprites, so overlapping grass covers what is behind it
+sprites = masked.load(env_masked)
+frame_series = [((16, 16), sprites['grass_left']), ((16, 16), sprites['grass_mid']), ((16, 16), sprites['grass_right']), ((16, 16), sprites['grass_mid'])]
 frame_timings = [3, 2, 3, 2]
 
 l1.value(1)
 l2.value(0)
 
+# Messages from the logic loops (core 1) to the graphics loop (core 0)
+# Bytes: type, pad, then handle, x, y as little-endian int16. Written and
+# read field by field, so posting allocates nothing.
+MSG_SIZE = const(8)
+MSG_MOVE = const(1)
+MSG_KILL = const(2)
+
 class Pyogotchi:
-    def __init__(self, disp, frame_cl: int, game_cl: int, env_cl: int):
+    def __init__(self, disp, frame_cl: int, game_cl: int, env_cl: int, capacity: int = 256):
         self.disp = disp
         self.frame_cl = frame_cl
         self.game_cl = game_cl
         self.env_cl = env_cl
         
-        self.sprites = {}
+        # Instances live in array columns indexed by handle, names are optional
+        self.entities = EntityStore(capacity)
+        self.names = {}
+        # Animation schedule: the store's timing wheel, so a frame tick only
+        # visits the sprites whose frame changes on it
+        self.tick = 0
+        # Retained scene: only what changed is recomposited and flushed
+        self.scene = Scene(disp)
+        self.scene.add_layer('entities', self.entities)
         self.sensors = []
         self.inputs = []
         
-        self.frame_tmr = machine.Timer(-1)
-        self.game_tmr = machine.Timer(-1)
-        self.env_tmr = machine.Timer(-1)
+        # Cooperative schedulers instead of three machine.Timers. A late frame
+        # is skipped, not queued; the frame loop gets half its period as budget.
+        # Graphics runs on core 0, the game and env loops on core 1. Only the
+        # graphics loop touches the scene, the others send it messages.
+        self.sched = sched.Scheduler()
+        self.logic = sched.Scheduler()
+        self.inbox = Ring(32, MSG_SIZE)
+        self.runtime = Runtime(self.sched, self.logic)
         
-    def add(self, name: str, sprite, frame: int, x: int, y: int):
+    def add(self, name, sprite, frame: int, x: int, y: int):
+        # Returns the instance's handle. name may be None for anonymous
+        # instances (particles, grass), use the handle with move_handle/kill.
         if frame >= sprite.length or frame < 0:
             raise ValueError("Invalid initial frame")
-        if name in self.sprites.keys():
+        if name is not None and name in self.names:
             raise ValueError("Object already exists")
+        store = self.entities
         seq_counter, frame_data = sprite.force_retrieve(frame)
-        self.sprites[name] = [sprite, seq_counter, frame_data, x, y]
+        # The seq column holds the counter on the instance's next scheduled tick
+        wait = sprite.next_change(seq_counter, frame)
+        handle = store.spawn(store.kind(sprite), x, y, frame, (seq_counter + wait) % sprite.period)
+        store.schedule(handle, self.tick + wait)
+        if name is not None:
+            self.names[name] = handle
+        self.scene.invalidate(x, y, sprite.width, sprite.height)
+        return handle
+
+    def kill(self, handle: int):
+        self.scene.invalidate(*self.entities.bounds(handle))
+        self.entities.kill(handle)
+
+    def move(self, name: str, x: int, y: int):
+        self.move_handle(self.names[name], x, y)
+
+    def move_handle(self, handle: int, x: int, y: int):
+        store = self.entities
+        self.scene.invalidate(*store.bounds(handle))
+        store.move(handle, x, y)
+        self.scene.invalidate(*store.bounds(handle))
+
+    # From the core 1 loops: queued for the next frame, False when the inbox is full
+
+    def post_move(self, handle: int, x: int, y: int):
+        return self._post(MSG_MOVE, handle, x, y)
+
+    def post_kill(self, handle: int):
+        return self._post(MSG_KILL, handle, 0, 0)
+
+    def _post(self, kind, handle, x, y):
+        inbox = self.inbox
+        msg = inbox.slot()
+        if msg is None:
+            inbox.dropped += 1
+            return False
+        msg[0] = kind
+        msg[2] = handle & 0xff
+        msg[3] = (handle >> 8) & 0xff
+        msg[4] = x & 0xff
+        msg[5] = (x >> 8) & 0xff
+        msg[6] = y & 0xff
+        msg[7] = (y >> 8) & 0xff
+        inbox.push()
+        return True
+
+    def _read_inbox(self):
+        inbox = self.inbox
+        msg = inbox.peek()
+        while msg is not None:
+            kind = msg[0]
+            handle = msg[2] | msg[3] << 8
+            x = msg[4] | msg[5] << 8
+            y = msg[6] | msg[7] << 8
+            inbox.pop()
+            if x & 0x8000:
+                x -= 0x10000
+            if y & 0x8000:
+                y -= 0x10000
+            if kind == MSG_MOVE:
+                self.move_handle(handle, x, y)
+            elif kind == MSG_KILL:
+                self.kill(handle)
+            msg = inbox.peek()
     
-    def _frame_update(self, timer):
-        to_update = []
-        for sprite in self.sprites:
-            curr_seq = self.sprites[sprite][1]
-            frame_data, reset_flag = self.sprites[sprite][0].get_next_frame(curr_seq)
-            
-            if frame_data is not None:
-                self.sprites[sprite][2] = frame_data
-                to_update.append(sprite)
-                
-            if reset_flag:
-                self.sprites[sprite][1] = 0
-            else:
-                self.sprites[sprite][1] += 1
+    def _frame_update(self, task):
+        self._read_inbox()
+        store = self.entities
+        ready = store.ready
+        seq, frame, kinds = store.seq, store.frame, store.kinds
+        # Ticks of skipped frames still advance the animations, only the
+        # rendering is dropped
+        for _ in range(task.dropped + 1):
+            tick = self.tick
+            for i in range(store.expire(tick)):
+                h = ready[i]
+                sprite = kinds[store.sprite[h]]
+                curr_seq = seq[h]
+                shown = sprite.shown[curr_seq]
+                if shown != frame[h]:
+                    frame[h] = shown
+                    self.scene.invalidate(store.x[h], store.y[h], sprite.width, sprite.height)
+                wait = sprite.wait[curr_seq]
+                seq[h] = (curr_seq + wait) % sprite.period
+                store.schedule(h, tick + wait)
+            self.tick = tick + 1
         
-        for sprite in to_update:
-            width, height = self.sprites[sprite][0].width, self.sprites[sprite][0].height
-            x, y = self.sprites[sprite][3], self.sprites[sprite][4]
-            data = self.sprites[sprite][2]
-            fbuf = framebuf.FrameBuffer(data, width, height, framebuf.MONO_HLSB)
-            self.disp.blit(fbuf, x, y)
-        self.disp.show()
+        if self.scene.render():
+            with self.runtime.bus:
+                self.disp.show()
     
-    def _game_update(self, timer):
+    def _game_update(self, task):
         #print("game updated")
         l1.toggle()
         l2.toggle()
         
-    def _env_update(self, timer):
+    def _env_update(self, task):
         #print("env updated")
         led.toggle()
     
-    def begin(self):
-        for sprite in self.sprites:
-            width, height = self.sprites[sprite][0].width, self.sprites[sprite][0].height
-            x, y = self.sprites[sprite][3], self.sprites[sprite][4]
-            data = self.sprites[sprite][2]
-            fbuf = framebuf.FrameBuffer(data, width, height, framebuf.MONO_HLSB)
-            self.disp.blit(fbuf, x, y)
-        self.disp.show()    
-        self.frame_tmr.init(period=self.frame_cl, mode=Timer.PERIODIC, callback=self._frame_update)
-        self.game_tmr.init(period=self.game_cl, mode=Timer.PERIODIC, callback=self._game_update)
-        self.env_tmr.init(period=self.env_cl, mode=Timer.PERIODIC, callback=self._env_update)
-    
-    def end(self):
-        self.frame_tmr.deinit()
-        self.game_tmr.deinit()
-        self.env_tmr.deinit()
+    async def run(self):
+        # Runs until end(), alongside any other coroutines on core 0
+        self.scene.invalidate()
+        self.scene.render()
+        self.disp.show()
+        self.sched.add('frame', self._frame_update, self.frame_cl, priority=2, budget=self.frame_cl * 500)
+        self.logic.add('game', self._game_update, self.game_cl, priority=1)
+        self.logic.add('env', self._env_update, self.env_cl, priority=0)
+        await self.runtime.run()
+        self.sched.remove('frame')
+        self.logic.remove('game')
+        self.logic.remove('env')
         self.disp.fill(0)
         self.disp.show()
+
+    def begin(self):
+        # Blocks until end()
+        asyncio.run(self.run())
+
+    def end(self):
+        self.runtime.stop()
     
+NO_EVENT = const(0xff)
+
 class SimpleDynamicSprite_CycleOnly:
     def __init__(self, frames, seq_timer):
         self._validate(frames, seq_timer)
@@ -124,6 +229,32 @@ class SimpleDynamicSprite_CycleOnly:
         self.height = frames[0][0][1]
         self.length = len(frames)
         self.seq_timer = [max(sum(seq_timer[:i])- 1, 0) for i in range(1, len(seq_timer)+1)]
+        self._compile()
+
+    def _compile(self):
+        # Lookup tables over one period of seq_counter values (0 to seq_timer[-1]):
+        #   events[c]: frame get_next_frame(c) returns, NO_EVENT for None
+        #   shown[c]: frame on screen after counter c
+        #   wait[c]: ticks from counter c to the next counter that changes the frame
+        self.period = self.seq_timer[-1] + 1
+        self.events = bytearray([NO_EVENT] * self.period)
+        # Filled in reverse precedence, a 1 tick first frame shares counter 0
+        self.events[-1] = 0
+        for i in range(len(self.seq_timer) - 2, -1, -1):
+            self.events[self.seq_timer[i]] = i + 1
+        self.events[0] = 0
+        self.shown = bytearray(self.period)
+        frame = 0
+        for counter in range(self.period):
+            if self.events[counter] != NO_EVENT:
+                frame = self.events[counter]
+            self.shown[counter] = frame
+        self.wait = array('H', [0] * self.period)
+        for counter in range(self.period):
+            step = 1
+            while step < self.period and self.shown[(counter + step) % self.period] == self.shown[counter]:
+                step += 1
+            self.wait[counter] = step
 
     def _validate(self, frames, seq_timer):
         # check same dim, frames and seq_timer same length, seq_timer > 0
@@ -133,22 +264,27 @@ class SimpleDynamicSprite_CycleOnly:
             raise ValueError("Frame and seq_timer mismatch")
         if not all([i > 0 for i in seq_timer]):
             raise ValueError("Invalid seq_timer")
+        if len(frames) >= NO_EVENT:
+            raise ValueError("Too many frames")
 
     def get_next_frame(self, seq_counter):
         '''return format (update_flag, frame, reset_flag)
         frame: the frame to be displayed, None if not updating
         reset_flag: True if the frame is the last frame, false if not
         '''
-        if seq_counter < 0 or seq_counter > self.seq_timer[-1]:
+        if seq_counter < 0 or seq_counter >= self.period:
             raise ValueError("Invalid seq_counter")
-        if seq_counter == 0:
-            return self.frames[0], False
-        elif seq_counter in self.seq_timer[:-1]:
-            idx = self.seq_timer.index(seq_counter)
-            return self.frames[idx + 1], False
-        if seq_counter == self.seq_timer[-1]:
-            return self.frames[0], True
-        return None, False
+        idx = self.events[seq_counter]
+        reset_flag = seq_counter == self.period - 1
+        if idx == NO_EVENT:
+            return None, reset_flag
+        return self.frames[idx], reset_flag
+
+    def next_change(self, seq_counter, frame_idx):
+        '''ticks until the frame differs from frame_idx, counting seq_counter as the next tick (0)'''
+        if self.shown[seq_counter] != frame_idx:
+            return 0
+        return self.wait[seq_counter]
     
     def force_retrieve(self, frame_idx):
         '''return format (seq_counter, frame, reset_flag)
@@ -1,4 +1,4 @@
 # Functions to implement
-# Better text font
+# Better text font (done: lib/font.py, fonts compiled by host/font_compile.py)
 # Show objects
 
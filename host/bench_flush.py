@@ -0,0 +1,56 @@
+# Compares SSD1306 flush strategies on the emulated bus
+# Runs main.py's clock face for a simulated hour of ticks with
+#   full   - every frame resent (what show() did before dirty tracking)
+#   dirty  - fill(0) + redraw, dirty tracking only
+#   shadow - fill(0) + redraw, shadow-buffer diff
+#
+#   PYTHONPATH=host:lib python host/bench_flush.py
+
+import time
+
+import compat
+import ssd1306
+from ssd1306_emu import EmulatedI2C, SSD1306Device
+
+TICKS = 3600
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def draw_face(oled, tick):
+    # Same layout as updateFace() in main.py
+    hour, minute, second = 12 + tick // 3600, (tick // 60) % 60, tick % 60
+    oled.fill(0)
+    oled.text(str(hour), 0, 0)
+    oled.text(str(minute), 20, 0)
+    oled.text(str(second), 40, 0)
+    oled.text(str(18), 0, 12)
+    oled.text(MONTHS[9], 20, 12)
+    oled.text(str(2026), 55, 12)
+    oled.text(str(41.5 + (tick // 10) % 3), 0, 33)
+    oled.text("%", 45, 33)
+    oled.text(str(22.25), 70, 33)
+    oled.text("C", 115, 33)
+    oled.text(str(30000 + (tick // 2) % 7), 0, 45)
+    oled.text("L", 45, 45)
+
+
+def run(mode):
+    i2c = EmulatedI2C(freq=400000)
+    panel = i2c.attach(SSD1306Device())
+    oled = ssd1306.SSD1306_I2C(128, 64, i2c, shadow=mode == 'shadow')
+    i2c.reset_stats()
+    start = time.perf_counter()
+    for tick in range(TICKS):
+        draw_face(oled, tick)
+        if mode == 'full':
+            oled.invalidate()
+        oled.show()
+    elapsed = time.perf_counter() - start
+    stats = i2c.stats
+    print("%-6s %7.1f B/frame %5.2f txn/frame %6.2f ms bus/frame   host %6.0f fps" % (
+        mode, stats['bytes'] / TICKS, stats['transactions'] / TICKS,
+        stats['bus_us'] / TICKS / 1000, TICKS / elapsed))
+
+
+for mode in ('full', 'dirty', 'shadow'):
+    run(mode)
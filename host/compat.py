@@ -0,0 +1,23 @@
+# MicroPython builtins that lib/ code relies on but CPython lacks.
+# Imported by the host modules, so they are in place before `import ssd1306`.
+
+import builtins
+import time
+
+if not hasattr(builtins, 'const'):
+    builtins.const = lambda x: x
+
+if not hasattr(time, 'ticks_ms'):
+    time.sleep_ms = lambda ms: time.sleep(ms / 1000)
+    time.sleep_us = lambda us: time.sleep(us / 1000000)
+    time.ticks_ms = lambda: time.monotonic_ns() // 1000000
+    time.ticks_us = lambda: time.monotonic_ns() // 1000
+    time.ticks_add = lambda t, delta: t + delta
+    time.ticks_diff = lambda a, b: a - b
+
+try:
+    import asyncio
+    if not hasattr(asyncio, 'sleep_ms'):
+        asyncio.sleep_ms = lambda ms: asyncio.sleep(ms / 1000)
+except ImportError:
+    pass
@@ -0,0 +1,204 @@
+# Compiles a BDF bitmap font into a module for lib/font.py
+#
+# Every glyph becomes a MONO_VLSB strip as tall as the font (ascent +
+# descent, padded to whole pages) and as wide as its ink, so drawing a glyph
+# is one framebuf blit. The strips are packed into one bytes object and an
+# index holds, per character, the strip's offset and width, its x offset from
+# the pen position and the advance. Kerning pairs are derived from the
+# bitmaps: a pair is pulled together until its closest rows are as close as
+# in the reference pair (default "nn"), at most --max-kern pixels. To keep
+# the table small only pairs of --kern-chars (letters, digits and .,) that
+# move by at least --min-kern pixels are kept.
+#
+#   python host/font_compile.py font.bdf assets/font_name.py
+#   python host/font_compile.py font.bdf out.py --chars 32-126 --max-kern 3
+#
+# The output is plain Python, copy it to the board next to lib/font.py.
+
+import argparse
+import string
+
+
+def parse_bdf(path):
+    # Returns (ascent, descent, glyphs, notes) with glyphs[code] = (dwidth,
+    # bbx, rows), bbx = (w, h, xoff, yoff) and rows = list of ints, MSB
+    # leftmost. notes are the FONT name and COPYRIGHT to carry over, plus the
+    # SPDX lines of a REUSE style path + '.license' file when there is one.
+    ascent = descent = None
+    notes = []
+    glyphs = {}
+    with open(path, encoding='latin-1') as f:
+        lines = iter(f.read().splitlines())
+    for line in lines:
+        words = line.split()
+        if not words:
+            continue
+        if words[0] == 'FONT_ASCENT':
+            ascent = int(words[1])
+        elif words[0] == 'FONT_DESCENT':
+            descent = int(words[1])
+        elif words[0] in ('FONT', 'COPYRIGHT', 'NOTICE'):
+            notes.append(line.strip())
+        elif words[0] == 'STARTCHAR':
+            code = dwidth = bbx = None
+            rows = []
+            for line in lines:
+                words = line.split()
+                if not words:
+                    continue
+                if words[0] == 'ENCODING':
+                    code = int(words[-1])
+                elif words[0] == 'DWIDTH':
+                    dwidth = int(words[1])
+                elif words[0] == 'BBX':
+                    bbx = tuple(int(v) for v in words[1:5])
+                elif words[0] == 'BITMAP':
+                    for line in lines:
+                        if line.strip() == 'ENDCHAR':
+                            break
+                        # Rows are padded to whole bytes on the right
+                        line = line.strip()
+                        rows.append(int(line, 16) >> max(len(line) * 4 - bbx[0], 0))
+                    break
+            if code is not None and code >= 0 and bbx is not None:
+                glyphs[code] = (dwidth if dwidth is not None else bbx[0], bbx, rows)
+    if ascent is None or descent is None:
+        raise ValueError("BDF has no FONT_ASCENT/FONT_DESCENT")
+    try:
+        with open(path + '.license', encoding='utf-8') as f:
+            notes += [line.lstrip('# ').strip() for line in f if 'SPDX-' in line]
+    except OSError:
+        pass
+    return ascent, descent, glyphs, notes
+
+
+def ink(glyph, ascent, height):
+    # Set pixels of a glyph as {(x, y)}, x from the pen position, y from the cell top
+    dwidth, (w, h, xoff, yoff), rows = glyph
+    top = ascent - yoff - h
+    pixels = set()
+    for r, bits in enumerate(rows):
+        y = top + r
+        if not 0 <= y < height:
+            continue
+        for c in range(w):
+            if bits & (1 << (w - 1 - c)):
+                pixels.add((xoff + c, y))
+    return pixels
+
+
+def strip(pixels, pages):
+    # VLSB strip over the ink's columns: (x0, width, data)
+    if not pixels:
+        return 0, 0, b''
+    x0 = min(x for x, y in pixels)
+    width = max(x for x, y in pixels) - x0 + 1
+    data = bytearray(width * pages)
+    for x, y in pixels:
+        data[(y >> 3) * width + x - x0] |= 1 << (y & 7)
+    return x0, width, bytes(data)
+
+
+def profile(pixels, height, right):
+    # Per row the rightmost (or leftmost) ink column, None where the row is empty
+    edge = [None] * height
+    for x, y in pixels:
+        if edge[y] is None or (x > edge[y] if right else x < edge[y]):
+            edge[y] = x
+    return edge
+
+
+def gap(advance, right_edge, left_edge):
+    # Narrowest horizontal gap between two glyphs set side by side, counting
+    # the rows next to each other too so diagonals don't touch. None if no
+    # rows are close.
+    best = None
+    for y, r in enumerate(right_edge):
+        if r is None:
+            continue
+        for ny in (y - 1, y, y + 1):
+            if 0 <= ny < len(left_edge) and left_edge[ny] is not None:
+                g = advance + left_edge[ny] - r - 1
+                if best is None or g < best:
+                    best = g
+    return best
+
+
+def compile_font(path, first, last, max_kern, min_kern, reference, kern_chars):
+    ascent, descent, glyphs, notes = parse_bdf(path)
+    height = ascent + descent
+    pages = (height + 7) // 8
+    blank = (glyphs.get(32, (height // 3, (0, 0, 0, 0), []))[0], (0, 0, 0, 0), [])
+
+    index = bytearray()
+    bitmap = bytearray()
+    pixels = {}
+    advances = {}
+    for code in range(first, last + 1):
+        glyph = glyphs.get(code, blank)
+        pixels[code] = ink(glyph, ascent, height)
+        advances[code] = glyph[0]
+        x0, width, data = strip(pixels[code], pages)
+        offset = len(bitmap)
+        if offset > 0xffff or width > 0xff or glyph[0] > 0xff:
+            raise ValueError("Font too large for the 16 bit index")
+        index += bytes((offset & 0xff, offset >> 8, width, x0 & 0xff, glyph[0]))
+        bitmap += data
+
+    kern = {}
+    if max_kern:
+        kerned = set(ord(c) for c in kern_chars)
+        right = {c: profile(p, height, True) for c, p in pixels.items() if p and c in kerned}
+        left = {c: profile(p, height, False) for c, p in pixels.items() if p and c in kerned}
+        a, b = ord(reference[0]), ord(reference[1])
+        target = gap(advances[a], right[a], left[b])
+        for a in right:
+            for b in left:
+                g = gap(advances[a], right[a], left[b])
+                tighten = min(max_kern, (g if g is not None else max_kern + target) - target)
+                if tighten >= min_kern:
+                    kern[a << 8 | b] = -tighten
+    return height, ascent, pages, bytes(index), bytes(bitmap), kern, notes
+
+
+def dump_bytes(data, per_line=32):
+    lines = []
+    for i in range(0, len(data), per_line):
+        lines.append("    b'%s'" % ''.join('\\x%02x' % v for v in data[i:i + per_line]))
+    return '(\n%s)' % '\n'.join(lines) if lines else "b''"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('bdf')
+    parser.add_argument('out')
+    parser.add_argument('--chars', default='32-126', help="character code range, e.g. 32-126")
+    parser.add_argument('--max-kern', type=int, default=2)
+    parser.add_argument('--min-kern', type=int, default=2)
+    parser.add_argument('--reference', default='nn', help="pair whose spacing the kerning aims for")
+    parser.add_argument('--kern-chars', default=string.ascii_letters + string.digits + '.,')
+    args = parser.parse_args()
+    first, last = (int(v) for v in args.chars.split('-'))
+
+    height, ascent, pages, index, bitmap, kern, notes = compile_font(
+        args.bdf, first, last, args.max_kern, args.min_kern, args.reference, args.kern_chars)
+    with open(args.out, 'w') as f:
+        f.write("# Generated by host/font_compile.py from %s, do not edit\n" % args.bdf.replace('\\', '/').split('/')[-1])
+        for note in notes:
+            f.write("# %s\n" % note)
+        f.write("# Index: 5 bytes per character from first to last, strip offset (LE),\n")
+        f.write("# strip width, x offset (signed) and advance. Strips are MONO_VLSB,\n")
+        f.write("# pages * 8 rows tall.\n\n")
+        f.write("height = %d\nbaseline = %d\npages = %d\nfirst = %d\nlast = %d\n\n" % (height, ascent, pages, first, last))
+        f.write("index = %s\n\n" % dump_bytes(index, 30))
+        f.write("bitmap = %s\n\n" % dump_bytes(bitmap))
+        f.write("kern = {\n")
+        for pair in sorted(kern):
+            f.write("    0x%04x: %d,  # %r\n" % (pair, kern[pair], chr(pair >> 8) + chr(pair & 0xff)))
+        f.write("}\n")
+    print("%s: %d glyphs, %d px tall, %d bytes of strips, %d kerning pairs" % (
+        args.out, last - first + 1, height, len(bitmap), len(kern)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,273 @@
+# Host (CPython) stand-in for MicroPython's framebuf module, backed by NumPy.
+# Put the host/ folder at the front of sys.path to run device code on a PC.
+#
+# The pixels live in the caller's buffer exactly as on the device, so drivers
+# that send `self.buffer` over the bus (lib/ssd1306.py) see the same bytes.
+# Every operation unpacks only the affected bytes into a 0/1 array, works on
+# that array in one vectorized step and packs it back.
+
+import numpy as np
+
+MONO_VLSB = 0
+RGB565 = 1
+GS4_HMSB = 2
+MONO_HLSB = 3
+MONO_HMSB = 4
+GS2_HMSB = 5
+GS8 = 6
+MVLSB = MONO_VLSB
+
+# Glyphs for chr(32)..chr(127), 5 columns each, LSB at the top.
+# Taken from font5x8.bin in Adafruit's adafruit_circuitpython_framebuf. The
+# device uses the petme128 8x8 font, so glyph shapes differ slightly but
+# every character still occupies an 8x8 cell like framebuf.text() on the
+# board. The glyph data is under the MIT licence:
+#
+#   Copyright (c) 2021 ladyada for Adafruit Industries
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the
+#   "Software"), to deal in the Software without restriction, including
+#   without limitation the rights to use, copy, modify, merge, publish,
+#   distribute, sublicense, and/or sell copies of the Software, and to
+#   permit persons to whom the Software is furnished to do so, subject to
+#   the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included
+#   in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+#   OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+#   MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+#   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+#   CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+#   TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+#   SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+_FONT = bytes.fromhex(
+    '000000000000005f00000007000700147f147f14242a7f2a12231308646236495620500008070300'
+    '001c2241000041221c002a1c7f1c2a08083e08080080703000080808080800006060002010080402'
+    '3e5149453e00427f400072494949462141494d331814127f1027454545393c4a4949314121110907'
+    '3649494936464949291e000014000000403400000008142241141414141400412214080201590906'
+    '3e415d594e7c1211127c7f494949363e414141227f4141413e7f494949417f090909013e41415173'
+    '7f0808087f00417f41002040413f017f081422417f404040407f021c027f7f0408107f3e4141413e'
+    '7f090909063e4151215e7f09192946264949493203017f01033f4040403f1f2040201f3f4038403f'
+    '631408146303047804036159494d43007f4141410204081020004141417f04020102044040404040'
+    '000307080020545478407f284444383844444428384444287f385454541800087e090218a4a49c78'
+    '7f0804047800447d40002040403d007f1028440000417f40007c047804787c080404783844444438'
+    'fc1824241818242418fc7c08040408485454542404043f44243c4040207c1c2040201c3c4030403c'
+    '44281028444c9090907c4464544c4400083641000000770000004136080002010204023c2623263c'
+)
+_GLYPHS = None
+
+
+def _glyph_bits():
+    # (96, 8, 8) array of rows x columns, built on first use of text()
+    global _GLYPHS
+    if _GLYPHS is None:
+        cols = np.frombuffer(_FONT, dtype=np.uint8).reshape(96, 5)
+        bits = np.unpackbits(cols[:, :, None], axis=2, bitorder='little')
+        _GLYPHS = np.zeros((96, 8, 8), dtype=np.uint8)
+        _GLYPHS[:, :, 1:6] = bits.transpose(0, 2, 1)
+    return _GLYPHS
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        if format not in (MONO_VLSB, MONO_HLSB, MONO_HMSB):
+            raise ValueError('invalid format')
+        if stride is None:
+            stride = width
+        self.width = width
+        self.height = height
+        self.format = format
+        self.stride = stride
+        raw = np.frombuffer(buffer, dtype=np.uint8)
+        if format == MONO_VLSB:
+            rows, cols = (height + 7) // 8, stride
+        else:
+            rows, cols = height, (stride + 7) // 8
+        if raw.size < rows * cols:
+            raise ValueError('buffer too small')
+        # 2D byte view over the caller's buffer: (pages, columns) for VLSB,
+        # (rows, bytes per row) for the horizontal formats.
+        self._view = raw[:rows * cols].reshape(rows, cols)
+        self._order = 'big' if format == MONO_HLSB else 'little'
+
+    # --- bit level access -------------------------------------------------
+
+    def _clip(self, x, y, w, h):
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, self.width), min(y + h, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return x0, y0, x1, y1
+
+    def _get(self, x0, y0, x1, y1):
+        # Returns (block, bits, r0, c0): bits[r0:r0+h, c0:c0+w] is the region
+        if self.format == MONO_VLSB:
+            p0, p1 = y0 >> 3, (y1 - 1) >> 3
+            block = self._view[p0:p1 + 1, x0:x1]
+            bits = np.unpackbits(block[:, :, None], axis=2, bitorder='little')
+            bits = bits.transpose(0, 2, 1).reshape(-1, x1 - x0)
+            return (p0, p1), bits, y0 - (p0 << 3), 0
+        b0, b1 = x0 >> 3, (x1 - 1) >> 3
+        block = self._view[y0:y1, b0:b1 + 1]
+        bits = np.unpackbits(block, axis=1, bitorder=self._order)
+        return (b0, b1), bits, 0, x0 - (b0 << 3)
+
+    def _put(self, x0, y0, x1, y1, span, bits):
+        if self.format == MONO_VLSB:
+            p0, p1 = span
+            packed = bits.reshape(p1 - p0 + 1, 8, x1 - x0).transpose(0, 2, 1)
+            self._view[p0:p1 + 1, x0:x1] = np.packbits(packed, axis=2, bitorder='little')[:, :, 0]
+        else:
+            b0, b1 = span
+            self._view[y0:y1, b0:b1 + 1] = np.packbits(bits, axis=1, bitorder=self._order)
+
+    def _region(self):
+        # 0/1 array of the whole frame, as a copy
+        span, bits, r0, c0 = self._get(0, 0, self.width, self.height)
+        return bits[r0:r0 + self.height, c0:c0 + self.width].copy()
+
+    def _apply(self, x, y, w, h, func):
+        # func(region) edits an (h, w) 0/1 array in place
+        clip = self._clip(x, y, w, h)
+        if clip is None:
+            return
+        x0, y0, x1, y1 = clip
+        span, bits, r0, c0 = self._get(x0, y0, x1, y1)
+        func(bits[r0:r0 + y1 - y0, c0:c0 + x1 - x0], x0 - x, y0 - y)
+        self._put(x0, y0, x1, y1, span, bits)
+
+    # --- drawing ------------------------------------------------------------
+
+    def fill(self, c):
+        # Whole bytes can be set directly when no byte is shared with padding
+        if self.format == MONO_VLSB and not self.height & 7:
+            self._view[:, :self.width] = 0xff if c & 1 else 0
+        elif self.format != MONO_VLSB and not self.width & 7:
+            self._view[:, :self.width >> 3] = 0xff if c & 1 else 0
+        else:
+            self.fill_rect(0, 0, self.width, self.height, c)
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        if self.format == MONO_VLSB:
+            idx, bit = (y >> 3, x), 1 << (y & 7)
+        elif self.format == MONO_HLSB:
+            idx, bit = (y, x >> 3), 0x80 >> (x & 7)
+        else:
+            idx, bit = (y, x >> 3), 1 << (x & 7)
+        if c is None:
+            return 1 if self._view[idx] & bit else 0
+        if c & 1:
+            self._view[idx] |= bit
+        else:
+            self._view[idx] &= ~bit & 0xff
+        return None
+
+    def fill_rect(self, x, y, w, h, c):
+        def paint(region, ox, oy):
+            region[:] = c & 1
+        self._apply(x, y, w, h, paint)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        # Same Bresenham walk as extmod/modframebuf.c so end points match
+        dx, sx = (x2 - x1, 1) if x2 > x1 else (x1 - x2, -1)
+        dy, sy = (y2 - y1, 1) if y2 > y1 else (y1 - y2, -1)
+        steep = dy > dx
+        if steep:
+            x1, y1, dx, dy, sx, sy = y1, x1, dy, dx, sy, sx
+        xs, ys = [], []
+        e = 2 * dy - dx
+        for _ in range(dx):
+            if steep:
+                xs.append(y1)
+                ys.append(x1)
+            else:
+                xs.append(x1)
+                ys.append(y1)
+            while e >= 0:
+                y1 += sy
+                e -= 2 * dx
+            x1 += sx
+            e += 2 * dy
+        xs.append(x2)
+        ys.append(y2)
+        self._points(np.array(xs), np.array(ys), c)
+
+    def _points(self, xs, ys, c):
+        keep = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        if not keep.any():
+            return
+        xs, ys = xs[keep], ys[keep]
+        x0, y0 = int(xs.min()), int(ys.min())
+
+        def paint(region, ox, oy):
+            region[ys - y0, xs - x0] = c & 1
+        self._apply(x0, y0, int(xs.max()) + 1 - x0, int(ys.max()) + 1 - y0, paint)
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        if isinstance(fbuf, tuple):
+            fbuf = FrameBuffer(*fbuf)
+        src = fbuf._region()
+        if palette is not None:
+            src = np.array([palette.pixel(0, 0), palette.pixel(1, 0)], dtype=np.uint8)[src]
+
+        def paint(region, ox, oy):
+            part = src[oy:oy + region.shape[0], ox:ox + region.shape[1]]
+            if key == -1:
+                region[:] = part
+            else:
+                mask = part != key
+                region[mask] = part[mask]
+        self._apply(x, y, fbuf.width, fbuf.height, paint)
+
+    def scroll(self, xstep, ystep):
+        # Like the device, the uncovered strip keeps its old pixels
+        frame = self._region()
+        moved = frame.copy()
+        h, w = frame.shape
+        if abs(xstep) >= w or abs(ystep) >= h:
+            return
+        dst_y = slice(max(ystep, 0), h + min(ystep, 0))
+        src_y = slice(max(-ystep, 0), h + min(-ystep, 0))
+        dst_x = slice(max(xstep, 0), w + min(xstep, 0))
+        src_x = slice(max(-xstep, 0), w + min(-xstep, 0))
+        moved[dst_y, dst_x] = frame[src_y, src_x]
+
+        def paint(region, ox, oy):
+            region[:] = moved
+        self._apply(0, 0, w, h, paint)
+
+    def text(self, s, x, y, c=1):
+        if not s:
+            return
+        codes = np.frombuffer(s.encode('latin-1', 'replace'), dtype=np.uint8).astype(np.int16)
+        codes[(codes < 32) | (codes > 127)] = 127
+        strip = _glyph_bits()[codes - 32].transpose(1, 0, 2).reshape(8, -1)
+
+        def paint(region, ox, oy):
+            part = strip[oy:oy + region.shape[0], ox:ox + region.shape[1]]
+            region[part == 1] = c & 1
+        self._apply(x, y, strip.shape[1], 8, paint)
+
+
+def FrameBuffer1(buffer, width, height, stride=None):
+    return FrameBuffer(buffer, width, height, MONO_VLSB, stride)
@@ -0,0 +1,117 @@
+# Pre-renders an analog clock face into a hand pack for lib/handpack.py
+#
+# Drawing three hands with lib/raster.py every second means trig lookups and
+# polygon fills on the board. This tool draws them all once on the desktop:
+# 720 hour hand positions (one per minute of a 12 hour turn), 60 minute and
+# 60 second positions, plus the empty dial. Each hand is cropped to the
+# columns it inks and the pages it touches, so its bytes are a slice of a
+# MONO_VLSB image of the dial, and everything is written to one binary file
+# that stays on the board's flash. Rendering a second is then a dial copy
+# and three blits.
+#
+# The hands are drawn with raster.hand at the same whole degree angles
+# mini_projects/analog_face.py uses, the hour hand at (hour % 12) * 30 +
+# minute // 2, so a face from the pack matches the live one.
+#
+#   PYTHONPATH=host:lib python host/hands_compile.py                  # assets/clock_hands.bin
+#   PYTHONPATH=host:lib python host/hands_compile.py out.bin --size 48 --ticks 60
+#
+# Layout, little-endian:
+#
+#   header  16 bytes  b'HAND', width, height, cx, cy, hour, minute and
+#                     second counts (u16), largest hand in bytes (u16)
+#   dial    width * pages bytes, MONO_VLSB
+#   index   8 bytes per hand, hours then minutes then seconds: data offset
+#           (u32, from the start of the file), x, first page, width, pages
+#   data    the hand strips, MONO_VLSB
+
+import argparse
+import struct
+
+import compat  # noqa: F401, const() for lib/
+import framebuf
+import raster
+
+MAGIC = b'HAND'
+HEADER = '<4sBBBBHHHH'
+ENTRY = '<IBBBB'
+
+
+def crop(data, w, pages):
+    # Smallest (x, page, width, pages) holding every set byte, None when empty
+    cols = [x for x in range(w) if any(data[p * w + x] for p in range(pages))]
+    rows = [p for p in range(pages) if any(data[p * w:(p + 1) * w])]
+    if not cols:
+        return None
+    return cols[0], rows[0], cols[-1] - cols[0] + 1, rows[-1] - rows[0] + 1
+
+
+def strip(data, w, box):
+    x, page, cw, cp = box
+    out = bytearray()
+    for p in range(page, page + cp):
+        out += data[p * w + x:p * w + x + cw]
+    return out
+
+
+def render(size, hands, ticks, tick_len):
+    # Returns (dial bytes, [(box, strip bytes) per hand position])
+    w = h = size
+    pages = (h + 7) // 8
+    cx = cy = size // 2
+    r = size // 2 - 1
+    buf = bytearray(w * pages)
+    fb = framebuf.FrameBuffer(buf, w, h, framebuf.MONO_VLSB)
+    raster.circle(fb, cx, cy, r)
+    raster.ticks(fb, cx, cy, r, ticks, tick_len)
+    dial = bytes(buf)
+    out = []
+    for count, length, width, tail, cap in hands:
+        for i in range(count):
+            fb.fill(0)
+            # Whole degrees: i // 2 for the 720 hour positions, i * 6 for 60
+            raster.hand(fb, cx, cy, length, i * 360 // count, width, tail)
+            if cap:
+                raster.circle(fb, cx, cy, cap, fill=True)
+            box = crop(buf, w, pages)
+            out.append((box, strip(buf, w, box)))
+    return dial, out
+
+
+def pack(size, dial, hands, counts):
+    cx = cy = size // 2
+    largest = max(len(data) for box, data in hands)
+    head = struct.pack(HEADER, MAGIC, size, size, cx, cy, *counts, largest)
+    offset = len(head) + len(dial) + struct.calcsize(ENTRY) * len(hands)
+    index = bytearray()
+    data = bytearray()
+    for (x, page, cw, cp), strip_ in hands:
+        index += struct.pack(ENTRY, offset + len(data), x, page, cw, cp)
+        data += strip_
+    return head + dial + index + data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('out', nargs='?', default='assets/clock_hands.bin')
+    parser.add_argument('--size', type=int, default=64, help="dial width and height in pixels")
+    parser.add_argument('--ticks', type=int, default=12)
+    parser.add_argument('--tick-length', type=int, default=4)
+    args = parser.parse_args()
+    s = args.size
+    # (positions, length, width, tail, centre cap), lengths as in mini_projects/analog_face.py at 64 px
+    hands = [
+        (720, s // 4, 3, 0, 0),
+        (60, s * 25 // 64, 2, 0, 0),
+        (60, s * 7 // 16, 1, s * 3 // 32, 2),
+    ]
+    dial, rendered = render(s, hands, args.ticks, args.tick_length)
+    data = pack(s, dial, rendered, [h[0] for h in hands])
+    with open(args.out, 'wb') as f:
+        f.write(data)
+    print("%s: %d hands, %d byte dial, %d bytes in all, largest hand %d bytes" % (
+        args.out, len(rendered), len(dial), len(data), max(len(d) for b, d in rendered)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,24 @@
+# Host (CPython) stand-in for MicroPython's micropython module.
+# The code emitter decorators run the function as plain Python here.
+
+import compat  # noqa: F401, const() as a builtin too
+
+
+def const(x):
+    return x
+
+
+def native(f):
+    return f
+
+
+def viper(f):
+    return f
+
+
+def mem_info(*args):
+    pass
+
+
+def opt_level(*args):
+    return 0
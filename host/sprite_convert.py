@@ -0,0 +1,112 @@
+# Converts sprite editor sprites (MONO_HLSB) to MONO_VLSB, the SSD1306 layout
+#
+# In MONO_VLSB a sprite is stored page by page: each byte is 8 vertical
+# pixels, LSB on top, and a page is one byte per column. That is exactly the
+# layout of the display buffer, so a sprite drawn at a y that is a multiple of
+# 8 can be copied into it a page at a time (SSD1306_I2C.blit_vlsb) instead of
+# pixel by pixel. Heights are padded up to a whole page with zero rows.
+#
+#   python host/sprite_convert.py                           # assets/env.py -> assets/env_vlsb.py
+#   python host/sprite_convert.py in.py out.py
+#   python host/sprite_convert.py --masks                   # assets/env.py -> assets/env_masked.py
+#
+# With --masks every sprite also gets a mask plane for lib/masked.py: its
+# filled silhouette, every pixel not reachable from the border through
+# unset pixels. Written as ((w, h), image, mask).
+
+import sys
+
+
+def hlsb_to_vlsb(data, w, h):
+    # data: rows of ceil(w / 8) bytes, MSB leftmost
+    stride = (w + 7) // 8
+    pages = (h + 7) // 8
+    out = bytearray(w * pages)
+    for y in range(h):
+        row = y * stride
+        bit = 1 << (y & 7)
+        base = (y >> 3) * w
+        for x in range(w):
+            if data[row + (x >> 3)] & (0x80 >> (x & 7)):
+                out[base + x] |= bit
+    return out
+
+
+def vlsb_to_hlsb(data, w, h):
+    # Inverse of hlsb_to_vlsb, for checking a conversion round trips
+    stride = (w + 7) // 8
+    out = bytearray(stride * h)
+    for y in range(h):
+        base = (y >> 3) * w
+        bit = 1 << (y & 7)
+        for x in range(w):
+            if data[base + x] & bit:
+                out[y * stride + (x >> 3)] |= 0x80 >> (x & 7)
+    return out
+
+
+def load(path):
+    # Sprites of a module in the editor's ((w, h), bytearray) format, in file order
+    scope = {}
+    with open(path) as f:
+        exec(f.read(), scope)
+    return [(name, value) for name, value in scope.items()
+            if isinstance(value, tuple) and len(value) == 2
+            and isinstance(value[0], tuple) and isinstance(value[1], (bytes, bytearray))]
+
+
+def silhouette(data, w, h):
+    # HLSB mask of the pixels not reachable from outside through unset ones
+    stride = (w + 7) // 8
+
+    def lit(x, y):
+        return data[y * stride + (x >> 3)] & (0x80 >> (x & 7))
+
+    outside = set()
+    todo = [(x, y) for x in range(w) for y in (0, h - 1)] + [(x, y) for y in range(h) for x in (0, w - 1)]
+    while todo:
+        x, y = todo.pop()
+        if (x, y) in outside or not (0 <= x < w and 0 <= y < h) or lit(x, y):
+            continue
+        outside.add((x, y))
+        todo += [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
+    mask = bytearray(stride * h)
+    for y in range(h):
+        for x in range(w):
+            if (x, y) not in outside:
+                mask[y * stride + (x >> 3)] |= 0x80 >> (x & 7)
+    return mask
+
+
+def _lines(w, data):
+    return ',\n'.join(', '.join('0x%02x' % b for b in data[p * w:(p + 1) * w])
+                      for p in range(len(data) // w))
+
+
+def dump(name, w, h, data, mask=None):
+    if mask is None:
+        return '%s = ((%d, %d),\nbytearray([\n%s]))\n' % (name, w, h, _lines(w, data))
+    return '%s = ((%d, %d),\nbytearray([\n%s]),\nbytearray([\n%s]))\n' % (
+        name, w, h, _lines(w, data), _lines(w, mask))
+
+
+def convert(src, dst, masks=False):
+    out = ['# MONO_VLSB copy of %s, generated by host/sprite_convert.py%s\n'
+           '# One line per 8 pixel page, one byte per column. Do not edit.\n'
+           % (src, ' --masks' if masks else '')]
+    for name, ((w, h), data) in load(src):
+        vlsb = hlsb_to_vlsb(data, w, h)
+        assert vlsb_to_hlsb(vlsb, w, h) == bytearray(data), name
+        mask = hlsb_to_vlsb(silhouette(data, w, h), w, h) if masks else None
+        out.append(dump(name, w, h, vlsb, mask))
+    with open(dst, 'w') as f:
+        f.write('\n'.join(out))
+    return len(out) - 1
+
+
+if __name__ == '__main__':
+    args = [a for a in sys.argv[1:] if a != '--masks']
+    masks = len(args) != len(sys.argv) - 1
+    src = args[0] if args else 'assets/env.py'
+    dst = args[1] if len(args) > 1 else ('assets/env_masked.py' if masks else 'assets/env_vlsb.py')
+    print("%d sprites written to %s" % (convert(src, dst, masks), dst))
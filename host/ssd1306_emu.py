@@ -0,0 +1,304 @@
+# Host-side SSD1306 stand-in for benchmarking the display code without a panel.
+#
+# EmulatedI2C looks like machine.I2C to lib/ssd1306.py (writeto, writevto,
+# readfrom, scan). Every transaction is decoded the way the controller does it:
+# control bytes (Co, D/C#), multi-byte commands split across transactions,
+# page/horizontal/vertical addressing with column and page windows, segment
+# remap, COM scan direction, start line, display offset and the scroll unit.
+# GDDRAM is kept as 8 pages x 128 columns, like the chip.
+#
+# The bus side counts transactions, bytes and the time they would take at the
+# bus frequency, so flush strategies can be compared on a PC:
+#
+#   i2c = EmulatedI2C(freq=400000)
+#   panel = i2c.attach(SSD1306Device())
+#   oled = ssd1306.SSD1306_I2C(128, 64, i2c)
+#   i2c.reset_stats(); oled.show(); print(i2c.stats)
+
+import errno
+
+import compat
+
+_PARAMS = {
+    0x81: 1,  # contrast
+    0x20: 1,  # memory addressing mode
+    0x21: 2,  # column window
+    0x22: 2,  # page window
+    0xa8: 1,  # multiplex ratio
+    0xd3: 1,  # display offset
+    0xda: 1,  # COM pins configuration
+    0xd5: 1,  # clock divide
+    0xd9: 1,  # pre-charge period
+    0xdb: 1,  # VCOMH deselect level
+    0x8d: 1,  # charge pump
+    0x26: 6,  # right horizontal scroll
+    0x27: 6,  # left horizontal scroll
+    0x29: 5,  # vertical and right horizontal scroll
+    0x2a: 5,  # vertical and left horizontal scroll
+    0xa3: 2,  # vertical scroll area
+}
+
+# Scroll step interval (in frames) for the 3-bit interval field
+_SCROLL_FRAMES = (5, 64, 128, 256, 3, 4, 25, 2)
+
+
+class SSD1306Device:
+    def __init__(self, width=128, height=64, addr=0x3c):
+        self.width = width
+        self.height = height
+        self.addr = addr
+        self.powered = True
+        self.gddram = bytearray(8 * 128)
+        self.reset()
+
+    def reset(self):
+        # Register values after RES# / power up (datasheet section 10)
+        self.mode = 2
+        self.col_start, self.col_end = 0, 127
+        self.page_start, self.page_end = 0, 7
+        self.col, self.page = 0, 0
+        self.contrast = 0x7f
+        self.seg_remap = False
+        self.com_reverse = False
+        self.start_line = 0
+        self.mux = 63
+        self.offset = 0
+        self.com_pins = 0x12
+        self.invert = False
+        self.entire_on = False
+        self.display_on = False
+        self.charge_pump = False
+        self.scroll = None
+        self.scrolling = False
+        self.vscroll_area = (0, 64)
+        self.vscroll = 0
+        self._cmd = []
+        self._need = 0
+        self.commands = 0
+        self.data_bytes = 0
+
+    # --- power ----------------------------------------------------------------
+
+    def power_off(self):
+        # The controller stops acknowledging until power comes back
+        self.powered = False
+
+    def power_on(self):
+        # Configuration resets and GDDRAM comes up with garbage
+        self.powered = True
+        for i in range(len(self.gddram)):
+            self.gddram[i] = (i * 37) & 0xff
+        self.reset()
+
+    # --- bus side -------------------------------------------------------------
+
+    def write(self, data):
+        # One I2C write transaction after the address byte
+        i, n = 0, len(data)
+        while i < n:
+            ctrl = data[i]
+            i += 1
+            is_data = ctrl & 0x40
+            if ctrl & 0x80:
+                # Co=1: one byte, then another control byte follows
+                if i < n:
+                    self._byte(data[i], is_data)
+                    i += 1
+                continue
+            # Co=0: the rest of the transaction is a data or command stream
+            for b in data[i:]:
+                self._byte(b, is_data)
+            break
+
+    def status(self):
+        # Status byte read back over I2C, D6 is set while the display is off
+        return 0x00 if self.display_on else 0x40
+
+    def _byte(self, b, is_data):
+        if is_data:
+            self._data(b)
+        elif self._need:
+            self._cmd.append(b)
+            self._need -= 1
+            if not self._need:
+                self._command(self._cmd[0], self._cmd[1:])
+        else:
+            need = _PARAMS.get(b, 0)
+            if need:
+                self._cmd = [b]
+                self._need = need
+            else:
+                self._command(b, ())
+
+    def _command(self, op, args):
+        self.commands += 1
+        if op == 0x81:
+            self.contrast = args[0]
+        elif op == 0x20:
+            self.mode = args[0] & 0x03
+        elif op == 0x21:
+            self.col_start, self.col_end = args[0] & 0x7f, args[1] & 0x7f
+            self.col = self.col_start
+        elif op == 0x22:
+            self.page_start, self.page_end = args[0] & 0x07, args[1] & 0x07
+            self.page = self.page_start
+        elif op == 0xa8:
+            self.mux = args[0] & 0x3f
+        elif op == 0xd3:
+            self.offset = args[0] & 0x3f
+        elif op == 0xda:
+            self.com_pins = args[0]
+        elif op == 0x8d:
+            self.charge_pump = bool(args[0] & 0x04)
+        elif op in (0x26, 0x27):
+            self.scroll = ('h', op == 0x27, args[1] & 7, args[3] & 7, args[2] & 7, 0)
+        elif op in (0x29, 0x2a):
+            self.scroll = ('vh', op == 0x2a, args[1] & 7, args[3] & 7, args[2] & 7, args[4] & 0x3f)
+        elif op == 0xa3:
+            self.vscroll_area = (args[0] & 0x3f, args[1] & 0x7f)
+        elif op == 0x2e:
+            self.scrolling = False
+        elif op == 0x2f:
+            self.scrolling = self.scroll is not None
+            self.vscroll = 0
+        elif op in (0xa0, 0xa1):
+            self.seg_remap = op == 0xa1
+        elif op in (0xc0, 0xc8):
+            self.com_reverse = op == 0xc8
+        elif 0x40 <= op <= 0x7f:
+            self.start_line = op & 0x3f
+        elif op in (0xa4, 0xa5):
+            self.entire_on = op == 0xa5
+        elif op in (0xa6, 0xa7):
+            self.invert = op == 0xa7
+        elif op in (0xae, 0xaf):
+            self.display_on = op == 0xaf
+        elif 0xb0 <= op <= 0xb7:
+            self.page = op & 0x07
+        elif op <= 0x0f:
+            self.col = (self.col & 0xf0) | op
+            self.col_start = self.col
+        elif op <= 0x1f:
+            self.col = (self.col & 0x0f) | ((op & 0x0f) << 4)
+            self.col_start = self.col
+        # timing commands (0xd5, 0xd9, 0xdb) and NOP (0xe3) only affect the analog side
+
+    def _data(self, b):
+        self.data_bytes += 1
+        self.gddram[self.page * 128 + (self.col & 0x7f)] = b
+        if self.mode == 0:
+            if self.col >= self.col_end:
+                self.col = self.col_start
+                self.page = self.page_start if self.page >= self.page_end else self.page + 1
+            else:
+                self.col += 1
+        elif self.mode == 1:
+            if self.page >= self.page_end:
+                self.page = self.page_start
+                self.col = self.col_start if self.col >= self.col_end else self.col + 1
+            else:
+                self.page += 1
+        elif self.col >= 127:
+            self.col = self.col_start
+        else:
+            self.col += 1
+
+    # --- scroll unit ----------------------------------------------------------
+
+    def step_scroll(self, frames=1):
+        # Advance an active scroll by `frames` display frames
+        if not self.scrolling:
+            return
+        kind, left, p0, p1, interval, voff = self.scroll
+        steps = frames // _SCROLL_FRAMES[interval]
+        for _ in range(steps):
+            for p in range(p0, p1 + 1):
+                row = self.gddram[p * 128:(p + 1) * 128]
+                row = row[1:] + row[:1] if left else row[-1:] + row[:-1]
+                self.gddram[p * 128:(p + 1) * 128] = row
+            if kind == 'vh':
+                # 0xA3 gives the fixed rows on top and the rows in the area below them
+                top, rows = self.vscroll_area
+                self.vscroll = (self.vscroll + voff) % rows if rows else 0
+
+    # --- panel side -----------------------------------------------------------
+
+    def pixel(self, x, y):
+        # Lit state of the panel pixel at (x, y) as the viewer sees it
+        if not self.display_on:
+            return 0
+        if self.entire_on:
+            return 1
+        # The module is wired so that remap + reversed COM scan (the setup
+        # every driver uses) shows GDDRAM upright
+        com = y if self.com_reverse else self.height - 1 - y
+        line = (com + self.start_line + self.offset) % 64
+        top, rows = self.vscroll_area
+        if self.scrolling and rows and top <= com < top + rows:
+            line = top + (line - top + self.vscroll) % rows
+        col = x + 32 if self.width == 64 else x
+        if not self.seg_remap:
+            col = 127 - col
+        lit = (self.gddram[(line >> 3) * 128 + col] >> (line & 7)) & 1
+        return lit ^ self.invert
+
+    def frame(self):
+        # Whole visible image as a list of rows of 0/1
+        return [[self.pixel(x, y) for x in range(self.width)] for y in range(self.height)]
+
+    def ram(self, page, col0=0, col1=127):
+        # Raw GDDRAM bytes of one page
+        return bytes(self.gddram[page * 128 + col0:page * 128 + col1 + 1])
+
+    def ascii(self, step=1):
+        return '\n'.join(''.join('#' if p else '.' for p in row[::step])
+                         for row in self.frame()[::step])
+
+
+class EmulatedI2C:
+    def __init__(self, freq=400000):
+        self.freq = freq
+        self.devices = {}
+        self.reset_stats()
+
+    def attach(self, device):
+        self.devices[device.addr] = device
+        return device
+
+    def reset_stats(self):
+        self.stats = {'transactions': 0, 'bytes': 0, 'bus_us': 0.0}
+
+    def _account(self, nbytes):
+        # START + address/ACK + 9 bits per byte + STOP
+        self.stats['transactions'] += 1
+        self.stats['bytes'] += nbytes
+        self.stats['bus_us'] += (1 + 9 + 9 * nbytes + 1) * 1e6 / self.freq
+
+    def _device(self, addr):
+        dev = self.devices.get(addr)
+        if dev is None or not dev.powered:
+            self._account(0)
+            raise OSError(errno.EIO)
+        return dev
+
+    def scan(self):
+        return sorted(a for a, d in self.devices.items() if d.powered)
+
+    def writeto(self, addr, buf, stop=True):
+        dev = self._device(addr)
+        data = bytes(buf)
+        self._account(len(data))
+        dev.write(data)
+        return len(data)
+
+    def writevto(self, addr, vector, stop=True):
+        return self.writeto(addr, b''.join(bytes(b) for b in vector), stop)
+
+    def readfrom(self, addr, nbytes, stop=True):
+        dev = self._device(addr)
+        self._account(nbytes)
+        return bytes([dev.status()]) * nbytes
+
+    def readfrom_into(self, addr, buf, stop=True):
+        data = self.readfrom(addr, len(buf), stop)
+        buf[:] = data
@@ -0,0 +1,127 @@
+# Driver checks against the emulated panel, for the cases that are easy to
+# get wrong and hard to see on a board: power loss and the scroll unit.
+#
+#   PYTHONPATH=host:lib python host/test_driver.py      # or python -m pytest host
+#
+# A check passes when what the emulated panel shows matches the driver's
+# framebuffer (or the position the datasheet gives).
+
+import compat  # noqa: F401
+from ssd1306_emu import EmulatedI2C, SSD1306Device
+import ssd1306
+
+
+def panel(shadow=True):
+    i2c = EmulatedI2C()
+    dev = i2c.attach(SSD1306Device())
+    oled = ssd1306.SSD1306_I2C(128, 64, i2c, shadow=shadow)
+    return dev, oled
+
+
+def matches(oled, dev):
+    fb = oled.framebuf
+    return all(fb.pixel(x, y) == dev.pixel(x, y) for y in range(oled.height) for x in range(oled.width))
+
+
+def test_power_loss_while_asleep():
+    for shadow in (False, True):
+        dev, oled = panel(shadow)
+        oled.text("asleep", 0, 0)
+        oled.show()
+        oled.sleep()
+        dev.power_off()
+        dev.power_on()
+        oled.wake()
+        assert dev.seg_remap and dev.com_reverse and dev.mode == 0
+        assert matches(oled, dev)
+        # And later frames keep landing in the right place
+        oled.fill(0)
+        oled.text("awake", 10, 20)
+        oled.show()
+        assert matches(oled, dev)
+
+
+def test_power_loss_during_flush():
+    dev, oled = panel()
+    oled.show()
+    dev.power_off()
+    oled.text("lost", 0, 0)
+    try:
+        oled.show()
+    except OSError:
+        pass
+    else:
+        raise AssertionError("flush to an unpowered panel succeeded")
+    assert oled.lost
+    dev.power_on()
+    assert oled.check()
+    assert not oled.lost
+    assert matches(oled, dev)
+
+
+def test_diag_scroll_area():
+    # Rows top..top + rows - 1 scroll, with the offset wrapping inside them,
+    # the rows above stay put
+    dev, oled = panel()
+    oled.hline(0, 5, 128, 1)
+    oled.hline(0, 20, 128, 1)
+    oled.show()
+    oled.hw_scroll_diag(1, top=16, rows=32, frames=2)
+    dev.step_scroll(10)       # 5 steps of one row up, row 20 wraps to the bottom of the area
+    lit = [y for y in range(64) if dev.pixel(64, y)]
+    assert lit == [5, 47], lit
+    dev.step_scroll(54)       # 32 steps in all, back where it started
+    lit = [y for y in range(64) if dev.pixel(64, y)]
+    assert lit == [5, 20], lit
+
+
+def test_show_while_scrolling():
+    # show() leaves the pages the scroll unit is moving alone, the rest of
+    # the panel still updates, and stopping resends everything
+    for shadow in (False, True):
+        dev, oled = panel(shadow)
+        oled.text("scroll", 0, 0)
+        oled.show()
+        oled.hw_scroll(start_page=0, end_page=1, frames=2)
+        dev.step_scroll(6)
+        moving = dev.gddram[:256]
+        oled.text("mid", 0, 8)
+        oled.text("still", 0, 40)
+        oled.show()
+        assert dev.gddram[:256] == moving
+        assert all(dev.pixel(x, y) == oled.framebuf.pixel(x, y) for y in range(16, 64) for x in range(128))
+        oled.hw_scroll_stop()
+        oled.show()
+        assert matches(oled, dev)
+
+
+def test_show_async_with_worker():
+    # show_async() writes the window and pages itself, so it refuses to run
+    # next to the core 1 worker instead of racing it for the bus
+    import asyncio
+    dev, oled = panel()
+    oled.start_worker()
+    try:
+        oled.text("worker", 0, 0)
+        try:
+            asyncio.run(oled.show_async())
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("show_async() ran beside the worker")
+        oled.show()
+        oled.wait()
+        assert matches(oled, dev)
+    finally:
+        oled.stop_worker()
+    oled.fill(0)
+    oled.text("async", 0, 0)
+    asyncio.run(oled.show_async())
+    assert matches(oled, dev)
+
+
+if __name__ == '__main__':
+    for name, fn in sorted(globals().items()):
+        if name.startswith('test_'):
+            fn()
+            print("ok", name)
@@ -0,0 +1,58 @@
+# Checks a hand pack from hands_compile.py against the live face in
+# mini_projects/analog_face.py, drawn with lib/raster.py
+#
+#   PYTHONPATH=host:lib python host/test_handpack.py      # or python -m pytest host
+
+import os
+import tempfile
+
+import compat  # noqa: F401
+import framebuf
+import hands_compile
+import handpack
+import raster
+
+SIZE = const(64)
+
+
+def live(hour, minute, second):
+    # mini_projects/analog_face.py at CX, CY, R = 32, 32, 31
+    buf = bytearray(SIZE * SIZE // 8)
+    fb = framebuf.FrameBuffer(buf, SIZE, SIZE, framebuf.MONO_VLSB)
+    raster.circle(fb, 32, 32, 31)
+    raster.ticks(fb, 32, 32, 31, 12, 4)
+    raster.hand(fb, 32, 32, 16, (hour % 12) * 30 + minute // 2, 3)
+    raster.hand(fb, 32, 32, 25, minute * 6, 2)
+    raster.hand(fb, 32, 32, 28, second * 6, 1, tail=6)
+    raster.circle(fb, 32, 32, 2, fill=True)
+    return buf
+
+
+def test_pack_matches_live_face():
+    # Every hour hand position, odd minutes included
+    hands = [
+        (720, SIZE // 4, 3, 0, 0),
+        (60, SIZE * 25 // 64, 2, 0, 0),
+        (60, SIZE * 7 // 16, 1, SIZE * 3 // 32, 2),
+    ]
+    dial, rendered = hands_compile.render(SIZE, hands, 12, 4)
+    fd, path = tempfile.mkstemp(suffix='.bin')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(hands_compile.pack(SIZE, dial, rendered, [h[0] for h in hands]))
+    buf = bytearray(SIZE * SIZE // 8)
+    fb = framebuf.FrameBuffer(buf, SIZE, SIZE, framebuf.MONO_VLSB)
+    pack = handpack.HandPack(path)
+    try:
+        face = handpack.AnalogFace(fb, pack)
+        for i in range(720):
+            hour, minute, second = i // 60, i % 60, i * 7 % 60
+            face.draw(hour, minute, second)
+            assert buf == live(hour, minute, second), (hour, minute, second)
+    finally:
+        pack.close()
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    test_pack_matches_live_face()
+    print("ok test_pack_matches_live_face")
@@ -0,0 +1,67 @@
+# Sprite atlas: every sprite packed into one buffer, FrameBuffers built once
+#
+# Sprites use the sprite editor format, ((width, height), bytearray) in
+# MONO_HLSB. Building a framebuf.FrameBuffer per blit allocates on every
+# frame and the GC pauses add up, so the atlas creates one FrameBuffer per
+# sprite up front, each a view into a single contiguous bytearray.
+#
+#   import env
+#   atlas = Atlas(env)
+#   oled.blit(atlas['tree'], 0, 0, -1, 8, 8)    # or atlas.draw(oled, 'tree', 0, 0)
+#   grass = atlas.sprite('grass_mid')           # ((16, 16), FrameBuffer)
+#
+# Sprites converted to MONO_VLSB by host/sprite_convert.py (assets/env_vlsb.py)
+# are loaded with Atlas(env_vlsb, framebuf.MONO_VLSB). draw() then uses the
+# display's page-aligned copy when it can.
+
+import framebuf
+
+
+def is_sprite(value):
+    return (isinstance(value, tuple) and len(value) == 2
+            and isinstance(value[0], tuple) and len(value[0]) == 2
+            and isinstance(value[1], (bytes, bytearray)))
+
+
+class Atlas:
+    def __init__(self, source, fmt=framebuf.MONO_HLSB):
+        # source: a module such as env, or a dict of name -> sprite
+        if isinstance(source, dict):
+            items = source.items()
+        else:
+            items = [(name, getattr(source, name)) for name in dir(source)]
+        sprites = sorted((name, value) for name, value in items if is_sprite(value))
+
+        self.fmt = fmt
+        self.data = bytearray(sum(len(value[1]) for name, value in sprites))
+        mv = memoryview(self.data)
+        self.sprites = {}
+        self.raw = {}
+        offset = 0
+        for name, ((w, h), data) in sprites:
+            n = len(data)
+            self.data[offset:offset + n] = data
+            fbuf = framebuf.FrameBuffer(mv[offset:offset + n], w, h, fmt)
+            self.sprites[name] = ((w, h), fbuf)
+            self.raw[name] = mv[offset:offset + n]
+            offset += n
+
+    def __getitem__(self, name):
+        return self.sprites[name][1]
+
+    def __contains__(self, name):
+        return name in self.sprites
+
+    def sprite(self, name):
+        # Same shape as the env tuple, with the FrameBuffer in place of the data
+        return self.sprites[name]
+
+    def size(self, name):
+        return self.sprites[name][0]
+
+    def draw(self, disp, name, x, y, key=-1):
+        (w, h), fbuf = self.sprites[name]
+        if self.fmt == framebuf.MONO_VLSB and key == -1 and hasattr(disp, 'blit_vlsb'):
+            disp.blit_vlsb(self.raw[name], x, y, w, h, fbuf)
+        else:
+            disp.blit(fbuf, x, y, key, w, h)
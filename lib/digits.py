@@ -0,0 +1,189 @@
+# Cached digit fonts for clock faces
+#
+# oled.text(str(n), ...) allocates a string every call and draws the 8x8 font
+# pixel by pixel. A DigitFont renders 0-9 and the separators once, into one
+# MONO_VLSB buffer like the sprite atlas, and then only blits. Glyph heights
+# are whole pages, so at a y that is a multiple of 8 each glyph is a plain
+# page copy (SSD1306_I2C.blit_vlsb). Numbers are drawn digit by digit from
+# integer arithmetic, no str is built.
+#
+#   big = digits.large()                    # 8x8 font scaled to 16x24
+#   big.number(oled, minute, 0, 0, 2)       # "07"
+#   seg = digits.seg7(16, 32, 3)            # 7-segment, 16x32, 3px strokes
+#   x = seg.number(oled, hour, 0, 0, 2)
+#   x = seg.text(oled, ':', x, 0)
+#   digits.small().fixed(oled, 22.25, 0, 40, 1)   # "22.3"
+#
+# Glyphs are opaque cells: they clear what is under them.
+
+import framebuf
+
+CHARS = '0123456789:.- /'
+COLON = const(10)
+POINT = const(11)
+MINUS = const(12)
+SPACE = const(13)
+SLASH = const(14)
+
+# Segments a-g as bits 0-6 for 0-9, then '-'
+#  aaa
+# f   b
+#  ggg
+# e   c
+#  ddd
+_SEGMENTS = b'\x3f\x06\x5b\x4f\x66\x6d\x7d\x07\x7f\x6f'
+
+_fonts = {}
+
+
+class DigitFont:
+    def __init__(self, widths, height, spacing, render):
+        # widths: cell width per CHARS entry, render(fbuf, index, w, h) draws one
+        self.height = height
+        self.spacing = spacing
+        self.pages = (height + 7) // 8
+        self.widths = bytes(widths)
+        self.data = bytearray(sum(widths) * self.pages)
+        mv = memoryview(self.data)
+        self.glyphs = []
+        offset = 0
+        for index, w in enumerate(widths):
+            n = w * self.pages
+            fbuf = framebuf.FrameBuffer(mv[offset:offset + n], w, self.pages * 8, framebuf.MONO_VLSB)
+            render(fbuf, index, w, height)
+            self.glyphs.append((mv[offset:offset + n], fbuf))
+            offset += n
+        # Digits of the number being drawn, least significant first
+        self._digits = bytearray(12)
+
+    def glyph(self, disp, index, x, y):
+        # Draws CHARS[index] at x, y and returns the x after it
+        w = self.widths[index]
+        raw, fbuf = self.glyphs[index]
+        if hasattr(disp, 'blit_vlsb'):
+            disp.blit_vlsb(raw, x, y, w, self.pages * 8, fbuf)
+        else:
+            disp.blit(fbuf, x, y, -1, w, self.pages * 8)
+        return x + w + self.spacing
+
+    def text(self, disp, s, x, y):
+        # For constant separators such as ':' or '/', characters not in CHARS draw as a space
+        for ch in s:
+            index = CHARS.find(ch)
+            x = self.glyph(disp, index if index >= 0 else SPACE, x, y)
+        return x
+
+    def number(self, disp, n, x, y, width=0):
+        # Integer n, zero padded to width digits. Returns the x after it.
+        if n < 0:
+            x = self.glyph(disp, MINUS, x, y)
+            n = -n
+        buf = self._digits
+        i = 0
+        while True:
+            buf[i] = n % 10
+            n //= 10
+            i += 1
+            if (n == 0 and i >= width) or i == len(buf):
+                break
+        while i:
+            i -= 1
+            x = self.glyph(disp, buf[i], x, y)
+        return x
+
+    def fixed(self, disp, value, x, y, decimals=1):
+        # value rounded to decimals places, e.g. 22.25 -> "22.3"
+        scale = 10 ** decimals
+        n = int(value * scale + (0.5 if value >= 0 else -0.5))
+        if n < 0:
+            x = self.glyph(disp, MINUS, x, y)
+            n = -n
+        x = self.number(disp, n // scale, x, y)
+        if decimals:
+            x = self.glyph(disp, POINT, x, y)
+            x = self.number(disp, n % scale, x, y, decimals)
+        return x
+
+    def size(self, n, width=0):
+        # Width in pixels number(n, width=width) will take
+        digits = 1
+        if n < 0:
+            n = -n
+        while n >= 10:
+            n //= 10
+            digits += 1
+        digits = max(digits, width)
+        return digits * (self.widths[0] + self.spacing)
+
+
+def scaled(sx=1, sy=1):
+    # The built-in 8x8 font, each pixel drawn as an sx by sy block
+    key = ('scaled', sx, sy)
+    if key not in _fonts:
+        cell = bytearray(8)
+        src = framebuf.FrameBuffer(cell, 8, 8, framebuf.MONO_VLSB)
+
+        def render(fbuf, index, w, h):
+            src.fill(0)
+            src.text(CHARS[index], 0, 0, 1)
+            for py in range(8):
+                for px in range(8):
+                    if src.pixel(px, py):
+                        fbuf.fill_rect(px * sx, py * sy, sx, sy, 1)
+
+        _fonts[key] = DigitFont([8 * sx] * len(CHARS), 8 * sy, 0, render)
+    return _fonts[key]
+
+
+def small():
+    # Same look as oled.text
+    return scaled(1, 1)
+
+
+def large():
+    # 16x24
+    return scaled(2, 3)
+
+
+def seg7(w=12, h=24, t=2):
+    # 7-segment digits, w by h with t pixel strokes. ':' and '.' are narrow.
+    key = ('seg7', w, h, t)
+    if key not in _fonts:
+        mid = (h - t) // 2
+
+        def render(fbuf, index, cw, ch):
+            if index < 10:
+                segs = _SEGMENTS[index]
+            elif index == MINUS:
+                segs = 0x40
+            elif index == COLON:
+                fbuf.fill_rect(0, mid - 2 * t, t, t, 1)
+                fbuf.fill_rect(0, mid + 2 * t, t, t, 1)
+                return
+            elif index == POINT:
+                fbuf.fill_rect(0, h - t, t, t, 1)
+                return
+            elif index == SLASH:
+                fbuf.line(w - 1, 0, 0, h - 1, 1)
+                return
+            else:
+                return
+            if segs & 0x01:
+                fbuf.fill_rect(0, 0, w, t, 1)
+            if segs & 0x02:
+                fbuf.fill_rect(w - t, 0, t, mid + t, 1)
+            if segs & 0x04:
+                fbuf.fill_rect(w - t, mid, t, h - mid, 1)
+            if segs & 0x08:
+                fbuf.fill_rect(0, h - t, w, t, 1)
+            if segs & 0x10:
+                fbuf.fill_rect(0, mid, t, h - mid, 1)
+            if segs & 0x20:
+                fbuf.fill_rect(0, 0, t, mid + t, 1)
+            if segs & 0x40:
+                fbuf.fill_rect(0, mid, w, t, 1)
+
+        widths = [w] * len(CHARS)
+        widths[COLON] = widths[POINT] = t
+        _fonts[key] = DigitFont(widths, h, t, render)
+    return _fonts[key]
@@ -0,0 +1,85 @@
+# Several SSD1306/SH1106 panels sharing one I2C bus
+#
+# Every tick() the group flushes the panels that need it, most urgent first,
+# until the tick's byte budget is spent. A panel's deadline is the moment it
+# first became dirty plus its max_latency, so a busy panel can't starve a
+# quiet one and two full frames never go out in the same tick. Panels are
+# costed by dirty_bytes(), so a shadow panel redrawn from fill(0) every tick
+# only counts the bytes that actually changed.
+#
+#   group = DisplayGroup(budget=1024)
+#   group.add('clock', ssd1306.SSD1306_I2C(128, 64, i2c, addr=0x3c), max_latency=100)
+#   group.add('stats', ssd1306.SSD1306_I2C(128, 64, i2c, addr=0x3d), max_latency=500)
+#   ... draw on group['clock'] / group['stats'], then from the frame timer:
+#   group.tick()
+
+import time
+
+
+class DisplayGroup:
+    def __init__(self, budget=1024):
+        # Framebuffer bytes allowed per tick, one full 128x64 frame by default
+        self.budget = budget
+        self.panels = []
+        self.names = {}
+
+    def add(self, name, panel, max_latency=100):
+        # max_latency: ms a panel may stay dirty before it must be flushed
+        if name in self.names:
+            raise ValueError("Panel already exists")
+        entry = [panel, max_latency, None, {
+            'frames': 0,        # flushes done
+            'bytes': 0,         # framebuffer bytes sent in total
+            'last': 0,          # bytes sent by the last flush
+            'deferred': 0,      # ticks it was dirty but had to wait
+            'late': 0,          # flushes that happened after the deadline
+            'max_latency': 0,   # longest ms from dirty to flushed
+        }]
+        self.panels.append(entry)
+        self.names[name] = entry
+        return panel
+
+    def __getitem__(self, name):
+        return self.names[name][0]
+
+    def stats(self, name):
+        return self.names[name][3]
+
+    def tick(self):
+        # Flushes what fits in the budget, returns the bytes sent
+        now = time.ticks_ms()
+        due = []
+        for entry in self.panels:
+            cost = entry[0].dirty_bytes()
+            if not cost:
+                entry[2] = None
+                continue
+            if entry[2] is None:
+                entry[2] = now
+            # Earliest deadline first, dirtier panel first on a tie
+            due.append((time.ticks_diff(time.ticks_add(entry[2], entry[1]), now), cost, entry))
+        due.sort(key=lambda d: (d[0], -d[1]))
+
+        left = self.budget
+        sent = 0
+        flushed = False
+        for slack, cost, entry in due:
+            # The most urgent panel always goes, even when it alone is over budget
+            if cost > left and flushed:
+                entry[3]['deferred'] += 1
+                continue
+            panel, stats = entry[0], entry[3]
+            panel.show()
+            flushed = True
+            left -= panel.frame_bytes
+            sent += panel.frame_bytes
+            waited = time.ticks_diff(now, entry[2])
+            entry[2] = None
+            stats['frames'] += 1
+            stats['bytes'] += panel.frame_bytes
+            stats['last'] = panel.frame_bytes
+            if slack < 0:
+                stats['late'] += 1
+            if waited > stats['max_latency']:
+                stats['max_latency'] = waited
+        return sent
@@ -0,0 +1,59 @@
+# Runs two sched.Schedulers, one per RP2040 core
+#
+# The first core keeps the graphics loop: its scheduler runs on uasyncio as
+# usual. The second core gets a thread (_thread starts it on core 1) that
+# steps the other scheduler and sleeps until its next release; uasyncio has
+# one event loop, so only core 0 uses it.
+#
+#   graphics = sched.Scheduler()
+#   logic = sched.Scheduler()
+#   ...add tasks...
+#   rt = dualcore.Runtime(graphics, logic)
+#   asyncio.run(rt.run())            # until rt.stop()
+#
+# Share state through ring.Ring, one per direction, not through globals the
+# other core may be halfway through changing. A device used by both cores
+# (the I2C bus) is guarded by rt.bus, a _thread lock: hold it for a whole
+# transfer, e.g. `with rt.bus: oled.show()`.
+
+import _thread
+import time
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
+
+STOP_MS = const(50)
+
+
+class Runtime:
+    def __init__(self, core0, core1):
+        self.core0 = core0
+        self.core1 = core1
+        self.bus = _thread.allocate_lock()
+        self.running = False
+        self._done = True       # core 1 loop has returned
+
+    def _core1(self):
+        try:
+            while self.running:
+                # Capped, so stop() is noticed within STOP_MS
+                time.sleep_ms(min(self.core1.step(), STOP_MS))
+        finally:
+            self._done = True
+
+    async def run(self):
+        self.running = True
+        self._done = False
+        _thread.start_new_thread(self._core1, ())
+        try:
+            await self.core0.run()
+        finally:
+            self.running = False
+            while not self._done:
+                await asyncio.sleep_ms(1)
+
+    def stop(self):
+        # From either core, both loops end after their current task
+        self.running = False
+        self.core0.stop()
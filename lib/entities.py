@@ -0,0 +1,245 @@
+# Struct-of-arrays store for many sprite instances
+#
+# A list per instance in a dict costs several heap objects each and a dict
+# lookup per attribute. The store keeps one column per attribute, indexed by
+# an integer handle, so 200+ grass or particle instances are a few arrays:
+#
+#   x, y    array('h')   top left corner
+#   frame   bytearray    frame index into the sprite's frames
+#   seq     array('H')   animation counter at the next scheduled tick
+#   sprite  bytearray    sprite id, see kind()
+#   flags   bytearray    ALIVE, VISIBLE
+#   due     array('l')   tick of the next scheduled event
+#
+# Scheduled handles sit in a timing wheel, linked through the link column,
+# so expire(tick) only walks the handles due on that tick and nothing is
+# allocated per event. draw() blits every visible instance overlapping a
+# rectangle, which makes the store usable as a Scene layer. Frames that are
+# masked.Sprite objects are composed with their mask instead of blitted.
+#
+# Instances are also bucketed by the grid cell of their top left corner
+# (CELL_W x CELL_H pixels, hashed into GRID x GRID slots and linked through
+# the cell_link column), so draw() only visits the cells a rectangle can
+# touch instead of every instance. Move instances with move(), not by
+# writing x and y, so they stay in the right cell.
+#
+#   store = EntityStore(256)
+#   grass = store.kind(grass_sprite)    # anything with frames, width, height
+#   h = store.spawn(grass, 10, 20)
+#   store.move(h, store.x[h] + 1, store.y[h])
+
+from array import array
+
+ALIVE = const(1)
+VISIBLE = const(2)
+WHEEL = const(64)   # timing wheel slots, a power of two
+NIL = const(-1)
+CELL_SHIFT_X = const(5)     # 32 px wide cells
+CELL_SHIFT_Y = const(4)     # 16 px tall cells
+GRID = const(16)            # cells per axis before they wrap, a power of two
+
+
+class EntityStore:
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.x = array('h', bytes(2 * capacity))
+        self.y = array('h', bytes(2 * capacity))
+        self.frame = bytearray(capacity)
+        self.seq = array('H', bytes(2 * capacity))
+        self.sprite = bytearray(capacity)
+        self.flags = bytearray(capacity)
+        self.due = array('l', [0] * capacity)
+        # Free list when dead, timing wheel chain when scheduled
+        self.link = array('h', range(1, capacity + 1))
+        self.link[capacity - 1] = NIL
+        self._free = 0
+        self.top = 0        # one past the highest handle ever used
+        self.count = 0
+        self.wheel = array('h', [NIL] * WHEEL)
+        self.ready = array('h', bytes(2 * capacity))
+        # Spatial buckets: first handle per cell, next handle in the same
+        # cell, and the cell each handle is in
+        self.cells = array('h', [NIL] * (GRID * GRID))
+        self.cell_link = array('h', [NIL] * capacity)
+        self.cell = array('H', bytes(2 * capacity))
+        self._hits = array('h', bytes(2 * capacity))
+        self.max_w = 0
+        self.max_h = 0
+        # Per sprite id
+        self.kinds = []
+        self.frames = []
+        self.widths = bytearray()
+        self.heights = bytearray()
+        self.keys = []
+        self.masked = bytearray()
+
+    def kind(self, sprite, key=-1):
+        # Registers a sprite type (frames, width, height), returns its id
+        for i, k in enumerate(self.kinds):
+            if k is sprite:
+                return i
+        if len(self.kinds) > 255:
+            raise ValueError("Too many sprite kinds")
+        self.kinds.append(sprite)
+        self.frames.append(sprite.frames)
+        self.widths.append(sprite.width)
+        self.heights.append(sprite.height)
+        self.keys.append(key)
+        self.masked.append(hasattr(sprite.frames[0], 'compose'))
+        self.max_w = max(self.max_w, sprite.width)
+        self.max_h = max(self.max_h, sprite.height)
+        return len(self.kinds) - 1
+
+    def spawn(self, kind, x, y, frame=0, seq=0):
+        h = self._free
+        if h == NIL:
+            raise MemoryError("Entity store full")
+        self._free = self.link[h]
+        self.link[h] = NIL
+        self.x[h] = x
+        self.y[h] = y
+        self.frame[h] = frame
+        self.seq[h] = seq
+        self.sprite[h] = kind
+        self.flags[h] = ALIVE | VISIBLE
+        self._bucket(h)
+        if h >= self.top:
+            self.top = h + 1
+        self.count += 1
+        return h
+
+    def kill(self, h):
+        if not self.flags[h] & ALIVE:
+            return
+        self.unschedule(h)
+        self._unbucket(h)
+        self.flags[h] = 0
+        self.link[h] = self._free
+        self._free = h
+        self.count -= 1
+
+    def alive(self, h):
+        return bool(self.flags[h] & ALIVE)
+
+    def move(self, h, x, y):
+        self.x[h] = x
+        self.y[h] = y
+        if self._cell(x, y) != self.cell[h]:
+            self._unbucket(h)
+            self._bucket(h)
+
+    @staticmethod
+    def _cell(x, y):
+        return ((x >> CELL_SHIFT_X) & (GRID - 1)) | ((y >> CELL_SHIFT_Y) & (GRID - 1)) * GRID
+
+    def _bucket(self, h):
+        c = self._cell(self.x[h], self.y[h])
+        self.cell[h] = c
+        self.cell_link[h] = self.cells[c]
+        self.cells[c] = h
+
+    def _unbucket(self, h):
+        c = self.cell[h]
+        prev = NIL
+        cur = self.cells[c]
+        while cur != NIL:
+            if cur == h:
+                if prev == NIL:
+                    self.cells[c] = self.cell_link[h]
+                else:
+                    self.cell_link[prev] = self.cell_link[h]
+                self.cell_link[h] = NIL
+                return
+            prev = cur
+            cur = self.cell_link[cur]
+
+    def bounds(self, h):
+        k = self.sprite[h]
+        return self.x[h], self.y[h], self.widths[k], self.heights[k]
+
+    def schedule(self, h, tick):
+        # Puts h on the wheel for tick, a handle is on it at most once
+        self.due[h] = tick
+        slot = tick & (WHEEL - 1)
+        self.link[h] = self.wheel[slot]
+        self.wheel[slot] = h
+
+    def unschedule(self, h):
+        slot = self.due[h] & (WHEEL - 1)
+        prev = NIL
+        cur = self.wheel[slot]
+        while cur != NIL:
+            if cur == h:
+                if prev == NIL:
+                    self.wheel[slot] = self.link[h]
+                else:
+                    self.link[prev] = self.link[h]
+                self.link[h] = NIL
+                return
+            prev = cur
+            cur = self.link[cur]
+
+    def expire(self, tick):
+        # Takes the handles due by tick off the wheel into self.ready,
+        # returns how many. Handles a whole turn or more away stay on.
+        slot = tick & (WHEEL - 1)
+        link = self.link
+        due = self.due
+        ready = self.ready
+        n = 0
+        prev = NIL
+        cur = self.wheel[slot]
+        while cur != NIL:
+            nxt = link[cur]
+            if due[cur] <= tick:
+                if prev == NIL:
+                    self.wheel[slot] = nxt
+                else:
+                    link[prev] = nxt
+                link[cur] = NIL
+                ready[n] = cur
+                n += 1
+            else:
+                prev = cur
+            cur = nxt
+        return n
+
+    def draw(self, fb, x0, y0, x1, y1, buf):
+        # Draws the visible instances overlapping [x0, x1) x [y0, y1), with
+        # fb's origin at x0, y0 (the Scene layer interface), in handle order
+        xs, ys = self.x, self.y
+        flags, sprite, frame = self.flags, self.sprite, self.frame
+        widths, heights, frames, keys = self.widths, self.heights, self.frames, self.keys
+        masked = self.masked
+        cells, cell_link, hits = self.cells, self.cell_link, self._hits
+        # Cells whose instances can reach into the rectangle, each slot once
+        cx0 = (x0 - self.max_w + 1) >> CELL_SHIFT_X
+        cy0 = (y0 - self.max_h + 1) >> CELL_SHIFT_Y
+        nx = min(((x1 - 1) >> CELL_SHIFT_X) - cx0 + 1, GRID)
+        ny = min(((y1 - 1) >> CELL_SHIFT_Y) - cy0 + 1, GRID)
+        n = 0
+        for cy in range(cy0, cy0 + ny):
+            row = (cy & (GRID - 1)) * GRID
+            for cx in range(cx0, cx0 + nx):
+                h = cells[row | (cx & (GRID - 1))]
+                while h != NIL:
+                    if flags[h] & VISIBLE:
+                        k = sprite[h]
+                        x = xs[h]
+                        y = ys[h]
+                        if x < x1 and x + widths[k] > x0 and y < y1 and y + heights[k] > y0:
+                            # Insertion sort, so overlaps draw the same in every rectangle
+                            i = n
+                            while i and hits[i - 1] > h:
+                                hits[i] = hits[i - 1]
+                                i -= 1
+                            hits[i] = h
+                            n += 1
+                    h = cell_link[h]
+        for i in range(n):
+            h = hits[i]
+            k = sprite[h]
+            if masked[k]:
+                frames[k][frame[h]].compose(buf, x1 - x0, y1 - y0, xs[h] - x0, ys[h] - y0)
+            else:
+                fb.blit(frames[k][frame[h]], xs[h] - x0, ys[h] - y0, keys[k])
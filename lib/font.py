@@ -0,0 +1,107 @@
+# Proportional bitmap fonts compiled by host/font_compile.py
+#
+# framebuf.text only knows the built-in 8x8 charset. A Font draws any font
+# compiled from BDF: every glyph is a MONO_VLSB strip with a FrameBuffer built
+# once at load, so a string is one blit per character, straight into the
+# display's framebuffer and marked dirty once, with the kerning pairs applied.
+# Static text can be rendered once with label() and blitted as a sprite.
+#
+#   import font, font_spartan16
+#   f = font.Font(font_spartan16)
+#   f.text(oled, "Hello", 0, 0)            # y is the top of the line
+#   size, fbuf = f.label("Temperature")    # same shape as Atlas.sprite()
+#
+# Glyphs are drawn transparent in colour 1 (blit key 0), so kerned
+# neighbours can overlap.
+
+import framebuf
+
+
+class Font:
+    def __init__(self, module):
+        self.height = module.height
+        self.baseline = module.baseline
+        self.first = module.first
+        self.last = module.last
+        self.kern = module.kern
+        rows = module.pages * 8
+        # FrameBuffer needs a writable buffer, module.bitmap is bytes
+        self.data = bytearray(module.bitmap)
+        mv = memoryview(self.data)
+        index = module.index
+        # Per character: (FrameBuffer or None, strip width, x offset, advance)
+        self.glyphs = []
+        for i in range(0, len(index), 5):
+            offset = index[i] | index[i + 1] << 8
+            width = index[i + 2]
+            fbuf = None
+            if width:
+                fbuf = framebuf.FrameBuffer(mv[offset:offset + width * module.pages], width, rows, framebuf.MONO_VLSB)
+            self.glyphs.append((fbuf, width, (index[i + 3] ^ 0x80) - 0x80, index[i + 4]))
+        if self.first <= 32 <= self.last:
+            self.space = self.glyphs[32 - self.first]
+        else:
+            self.space = (None, 0, 0, self.height // 3)
+
+    def _glyph(self, ch):
+        c = ord(ch)
+        if self.first <= c <= self.last:
+            return c, self.glyphs[c - self.first]
+        return c, self.space
+
+    def width(self, s):
+        # Advance of s in pixels, kerning included
+        x = 0
+        prev = 0
+        kern = self.kern
+        for ch in s:
+            c, glyph = self._glyph(ch)
+            if kern and prev:
+                x += kern.get(prev << 8 | c, 0)
+            x += glyph[3]
+            prev = c
+        return x
+
+    def _draw(self, fb, s, x, y):
+        # Returns (pen x after s, leftmost and one past rightmost ink column).
+        # With fb None it only measures.
+        # No lookup at all for a font without kerning pairs, or before the
+        # first character of s
+        prev = 0
+        kern = self.kern
+        lo = hi = x
+        for ch in s:
+            c, (fbuf, width, xoff, advance) = self._glyph(ch)
+            if kern and prev:
+                x += kern.get(prev << 8 | c, 0)
+            if fbuf is not None:
+                if fb is not None:
+                    fb.blit(fbuf, x + xoff, y, 0)
+                if x + xoff < lo:
+                    lo = x + xoff
+                if x + xoff + width > hi:
+                    hi = x + xoff + width
+            x += advance
+            prev = c
+        return x, lo, hi
+
+    def draw(self, fb, s, x, y):
+        # Draws s into a FrameBuffer, y is the top of the line. Returns the x after s.
+        return self._draw(fb, s, x, y)[0]
+
+    def text(self, disp, s, x, y):
+        # Draws s on an SSD1306/SH1106 driver (or any FrameBuffer) and returns
+        # the x after it. The driver is marked dirty once for the whole string.
+        end, lo, hi = self._draw(getattr(disp, 'framebuf', disp), s, x, y)
+        if hi > lo and hasattr(disp, 'invalidate'):
+            disp.invalidate(lo, y, hi - lo, self.height)
+        return end
+
+    def label(self, s):
+        # Pre-renders s: ((w, h), FrameBuffer) for text that doesn't change
+        end, lo, hi = self._draw(None, s, 0, 0)
+        w = max(hi - lo, 1)
+        rows = (self.height + 7) & ~7
+        fbuf = framebuf.FrameBuffer(bytearray(w * rows // 8), w, rows, framebuf.MONO_VLSB)
+        self._draw(fbuf, s, -lo, 0)
+        return (w, self.height), fbuf
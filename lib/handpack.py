@@ -0,0 +1,106 @@
+# Analog clock faces from a hand pack built by host/hands_compile.py
+#
+# The pack holds a dial and every hand position already rasterized, so a
+# face costs a dial copy and three blits instead of the geometry in
+# lib/raster.py. Only the dial (512 bytes at 64x64) is kept in RAM; hands
+# are read from flash as they are needed into one scratch buffer, through
+# an 8 byte index entry per hand.
+#
+#   pack = handpack.HandPack('/assets/clock_hands.bin')
+#   face = handpack.AnalogFace(oled, pack, 0, 0)
+#   face.draw(hour, minute, second)
+#   oled.show()
+#
+# Keep the face's y a multiple of 8, the dial is then copied a page row at
+# a time with SSD1306_I2C.blit_vlsb.
+
+import framebuf
+import struct
+
+HEADER = const(16)
+ENTRY = const(8)
+HOUR = const(0)
+MINUTE = const(1)
+SECOND = const(2)
+
+
+class HandPack:
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        head = self.file.read(HEADER)
+        magic, w, h, cx, cy, hours, minutes, seconds, largest = struct.unpack('<4sBBBBHHHH', head)
+        if magic != b'HAND':
+            raise ValueError("Not a hand pack")
+        self.width = w
+        self.height = h
+        self.cx = cx
+        self.cy = cy
+        self.counts = (hours, minutes, seconds)
+        self.pages = (h + 7) >> 3
+        self.dial = bytearray(w * self.pages)
+        self.file.readinto(self.dial)
+        self.dial_fb = framebuf.FrameBuffer(self.dial, w, self.pages * 8, framebuf.MONO_VLSB)
+        # First index entry of each hand
+        base = HEADER + len(self.dial)
+        self._first = (base, base + hours * ENTRY, base + (hours + minutes) * ENTRY)
+        self._entry = bytearray(ENTRY)
+        self._buf = bytearray(largest)
+        self._mv = memoryview(self._buf)
+        # (view, FrameBuffer) over the scratch buffer per strip shape, built
+        # the first time a shape comes up, 60 of them for the 64x64 pack
+        self._shapes = {}
+
+    def hand(self, which, i):
+        # Reads position i of HOUR, MINUTE or SECOND, returns (x, y, w, h,
+        # FrameBuffer) relative to the dial's top left. The FrameBuffer
+        # shares the scratch buffer, blit it before reading the next hand.
+        f = self.file
+        e = self._entry
+        f.seek(self._first[which] + (i % self.counts[which]) * ENTRY)
+        f.readinto(e)
+        w = e[6]
+        h = e[7] * 8
+        key = w | e[7] << 8
+        shape = self._shapes.get(key)
+        if shape is None:
+            view = self._mv[:w * e[7]]
+            shape = (view, framebuf.FrameBuffer(view, w, h, framebuf.MONO_VLSB))
+            self._shapes[key] = shape
+        f.seek(e[0] | e[1] << 8 | e[2] << 16 | e[3] << 24)
+        f.readinto(shape[0])
+        return e[4], e[5] * 8, w, h, shape[1]
+
+    def close(self):
+        self.file.close()
+
+
+class AnalogFace:
+    def __init__(self, disp, pack, x=0, y=0):
+        self.disp = disp
+        self.pack = pack
+        self.x = x
+        self.y = y
+        self.last = None
+
+    def draw(self, hour, minute, second):
+        # Dial, then the hands over it (blit key 0). Returns False when the
+        # face already shows this time.
+        t = (hour % 12) * 3600 + minute * 60 + second
+        if t == self.last:
+            return False
+        self.last = t
+        disp = self.disp
+        pack = self.pack
+        x0, y0 = self.x, self.y
+        w, h = pack.width, pack.pages * 8
+        if hasattr(disp, 'blit_vlsb'):
+            disp.blit_vlsb(pack.dial, x0, y0, w, h, pack.dial_fb)
+        else:
+            disp.blit(pack.dial_fb, x0, y0)
+        fb = getattr(disp, 'framebuf', disp)
+        for which, i in ((HOUR, (hour % 12) * 60 + minute), (MINUTE, minute), (SECOND, second)):
+            x, y, hw, hh, fbuf = pack.hand(which, i)
+            fb.blit(fbuf, x0 + x, y0 + y, 0)
+        if not hasattr(disp, 'blit_vlsb') and hasattr(disp, 'invalidate'):
+            disp.invalidate(x0, y0, w, h)
+        return True
@@ -0,0 +1,102 @@
+# Masked sprites: an image plane plus a mask plane, composited a byte at a time
+#
+# framebuf.blit has one key colour, so a 1-bit sprite can be either opaque
+# everywhere or see-through wherever it is 0, never "0 but covering what is
+# behind". A masked sprite carries a mask plane next to its image, both in
+# MONO_VLSB (host/sprite_convert.py --masks writes them, the mask being the
+# sprite's filled silhouette), and is drawn straight into a VLSB buffer:
+#
+#   MASK    dst = (dst & ~mask) | image     cut out the shape, draw the image
+#   OR      dst |= image                    like blit with key 0
+#   XOR     dst ^= image                    drawing twice restores the screen
+#   ERASE   dst &= ~mask                    clear the shape
+#
+# A byte is 8 pixels of one column, so a 16x16 sprite is 32 byte operations
+# on a page aligned y and 48 otherwise, where each source byte is split over
+# two pages.
+#
+#   import env_masked
+#   sprites = masked.load(env_masked)
+#   masked.draw(oled, sprites['tree'], 10, 13)
+
+import micropython
+
+MASK = const(0)
+OR = const(1)
+XOR = const(2)
+ERASE = const(3)
+
+
+def is_masked(value):
+    return (isinstance(value, tuple) and len(value) == 3
+            and isinstance(value[0], tuple) and len(value[0]) == 2
+            and isinstance(value[1], (bytes, bytearray)))
+
+
+def load(source):
+    # name -> Sprite for every ((w, h), image, mask) in a module or dict
+    if isinstance(source, dict):
+        items = source.items()
+    else:
+        items = [(name, getattr(source, name)) for name in dir(source)]
+    return {name: Sprite(value[0][0], value[0][1], value[1], value[2])
+            for name, value in items if is_masked(value)}
+
+
+@micropython.native
+def _blend(buf, d, image, mask, s, n, up, down, op):
+    # n bytes from image/mask[s:] onto buf[d:], each shifted left by up then
+    # right by down, i.e. the part of the byte that lands on this page
+    if op == MASK:
+        for i in range(n):
+            m = ((mask[s + i] << up) >> down) & 0xff
+            buf[d + i] = (buf[d + i] & ~m) | (((image[s + i] << up) >> down) & 0xff)
+    elif op == OR:
+        for i in range(n):
+            buf[d + i] |= ((image[s + i] << up) >> down) & 0xff
+    elif op == XOR:
+        for i in range(n):
+            buf[d + i] ^= ((image[s + i] << up) >> down) & 0xff
+    else:
+        for i in range(n):
+            buf[d + i] &= ~(((mask[s + i] << up) >> down) & 0xff)
+
+
+class Sprite:
+    def __init__(self, w, h, image, mask=None):
+        # image and mask: MONO_VLSB, w bytes per page, pad bits 0
+        self.w = w
+        self.h = h
+        self.pages = (h + 7) // 8
+        if len(image) != w * self.pages or (mask is not None and len(mask) != len(image)):
+            raise ValueError("Planes don't match the sprite size")
+        self.image = image
+        # Without a mask the sprite covers exactly its set pixels
+        self.mask = image if mask is None else mask
+
+    def compose(self, buf, stride, rows, x, y, op=MASK, offset=0):
+        # Draws into a MONO_VLSB buffer stride pixels wide and rows tall,
+        # starting at buf[offset]. Clipped to the buffer.
+        w = self.w
+        c0 = max(0, -x)
+        c1 = min(w, stride - x)
+        if c0 >= c1 or y >= rows or y + self.h <= 0:
+            return
+        n = c1 - c0
+        pages = (rows + 7) >> 3
+        shift = y & 7
+        top = y >> 3
+        image, mask = self.image, self.mask
+        for sp in range(self.pages):
+            s = sp * w + c0
+            p = top + sp
+            if 0 <= p < pages:
+                _blend(buf, offset + p * stride + x + c0, image, mask, s, n, shift, 0, op)
+            if shift and 0 <= p + 1 < pages:
+                _blend(buf, offset + (p + 1) * stride + x + c0, image, mask, s, n, 0, 8 - shift, op)
+
+
+def draw(disp, sprite, x, y, op=MASK):
+    # Onto an SSD1306/SH1106 driver's buffer, marking the area dirty
+    sprite.compose(disp.bufmv, disp.width, disp.height, x, y, op, 1)
+    disp.invalidate(x, y, sprite.w, sprite.h)
@@ -0,0 +1,232 @@
+# Integer drawing primitives for analog faces and gauges
+#
+# No floats: angles are whole degrees looked up in a sine table
+# scaled by 2**14 (SIN), lengths are pixels. Clock angles start at 12 o'clock
+# and run clockwise, so a hand is point(cx, cy, r, minute * 6).
+#
+# Lines go through framebuf.line (Bresenham, in C). Thick lines, triangles
+# and polygons are filled a scanline at a time with hline, circles with the
+# midpoint algorithm. Every function takes a driver or a FrameBuffer; on a
+# driver it draws into disp.framebuf and marks the bounding box dirty once.
+#
+#   raster.hand(oled, 64, 32, 28, minute * 6, 3)
+#   raster.circle(oled, 64, 32, 31)
+#   raster.gauge(oled, 32, 40, 20, humidity, 0, 100)
+
+from array import array
+
+ONE = const(16384)      # 1.0 in the tables
+SHIFT = const(14)
+
+# sin(d) * ONE for d in 0..359 as little-endian int16, 720 bytes of heap.
+# Generated with struct.pack('<360h', *(round(math.sin(math.radians(d)) * 16384) for d in range(360)))
+SIN = array('h', (
+    b'\x00\x00\x1e\x01\x3c\x02\x59\x03\x77\x04\x94\x05\xb1\x06\xcd\x07\xe8\x08\x03\x0a\x1d\x0b\x36\x0c'
+    b'\x4e\x0d\x66\x0e\x7c\x0f\x90\x10\xa4\x11\xb6\x12\xc7\x13\xd6\x14\xe4\x15\xf0\x16\xfa\x17\x02\x19'
+    b'\x08\x1a\x0c\x1b\x0e\x1c\x0e\x1d\x0c\x1e\x07\x1f\x00\x20\xf6\x20\xea\x21\xdb\x22\xca\x23\xb5\x24'
+    b'\x9e\x25\x84\x26\x67\x27\x47\x28\x23\x29\xfd\x29\xd3\x2a\xa6\x2b\x75\x2c\x41\x2d\x0a\x2e\xce\x2e'
+    b'\x90\x2f\x4d\x30\x07\x31\xbd\x31\x6f\x32\x1d\x33\xc7\x33\x6d\x34\x0f\x35\xad\x35\x46\x36\xdc\x36'
+    b'\x6d\x37\xfa\x37\x82\x38\x06\x39\x86\x39\x01\x3a\x78\x3a\xea\x3a\x57\x3b\xc0\x3b\x24\x3c\x83\x3c'
+    b'\xde\x3c\x34\x3d\x85\x3d\xd2\x3d\x19\x3e\x5c\x3e\x9a\x3e\xd3\x3e\x07\x3f\x36\x3f\x61\x3f\x86\x3f'
+    b'\xa6\x3f\xc2\x3f\xd8\x3f\xea\x3f\xf6\x3f\xfe\x3f\x00\x40\xfe\x3f\xf6\x3f\xea\x3f\xd8\x3f\xc2\x3f'
+    b'\xa6\x3f\x86\x3f\x61\x3f\x36\x3f\x07\x3f\xd3\x3e\x9a\x3e\x5c\x3e\x19\x3e\xd2\x3d\x85\x3d\x34\x3d'
+    b'\xde\x3c\x83\x3c\x24\x3c\xc0\x3b\x57\x3b\xea\x3a\x78\x3a\x01\x3a\x86\x39\x06\x39\x82\x38\xfa\x37'
+    b'\x6d\x37\xdc\x36\x46\x36\xad\x35\x0f\x35\x6d\x34\xc7\x33\x1d\x33\x6f\x32\xbd\x31\x07\x31\x4d\x30'
+    b'\x90\x2f\xce\x2e\x0a\x2e\x41\x2d\x75\x2c\xa6\x2b\xd3\x2a\xfd\x29\x23\x29\x47\x28\x67\x27\x84\x26'
+    b'\x9e\x25\xb5\x24\xca\x23\xdb\x22\xea\x21\xf6\x20\x00\x20\x07\x1f\x0c\x1e\x0e\x1d\x0e\x1c\x0c\x1b'
+    b'\x08\x1a\x02\x19\xfa\x17\xf0\x16\xe4\x15\xd6\x14\xc7\x13\xb6\x12\xa4\x11\x90\x10\x7c\x0f\x66\x0e'
+    b'\x4e\x0d\x36\x0c\x1d\x0b\x03\x0a\xe8\x08\xcd\x07\xb1\x06\x94\x05\x77\x04\x59\x03\x3c\x02\x1e\x01'
+    b'\x00\x00\xe2\xfe\xc4\xfd\xa7\xfc\x89\xfb\x6c\xfa\x4f\xf9\x33\xf8\x18\xf7\xfd\xf5\xe3\xf4\xca\xf3'
+    b'\xb2\xf2\x9a\xf1\x84\xf0\x70\xef\x5c\xee\x4a\xed\x39\xec\x2a\xeb\x1c\xea\x10\xe9\x06\xe8\xfe\xe6'
+    b'\xf8\xe5\xf4\xe4\xf2\xe3\xf2\xe2\xf4\xe1\xf9\xe0\x00\xe0\x0a\xdf\x16\xde\x25\xdd\x36\xdc\x4b\xdb'
+    b'\x62\xda\x7c\xd9\x99\xd8\xb9\xd7\xdd\xd6\x03\xd6\x2d\xd5\x5a\xd4\x8b\xd3\xbf\xd2\xf6\xd1\x32\xd1'
+    b'\x70\xd0\xb3\xcf\xf9\xce\x43\xce\x91\xcd\xe3\xcc\x39\xcc\x93\xcb\xf1\xca\x53\xca\xba\xc9\x24\xc9'
+    b'\x93\xc8\x06\xc8\x7e\xc7\xfa\xc6\x7a\xc6\xff\xc5\x88\xc5\x16\xc5\xa9\xc4\x40\xc4\xdc\xc3\x7d\xc3'
+    b'\x22\xc3\xcc\xc2\x7b\xc2\x2e\xc2\xe7\xc1\xa4\xc1\x66\xc1\x2d\xc1\xf9\xc0\xca\xc0\x9f\xc0\x7a\xc0'
+    b'\x5a\xc0\x3e\xc0\x28\xc0\x16\xc0\x0a\xc0\x02\xc0\x00\xc0\x02\xc0\x0a\xc0\x16\xc0\x28\xc0\x3e\xc0'
+    b'\x5a\xc0\x7a\xc0\x9f\xc0\xca\xc0\xf9\xc0\x2d\xc1\x66\xc1\xa4\xc1\xe7\xc1\x2e\xc2\x7b\xc2\xcc\xc2'
+    b'\x22\xc3\x7d\xc3\xdc\xc3\x40\xc4\xa9\xc4\x16\xc5\x88\xc5\xff\xc5\x7a\xc6\xfa\xc6\x7e\xc7\x06\xc8'
+    b'\x93\xc8\x24\xc9\xba\xc9\x53\xca\xf1\xca\x93\xcb\x39\xcc\xe3\xcc\x91\xcd\x43\xce\xf9\xce\xb3\xcf'
+    b'\x70\xd0\x32\xd1\xf6\xd1\xbf\xd2\x8b\xd3\x5a\xd4\x2d\xd5\x03\xd6\xdd\xd6\xb9\xd7\x99\xd8\x7c\xd9'
+    b'\x62\xda\x4b\xdb\x36\xdc\x25\xdd\x16\xde\x0a\xdf\x00\xe0\xf9\xe0\xf4\xe1\xf2\xe2\xf2\xe3\xf4\xe4'
+    b'\xf8\xe5\xfe\xe6\x06\xe8\x10\xe9\x1c\xea\x2a\xeb\x39\xec\x4a\xed\x5c\xee\x70\xef\x84\xf0\x9a\xf1'
+    b'\xb2\xf2\xca\xf3\xe3\xf4\xfd\xf5\x18\xf7\x33\xf8\x4f\xf9\x6c\xfa\x89\xfb\xa7\xfc\xc4\xfd\xe2\xfe'))
+
+
+def sin(deg):
+    return SIN[deg % 360]
+
+
+def cos(deg):
+    return SIN[(deg + 90) % 360]
+
+
+def point(cx, cy, r, deg):
+    # r pixels from cx, cy at a clock angle (0 = up, clockwise)
+    return (cx + ((r * SIN[deg % 360] + (ONE >> 1)) >> SHIFT),
+            cy - ((r * SIN[(deg + 90) % 360] + (ONE >> 1)) >> SHIFT))
+
+
+def isqrt(n):
+    # Integer square root, Newton's method
+    if n <= 0:
+        return 0
+    x = n
+    y = (x + 1) >> 1
+    while y < x:
+        x = y
+        y = (x + n // x) >> 1
+    return x
+
+
+def _target(disp):
+    return getattr(disp, 'framebuf', disp)
+
+
+def _dirty(disp, x0, y0, x1, y1):
+    if hasattr(disp, 'invalidate'):
+        disp.invalidate(x0, y0, x1 - x0 + 1, y1 - y0 + 1)
+
+
+def line(disp, x0, y0, x1, y1, c=1):
+    _target(disp).line(x0, y0, x1, y1, c)
+    _dirty(disp, min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+
+
+def _fill(fb, xs, ys, c):
+    # Scanline fill of the polygon xs, ys. Each edge covers rows
+    # [top, bottom), spans run between pairs of crossings rounded to the
+    # nearest pixel. The outline is drawn too, so the fill always covers
+    # what polygon(fill=False) draws.
+    n = len(xs)
+    cross = []
+    for y in range(min(ys), max(ys)):
+        del cross[:]
+        j = n - 1
+        for i in range(n):
+            ya, yb = ys[j], ys[i]
+            if ya != yb and (ya <= y < yb or yb <= y < ya):
+                xa, xb = xs[j], xs[i]
+                dy = yb - ya
+                cross.append(xa + (2 * (y - ya) * (xb - xa) + dy) // (2 * dy))
+            j = i
+        cross.sort()
+        for k in range(0, len(cross) - 1, 2):
+            fb.hline(cross[k], y, cross[k + 1] - cross[k] + 1, c)
+    j = n - 1
+    for i in range(n):
+        fb.line(xs[j], ys[j], xs[i], ys[i], c)
+        j = i
+
+
+def polygon(disp, xs, ys, c=1, fill=True):
+    # xs, ys: vertex coordinates, any simple polygon
+    fb = _target(disp)
+    if fill:
+        _fill(fb, xs, ys, c)
+    else:
+        j = len(xs) - 1
+        for i in range(len(xs)):
+            fb.line(xs[j], ys[j], xs[i], ys[i], c)
+            j = i
+    _dirty(disp, min(xs), min(ys), max(xs), max(ys))
+
+
+def triangle(disp, x0, y0, x1, y1, x2, y2, c=1, fill=True):
+    polygon(disp, (x0, x1, x2), (y0, y1, y2), c, fill)
+
+
+def thick_line(disp, x0, y0, x1, y1, width, c=1):
+    # A width pixel wide bar, filled as a quad around the centre line
+    if width <= 1:
+        line(disp, x0, y0, x1, y1, c)
+        return
+    dx = x1 - x0
+    dy = y1 - y0
+    length = isqrt(dx * dx + dy * dy)
+    if not length:
+        fb = _target(disp)
+        fb.fill_rect(x0 - (width >> 1), y0 - (width >> 1), width, width, c)
+        _dirty(disp, x0 - (width >> 1), y0 - (width >> 1), x0 + width, y0 + width)
+        return
+    # Normal scaled to width - 1 pixels and rounded, split over both sides
+    nx = (-2 * dy * (width - 1) + length) // (2 * length)
+    ny = (2 * dx * (width - 1) + length) // (2 * length)
+    hx = nx >> 1
+    hy = ny >> 1
+    polygon(disp, (x0 + nx - hx, x1 + nx - hx, x1 - hx, x0 - hx),
+            (y0 + ny - hy, y1 + ny - hy, y1 - hy, y0 - hy), c)
+
+
+def circle(disp, cx, cy, r, c=1, fill=False):
+    fb = _target(disp)
+    if hasattr(fb, 'ellipse'):
+        fb.ellipse(cx, cy, r, r, c, fill)
+    else:
+        # Midpoint circle, one octant computed, eight drawn
+        x = r
+        y = 0
+        err = 1 - r
+        while x >= y:
+            if fill:
+                fb.hline(cx - x, cy + y, 2 * x + 1, c)
+                fb.hline(cx - x, cy - y, 2 * x + 1, c)
+                fb.hline(cx - y, cy + x, 2 * y + 1, c)
+                fb.hline(cx - y, cy - x, 2 * y + 1, c)
+            else:
+                fb.pixel(cx + x, cy + y, c)
+                fb.pixel(cx - x, cy + y, c)
+                fb.pixel(cx + x, cy - y, c)
+                fb.pixel(cx - x, cy - y, c)
+                fb.pixel(cx + y, cy + x, c)
+                fb.pixel(cx - y, cy + x, c)
+                fb.pixel(cx + y, cy - x, c)
+                fb.pixel(cx - y, cy - x, c)
+            y += 1
+            if err < 0:
+                err += 2 * y + 1
+            else:
+                x -= 1
+                err += 2 * (y - x) + 1
+    _dirty(disp, cx - r, cy - r, cx + r, cy + r)
+
+
+def arc(disp, cx, cy, r, start, end, c=1, step=6):
+    # Clock angles start..end (end > start), as a polyline of step degree chords
+    fb = _target(disp)
+    px, py = point(cx, cy, r, start)
+    deg = start
+    while deg < end:
+        deg = min(deg + step, end)
+        x, y = point(cx, cy, r, deg)
+        fb.line(px, py, x, y, c)
+        px, py = x, y
+    _dirty(disp, cx - r, cy - r, cx + r, cy + r)
+
+
+def hand(disp, cx, cy, length, deg, width=1, tail=0, c=1):
+    # Clock hand from tail pixels behind the centre to length in front
+    x1, y1 = point(cx, cy, length, deg)
+    x0, y0 = point(cx, cy, tail, deg + 180) if tail else (cx, cy)
+    thick_line(disp, x0, y0, x1, y1, width, c)
+
+
+def ticks(disp, cx, cy, r, count=12, length=3, c=1):
+    # count marks around a dial, pointing inwards from r
+    step = 360 // count
+    for deg in range(0, 360, step):
+        x0, y0 = point(cx, cy, r, deg)
+        x1, y1 = point(cx, cy, r - length, deg)
+        line(disp, x0, y0, x1, y1, c)
+
+
+def gauge(disp, cx, cy, r, value, lo, hi, sweep=240, c=1):
+    # Arc of sweep degrees centred on 12 o'clock with a needle at value
+    start = -(sweep >> 1)
+    arc(disp, cx, cy, r, start, start + sweep, c)
+    if value < lo:
+        value = lo
+    elif value > hi:
+        value = hi
+    deg = start + int((value - lo) * sweep) // (hi - lo)
+    hand(disp, cx, cy, r - 3, deg, 2, c=c)
@@ -0,0 +1,87 @@
+# Single producer, single consumer ring of fixed-size messages
+#
+# For passing state between the two RP2040 cores without a lock: one core
+# only ever writes messages, the other only reads them. Every message slot
+# is allocated up front, so sending allocates nothing and never blocks.
+#
+# head is only written by the producer, tail only by the consumer, each a
+# single store into a preallocated array('H'). The producer fills a slot
+# before moving head past it, and the consumer reads a slot before moving
+# tail past it, so neither side ever sees a half-written message. Both
+# count modulo 2 * slots, which tells a full ring from an empty one.
+#
+#   ring = Ring(16, 6)                   # 16 messages of 6 bytes
+#   # producer
+#   ring.put('<Bhh', MOVE, x, y)         # False when full, the message is dropped
+#   # consumer
+#   msg = ring.peek()                    # memoryview of the oldest, or None
+#   while msg is not None:
+#       ...                              # read msg[0], struct.unpack_from(...)
+#       ring.pop()
+#       msg = ring.peek()
+#
+# put() and get() go through struct and allocate (the argument tuple, the
+# result); on a hot path write the fields into slot() directly and push(),
+# and read them from peek() before pop().
+
+import struct
+from array import array
+
+HEAD = const(0)
+TAIL = const(1)
+
+
+class Ring:
+    def __init__(self, slots, size):
+        self.slots = slots
+        self.size = size
+        self.buf = bytearray(slots * size)
+        self.views = [memoryview(self.buf)[i * size:(i + 1) * size] for i in range(slots)]
+        self.index = array('H', [0, 0])     # head, tail
+        self.dropped = 0                    # put() calls that found the ring full
+
+    def __len__(self):
+        return (self.index[HEAD] - self.index[TAIL]) % (2 * self.slots)
+
+    # Producer side
+
+    def slot(self):
+        # The next free message to fill in, None when full
+        head = self.index[HEAD]
+        if (head - self.index[TAIL]) % (2 * self.slots) == self.slots:
+            return None
+        return self.views[head % self.slots]
+
+    def push(self):
+        # Publishes the slot filled in after slot()
+        self.index[HEAD] = (self.index[HEAD] + 1) % (2 * self.slots)
+
+    def put(self, fmt, *values):
+        msg = self.slot()
+        if msg is None:
+            self.dropped += 1
+            return False
+        struct.pack_into(fmt, msg, 0, *values)
+        self.push()
+        return True
+
+    # Consumer side
+
+    def peek(self):
+        # The oldest message, None when empty. Valid until pop().
+        tail = self.index[TAIL]
+        if tail == self.index[HEAD]:
+            return None
+        return self.views[tail % self.slots]
+
+    def pop(self):
+        self.index[TAIL] = (self.index[TAIL] + 1) % (2 * self.slots)
+
+    def get(self, fmt):
+        # Unpacks and removes the oldest message, None when empty
+        msg = self.peek()
+        if msg is None:
+            return None
+        values = struct.unpack_from(fmt, msg, 0)
+        self.pop()
+        return values
@@ -0,0 +1,220 @@
+# Retained scene: sprites as nodes, only changed regions redrawn
+#
+# Blitting a changed sprite over the old frame leaves the old pixels behind
+# when it moves and cuts into whatever overlaps it. A Scene keeps every node
+# (FrameBuffer, size, position, z) and a list of dirty rectangles. Moving a
+# node, changing its frame or hiding it marks its old and new boxes dirty;
+# render() redraws only those rectangles from the background up, in z order,
+# and the driver's dirty tracking then flushes only them.
+#
+#   scene = Scene(oled)
+#   scene.add('tree', atlas['tree'], 8, 8, 10, 20, z=1)
+#   scene.add('cat', cat_fbuf, 16, 16, 0, 30, z=2, key=0)
+#   scene.move('cat', 4, 30)
+#   scene.render()
+#   oled.show()
+#
+# A node's image can also be a masked.Sprite, composed with its mask so it
+# covers what is behind it even where its pixels are 0.
+#
+# A layer (add_layer) is any object with draw(fb, x0, y0, x1, y1, buf) that
+# draws its own content for the rectangle, e.g. an entities.EntityStore
+# holding hundreds of instances; it invalidates through scene.invalidate().
+# buf is fb's MONO_VLSB buffer, x1 - x0 bytes per page.
+#
+# Rectangles are widened to whole pages, so each is composited in a scratch
+# FrameBuffer (which clips for free) and copied into the display a page row
+# at a time with SSD1306_I2C.blit_vlsb.
+
+import framebuf
+
+MAX_RECTS = const(6)    # beyond this the dirty rectangles are merged into one
+MAX_SHAPES = const(24)  # scratch FrameBuffers kept for narrower rectangles
+
+
+class Node:
+    def __init__(self, name, fbuf, w, h, x, y, z, key, order, layer=None):
+        self.name = name
+        self.layer = layer
+        self.fbuf = fbuf
+        self.w = w
+        self.h = h
+        self.x = x
+        self.y = y
+        self.z = z
+        self.key = key
+        self.masked = hasattr(fbuf, 'compose')
+        self.visible = True
+        self.order = order  # insertion order, ties in z draw oldest first
+
+    def overlaps(self, x0, y0, x1, y1):
+        # Against the half-open rectangle [x0, x1) x [y0, y1)
+        return (self.visible and self.x < x1 and self.x + self.w > x0
+                and self.y < y1 and self.y + self.h > y0)
+
+
+class Scene:
+    def __init__(self, disp, background=0):
+        self.disp = disp
+        self.width = disp.width
+        self.height = disp.height
+        self.background = background
+        self.nodes = []         # sorted by (z, order)
+        self.names = {}
+        self.rects = []         # dirty [x0, y0, x1, y1], half-open, page aligned
+        self._order = 0
+        self._scratch = bytearray(self.width * ((self.height + 7) // 8))
+        # (buffer view, FrameBuffer) over the scratch per rectangle shape,
+        # w | h << 8. The full width ones, one per height, are made up front,
+        # narrower shapes on first use.
+        self._shapes = {}
+        for h in range(8, ((self.height + 7) & ~7) + 1, 8):
+            self._shape(self.width, h)
+        self.invalidate()
+
+    def add(self, name, fbuf, w, h, x=0, y=0, z=0, key=-1, layer=None):
+        if name in self.names:
+            raise ValueError("Node already exists")
+        node = Node(name, fbuf, w, h, x, y, z, key, self._order, layer)
+        self._order += 1
+        self.names[name] = node
+        self.nodes.append(node)
+        self._sort()
+        self._dirty(node)
+        return node
+
+    def add_layer(self, name, layer, z=0):
+        # layer.draw(fb, x0, y0, x1, y1, buf) is called for every dirty rectangle
+        return self.add(name, None, self.width, self.height, 0, 0, z, layer=layer)
+
+    def remove(self, name):
+        node = self.names.pop(name)
+        self.nodes.remove(node)
+        self._dirty(node)
+
+    def __getitem__(self, name):
+        return self.names[name]
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def move(self, name, x, y):
+        node = self.names[name]
+        if node.x == x and node.y == y:
+            return
+        self._dirty(node)
+        node.x = x
+        node.y = y
+        self._dirty(node)
+
+    def set_frame(self, name, fbuf, w=None, h=None):
+        # New image for a node, e.g. the next animation frame
+        node = self.names[name]
+        if w is not None and (w != node.w or h != node.h):
+            self._dirty(node)
+            node.w = w
+            node.h = h
+        node.fbuf = fbuf
+        node.masked = hasattr(fbuf, 'compose')
+        self._dirty(node)
+
+    def set_z(self, name, z):
+        node = self.names[name]
+        if node.z != z:
+            node.z = z
+            self._sort()
+            self._dirty(node)
+
+    def set_visible(self, name, visible):
+        node = self.names[name]
+        if node.visible != visible:
+            node.visible = True
+            self._dirty(node)
+            node.visible = visible
+
+    def _sort(self):
+        self.nodes.sort(key=lambda n: (n.z, n.order))
+
+    def _dirty(self, node):
+        if node.visible:
+            self.invalidate(node.x, node.y, node.w, node.h)
+
+    def invalidate(self, x=0, y=0, w=None, h=None):
+        # Marks a region to be recomposited, the whole screen by default
+        if w is None:
+            w = self.width - x
+        if h is None:
+            h = self.height - y
+        x0 = max(x, 0)
+        x1 = min(x + w, self.width)
+        y0 = max(y, 0) & ~7
+        y1 = min((y + h + 7) & ~7, (self.height + 7) & ~7)
+        if x0 >= x1 or y0 >= y1:
+            return
+        # Merge with every rectangle it touches, then add
+        rects = self.rects
+        i = 0
+        while i < len(rects):
+            r = rects[i]
+            if x0 <= r[2] and r[0] <= x1 and y0 <= r[3] and r[1] <= y1:
+                x0 = min(x0, r[0])
+                y0 = min(y0, r[1])
+                x1 = max(x1, r[2])
+                y1 = max(y1, r[3])
+                rects.pop(i)
+                i = 0
+            else:
+                i += 1
+        rects.append([x0, y0, x1, y1])
+        if len(rects) > MAX_RECTS:
+            for r in rects[:-1]:
+                x0 = min(x0, r[0])
+                y0 = min(y0, r[1])
+                x1 = max(x1, r[2])
+                y1 = max(y1, r[3])
+            self.rects = [[x0, y0, x1, y1]]
+
+    def _shape(self, w, h):
+        key = w | h << 8
+        shape = self._shapes.get(key)
+        if shape is None:
+            if len(self._shapes) >= MAX_SHAPES:
+                # Forget the narrow ones, keep the full width set
+                full = self.width
+                self._shapes = {k: v for k, v in self._shapes.items() if k & 0xff == full}
+            buf = memoryview(self._scratch)[:w * (h >> 3)]
+            shape = (buf, framebuf.FrameBuffer(buf, w, h, framebuf.MONO_VLSB))
+            self._shapes[key] = shape
+        return shape
+
+    def dirty_area(self):
+        # Pixels render() will redraw
+        return sum((r[2] - r[0]) * (r[3] - r[1]) for r in self.rects)
+
+    def render(self):
+        # Recomposites the dirty rectangles into the display buffer. Returns
+        # how many were drawn; the display still needs show().
+        rects = self.rects
+        if not rects:
+            return 0
+        self.rects = []
+        disp = self.disp
+        fast = hasattr(disp, 'blit_vlsb')
+        for x0, y0, x1, y1 in rects:
+            w = x1 - x0
+            h = y1 - y0
+            buf, fb = self._shape(w, h)
+            fb.fill(self.background)
+            for node in self.nodes:
+                if node.overlaps(x0, y0, x1, y1):
+                    if node.layer is not None:
+                        node.layer.draw(fb, x0, y0, x1, y1, buf)
+                    elif node.masked:
+                        node.fbuf.compose(buf, w, h, node.x - x0, node.y - y0)
+                    else:
+                        fb.blit(node.fbuf, node.x - x0, node.y - y0, node.key)
+            if fast:
+                disp.blit_vlsb(buf, x0, y0, w, h, fb)
+            else:
+                disp.blit(fb, x0, y0, -1, w, h)
+        return len(rects)
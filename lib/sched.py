@@ -0,0 +1,154 @@
+# Cooperative periodic scheduler on uasyncio
+#
+# Several machine.Timer callbacks run whenever their timer fires, so one can
+# cut into another halfway through an I2C transfer, and a callback that runs
+# long just gets queued again. Here every periodic job is a task in one
+# coroutine: tasks never interrupt each other, the most important due task
+# runs first, and a late task runs once and drops the releases it missed
+# (frame skipping) instead of running back to back to catch up.
+#
+#   s = sched.Scheduler()
+#   s.add('frame', game.frame, 50, priority=2, budget=30000)
+#   s.add('env', read_sensors, 1000, deadline=200)
+#   asyncio.run(s.run())
+#
+# Per task, in ms unless noted:
+#
+#   period      time between releases
+#   deadline    a run has to finish this long after its release, period by default
+#   priority    larger runs first when several tasks are due
+#   budget      us a run may take, longer runs count as overruns
+#
+# and the statistics: runs, skipped releases, overruns (over budget), missed
+# deadlines, and the latency from release to start (jitter) and run time in
+# us, last, max and total. report() prints them.
+#
+# A task is called with its Task, so it can read its stats; task.dropped is
+# how many releases were skipped before this run, e.g. to keep an animation
+# clock on time while rendering only once.
+# Other coroutines run while the scheduler sleeps, all on the same core.
+
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
+import time
+
+
+class Task:
+    def __init__(self, name, fn, period, deadline, priority, budget, release):
+        self.name = name
+        self.fn = fn
+        self.period = period
+        self.deadline = period if deadline is None else deadline
+        self.priority = priority
+        self.budget = budget
+        self.release = release  # ticks_us of the current or next release
+        self.enabled = True
+        self.reset()
+
+    def reset(self):
+        self.runs = 0
+        self.dropped = 0        # releases skipped just before this run
+        self.skipped = 0
+        self.overruns = 0
+        self.missed = 0
+        self.latency = 0        # us from release to start, last run
+        self.latency_max = 0
+        self.latency_sum = 0
+        self.runtime = 0        # us, last run
+        self.runtime_max = 0
+        self.runtime_sum = 0
+
+
+class Scheduler:
+    def __init__(self):
+        self.tasks = []         # sorted by priority, highest first
+        self.names = {}
+        self.running = False
+
+    def add(self, name, fn, period, deadline=None, priority=0, budget=None, delay=0):
+        # First release delay ms from now
+        if name in self.names:
+            raise ValueError("Task already exists")
+        if period <= 0:
+            raise ValueError("Invalid period")
+        task = Task(name, fn, period, deadline, priority, budget,
+                    time.ticks_add(time.ticks_us(), delay * 1000))
+        self.names[name] = task
+        self.tasks.append(task)
+        self.tasks.sort(key=lambda t: -t.priority)
+        return task
+
+    def remove(self, name):
+        self.tasks.remove(self.names.pop(name))
+
+    def __getitem__(self, name):
+        return self.names[name]
+
+    def step(self):
+        # Runs every due task once, returns ms until the next release
+        ticks_us = time.ticks_us
+        ticks_add = time.ticks_add
+        ticks_diff = time.ticks_diff
+        for task in self.tasks:
+            if not task.enabled:
+                continue
+            start = ticks_us()
+            late = ticks_diff(start, task.release)
+            if late < 0:
+                continue
+            # Releases that passed while an earlier one was pending are dropped
+            period = task.period * 1000
+            task.dropped = 0
+            if late >= period:
+                missed = late // period
+                task.dropped = missed
+                task.skipped += missed
+                task.release = ticks_add(task.release, missed * period)
+                late -= missed * period
+            task.fn(task)
+            runtime = ticks_diff(ticks_us(), start)
+            task.runs += 1
+            task.latency = late
+            task.latency_sum += task.latency
+            if task.latency > task.latency_max:
+                task.latency_max = task.latency
+            task.runtime = runtime
+            task.runtime_sum += runtime
+            if runtime > task.runtime_max:
+                task.runtime_max = runtime
+            if task.budget is not None and runtime > task.budget:
+                task.overruns += 1
+            if late + runtime > task.deadline * 1000:
+                task.missed += 1
+            task.release = ticks_add(task.release, period)
+        now = ticks_us()
+        wait = None
+        for task in self.tasks:
+            if task.enabled:
+                d = ticks_diff(task.release, now)
+                if wait is None or d < wait:
+                    wait = d
+        if wait is None:
+            return 10
+        return 0 if wait < 0 else (wait + 999) // 1000
+
+    async def run(self):
+        # Until stop()
+        self.running = True
+        while self.running:
+            wait = self.step()
+            # Always yield, so other coroutines get a turn
+            await asyncio.sleep_ms(wait)
+
+    def stop(self):
+        self.running = False
+
+    def report(self):
+        print("task        runs  skip  over  miss  lat avg/max us   run avg/max us")
+        for t in self.tasks:
+            n = max(t.runs, 1)
+            print("%-10s %5d %5d %5d %5d %7d %7d %8d %7d" % (
+                t.name, t.runs, t.skipped, t.overruns, t.missed,
+                t.latency_sum // n, t.latency_max, t.runtime_sum // n, t.runtime_max))
@@ -0,0 +1,94 @@
+# MicroPython SH1106 OLED driver (I2C), for the 1.3" 128x64 modules
+#
+# Shares the framebuffer API, dirty tracking, shadow mode and sleep/wake of
+# ssd1306.SSD1306_I2C. The SH1106 has 132 columns of RAM with the panel on
+# columns 2..129 and only page addressing, so show() writes one window per
+# changed page (or changed run with shadow=True) and never the whole RAM.
+
+from ssd1306 import SSD1306_I2C
+
+# register definitions
+SET_CONTRAST        = const(0x81)
+SET_ENTIRE_ON       = const(0xa4)
+SET_NORM_INV        = const(0xa6)
+SET_DISP            = const(0xae)
+SET_COL_LOW         = const(0x00)
+SET_COL_HIGH        = const(0x10)
+SET_PUMP_VOLTAGE    = const(0x30)
+SET_DISP_START_LINE = const(0x40)
+SET_SEG_REMAP       = const(0xa0)
+SET_MUX_RATIO       = const(0xa8)
+SET_DCDC            = const(0xad)
+SET_PAGE            = const(0xb0)
+SET_COM_OUT_DIR     = const(0xc0)
+SET_DISP_OFFSET     = const(0xd3)
+SET_COM_PIN_CFG     = const(0xda)
+SET_DISP_CLK_DIV    = const(0xd5)
+SET_PRECHARGE       = const(0xd9)
+SET_VCOM_DESEL      = const(0xdb)
+
+
+class SH1106_I2C(SSD1306_I2C):
+    def __init__(self, width, height, i2c, addr=0x3c, external_vcc=False, shadow=False, col_offset=2):
+        # Most modules centre the 128 visible columns in the 132 column RAM
+        self.col_offset = col_offset
+        self._page_cmd = bytearray(3)
+        super().__init__(width, height, i2c, addr, external_vcc, shadow)
+
+    def _init_cmds(self):
+        return bytes((
+            SET_DISP | 0x00, # off
+            # resolution and layout
+            SET_DISP_CLK_DIV, 0x80,
+            SET_MUX_RATIO, self.height - 1,
+            SET_DISP_OFFSET, 0x00,
+            SET_DISP_START_LINE | 0x00,
+            SET_SEG_REMAP | 0x01, # column addr 131 mapped to SEG0
+            SET_COM_OUT_DIR | 0x08, # scan from COM[N] to COM0
+            SET_COM_PIN_CFG, 0x12,
+            # timing and driving scheme
+            SET_PRECHARGE, 0x22 if self.external_vcc else 0x1f,
+            SET_VCOM_DESEL, 0x40,
+            SET_PUMP_VOLTAGE | 0x02, # 8.0 V
+            # display
+            SET_CONTRAST, 0xff, # maximum
+            SET_ENTIRE_ON, # output follows RAM contents
+            SET_NORM_INV, # not inverted
+            # DC-DC converter, the SH1106 version of the charge pump
+            SET_DCDC, 0x8a if self.external_vcc else 0x8b,
+            SET_DISP | 0x01)) # on
+
+    def _power_cmds(self, on):
+        if on:
+            return bytes((SET_DCDC, 0x8a if self.external_vcc else 0x8b, SET_DISP | 0x01))
+        return bytes((SET_DISP | 0x00, SET_DCDC, 0x8a))
+
+    # The SH1106 has no scroll unit, and 0x26..0x2f are not its commands, so
+    # none of them is ever sent
+    def hw_scroll(self, *args, **kwargs):
+        raise ValueError("SH1106 has no scroll unit")
+
+    def hw_scroll_diag(self, *args, **kwargs):
+        raise ValueError("SH1106 has no scroll unit")
+
+    def hw_scroll_stop(self):
+        raise ValueError("SH1106 has no scroll unit")
+
+    def _windows(self, runs):
+        # Page addressing only: every run is its own single page window
+        windows = []
+        for p in range(self.pages):
+            for lo, hi in runs[p]:
+                windows.append((lo, hi, p, p))
+        return windows
+
+    def set_window(self, x0, x1, p0, p1):
+        # Page start plus the column pointer. In page addressing the column
+        # pointer just runs on, so x1 and p1 need no command.
+        x0 += self.col_offset
+        cmd = self._page_cmd
+        cmd[0] = SET_PAGE | p0
+        cmd[1] = SET_COL_LOW | (x0 & 0x0f)
+        cmd[2] = SET_COL_HIGH | (x0 >> 4)
+        self.write_cmds(cmd)
+
@@ -2,6 +2,10 @@
 
 import time
 import framebuf
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
 
 # register definitions
 SET_CONTRAST        = const(0x81)
@@ -21,6 +25,19 @@ SET_DISP_CLK_DIV    = const(0xd5)
 SET_PRECHARGE       = const(0xd9)
 SET_VCOM_DESEL      = const(0xdb)
 SET_CHARGE_PUMP     = const(0x8d)
+SET_HSCROLL         = const(0x26)
+SET_VHSCROLL        = const(0x29)
+SET_VSCROLL_AREA    = const(0xa3)
+SET_SCROLL          = const(0x2e)
+
+# Frames between scroll steps -> 3-bit interval code of the scroll commands
+_SCROLL_INTERVAL = {2: 7, 3: 4, 4: 5, 5: 0, 25: 6, 64: 1, 128: 2, 256: 3}
+
+# Rough cost in bytes of opening one more address window in show(): the
+# batched address command transaction plus the extra data transaction header.
+# Neighbouring dirty pages are merged into one window when that sends fewer
+# bytes.
+_WINDOW_COST        = const(10)
 
 
 class SSD1306:
@@ -29,14 +46,37 @@ class SSD1306:
         self.height = height
         self.external_vcc = external_vcc
         self.pages = self.height // 8
+        # Dirty tracking: first and last column drawn on each page since the
+        # last show(). A page is clean while its low mark is past its high mark.
+        self._dlo = bytearray(self.pages)
+        self._dhi = bytearray(self.pages)
+        self.invalidate()
+        # Preallocated SET_COL_ADDR/SET_PAGE_ADDR sequence for show()
+        self._win = bytearray((SET_COL_ADDR, 0, 0, SET_PAGE_ADDR, 0, 0))
+        self.scrolling = False
+        self._scroll_pages = (0, 0)     # pages the scroll unit is moving
+        self.awake = False
+        self.frames = 0
+        self.frame_bytes = 0
+        self.total_bytes = 0
         # Note the subclass must initialize self.framebuf to a framebuffer.
         # This is necessary because the underlying data buffer is different
         # between I2C and SPI implementations (I2C needs an extra byte).
         self.poweron()
         self.init_display()
 
-    def init_display(self):
-        for cmd in (
+    def init_display(self, clear=True):
+        self.write_cmds(self._init_cmds())
+        self.awake = True
+        if clear:
+            self.fill(0)
+        else:
+            # put the current frame back, e.g. after a power loss
+            self.invalidate()
+        self.show()
+
+    def _init_cmds(self):
+        return bytes((
             SET_DISP | 0x00, # off
             # address setting
             SET_MEM_ADDR, 0x00, # horizontal
@@ -57,54 +97,226 @@ class SSD1306:
             SET_NORM_INV, # not inverted
             # charge pump
             SET_CHARGE_PUMP, 0x10 if self.external_vcc else 0x14,
-            SET_DISP | 0x01): # on
+            SET_DISP | 0x01)) # on
+
+    def write_cmds(self, cmds):
+        # Interfaces that can't batch commands send them one by one
+        for cmd in cmds:
             self.write_cmd(cmd)
-        self.fill(0)
-        self.show()
 
     def poweroff(self):
         self.write_cmd(SET_DISP | 0x00)
+        self.awake = False
+
+    def sleep(self):
+        # Display and charge pump off. GDDRAM and every setting are kept
+        # while the panel stays powered; SSD1306_I2C.wake() re-initialises
+        # anyway, as it can't tell whether it did.
+        self.write_cmds(self._power_cmds(False))
+        self.awake = False
+
+    def wake(self):
+        self.write_cmds(self._power_cmds(True))
+        self.awake = True
+
+    def _power_cmds(self, on):
+        if on:
+            return bytes((SET_CHARGE_PUMP, 0x10 if self.external_vcc else 0x14, SET_DISP | 0x01))
+        return bytes((SET_DISP | 0x00, SET_CHARGE_PUMP, 0x10))
 
     def contrast(self, contrast):
-        self.write_cmd(SET_CONTRAST)
-        self.write_cmd(contrast)
+        self.write_cmds(bytes((SET_CONTRAST, contrast)))
 
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
 
+    def hw_scroll(self, left=False, start_page=0, end_page=None, frames=5):
+        # Continuous horizontal scroll done by the panel itself: pages
+        # start_page..end_page move one column every `frames` display frames
+        # (2, 3, 4, 5, 25, 64, 128 or 256) with no CPU or bus time. show()
+        # skips the scrolled pages until hw_scroll_stop().
+        self._hw_scroll((SET_HSCROLL + (1 if left else 0),), start_page, end_page, frames, (0x00, 0xff))
+
+    def hw_scroll_diag(self, dy, left=False, start_page=0, end_page=None, frames=5, top=0, rows=None):
+        # Horizontal scroll of start_page..end_page plus a vertical move of dy
+        # rows per step inside the area of `rows` rows below `top` fixed rows.
+        if rows is None:
+            rows = self.height - top
+        self._hw_scroll((SET_VSCROLL_AREA, top, rows, SET_VHSCROLL + (1 if left else 0)),
+                        start_page, end_page, frames, (dy,))
+
+    def _hw_scroll(self, cmd, start_page, end_page, frames, tail):
+        if frames not in _SCROLL_INTERVAL:
+            raise ValueError("Invalid scroll interval")
+        if end_page is None:
+            end_page = self.pages - 1
+        # A new scroll setup is only accepted while scrolling is off
+        self.write_cmds(bytes((SET_SCROLL,) + cmd + (0x00, start_page, _SCROLL_INTERVAL[frames], end_page)
+                              + tail + (SET_SCROLL | 0x01,)))
+        self._scroll_pages = (start_page, end_page)
+        self.scrolling = True
+
+    def hw_scroll_stop(self):
+        # The scroll unit shifts GDDRAM itself, so the whole frame is resent
+        # on the next show()
+        self.write_cmd(SET_SCROLL)
+        self.scrolling = False
+        self.invalidate()
+
     def show(self):
-        x0 = 0
-        x1 = self.width - 1
+        # Only the windows drawn since the last show() are sent
+        sent = 0
+        windows = self._windows(self._runs())
+        self._clean()
+        for x0, x1, p0, p1 in windows:
+            self.write_window(x0, x1, p0, p1)
+            sent += (x1 - x0 + 1) * (p1 - p0 + 1)
+        self._count(sent)
+
+    def _count(self, sent):
+        self.frames += 1
+        self.frame_bytes = sent
+        self.total_bytes += sent
+
+    def dirty_bytes(self):
+        # Framebuffer bytes the next show() sends, an upper bound when it
+        # diffs against a shadow (SSD1306_I2C narrows it)
+        lo, hi = self._dlo, self._dhi
+        return sum(hi[p] - lo[p] + 1 for p in range(self.pages) if lo[p] <= hi[p])
+
+    def stats(self):
+        # Framebuffer bytes sent per show() against a full-panel flush
+        full = self.width * self.pages
+        avg = self.total_bytes // self.frames if self.frames else 0
+        return {'frames': self.frames, 'last': self.frame_bytes, 'avg': avg,
+                'full': full, 'saved': full - avg}
+
+    def set_window(self, x0, x1, p0, p1):
         if self.width == 64:
             # displays with width of 64 pixels are shifted by 32
             x0 += 32
             x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_framebuf()
+        win = self._win
+        win[1] = x0
+        win[2] = x1
+        win[4] = p0
+        win[5] = p1
+        self.write_cmds(win)
+
+    def _runs(self):
+        # Changed column runs per page, here just the dirty span
+        lo, hi = self._dlo, self._dhi
+        return [((lo[p], hi[p]),) if lo[p] <= hi[p] else () for p in range(self.pages)]
+
+    def _windows(self, runs):
+        # Group column runs into (x0, x1, p0, p1) windows. A page with a single
+        # run joins the window above it when the widened window costs fewer
+        # bytes than a separate one. Pages under a running hardware scroll
+        # are left out, the scroll unit moves their GDDRAM under the driver.
+        s0, s1 = self._scroll_pages if self.scrolling else (1, 0)
+        windows = []
+        win = None
+        for p in range(self.pages):
+            page = () if s0 <= p <= s1 else runs[p]
+            if len(page) != 1:
+                win = None
+                for lo, hi in page:
+                    windows.append((lo, hi, p, p))
+                continue
+            lo, hi = page[0]
+            if win is not None:
+                x0 = min(win[0], lo)
+                x1 = max(win[1], hi)
+                merged = (x1 - x0 + 1) * (p - win[2] + 1)
+                apart = (win[1] - win[0] + 1) * (p - win[2]) + hi - lo + 1 + _WINDOW_COST
+                if merged <= apart:
+                    win[0], win[1], win[3] = x0, x1, p
+                    continue
+            win = [lo, hi, p, p]
+            windows.append(win)
+        return windows
+
+    def invalidate(self, x=0, y=0, w=None, h=None):
+        # Mark a region as changed, e.g. after drawing into self.framebuf
+        # directly. With no size the whole panel is resent on the next show().
+        if w is None:
+            w = self.width - x
+        if h is None:
+            h = self.height - y
+        x0 = max(x, 0)
+        x1 = min(x + w, self.width) - 1
+        y0 = max(y, 0)
+        y1 = min(y + h, self.height) - 1
+        if x0 > x1 or y0 > y1:
+            return
+        lo, hi = self._dlo, self._dhi
+        for p in range(y0 >> 3, (y1 >> 3) + 1):
+            if x0 < lo[p]:
+                lo[p] = x0
+            if x1 > hi[p]:
+                hi[p] = x1
+
+    def _clean(self):
+        for p in range(self.pages):
+            self._dlo[p] = 0xff
+            self._dhi[p] = 0
 
     def fill(self, col):
         self.framebuf.fill(col)
+        self.invalidate()
 
     def pixel(self, x, y, col):
         self.framebuf.pixel(x, y, col)
+        self.invalidate(x, y, 1, 1)
 
     def scroll(self, dx, dy):
         self.framebuf.scroll(dx, dy)
+        self.invalidate()
 
     def text(self, string, x, y, col=1):
         self.framebuf.text(string, x, y, col)
+        self.invalidate(x, y, len(string) * 8, 8)
+
+    def fill_rect(self, x, y, w, h, col):
+        self.framebuf.fill_rect(x, y, w, h, col)
+        self.invalidate(x, y, w, h)
+
+    def rect(self, x, y, w, h, col):
+        self.framebuf.rect(x, y, w, h, col)
+        self.invalidate(x, y, w, h)
+
+    def hline(self, x, y, w, col):
+        self.framebuf.hline(x, y, w, col)
+        self.invalidate(x, y, w, 1)
+
+    def vline(self, x, y, h, col):
+        self.framebuf.vline(x, y, h, col)
+        self.invalidate(x, y, 1, h)
+
+    def line(self, x1, y1, x2, y2, col):
+        self.framebuf.line(x1, y1, x2, y2, col)
+        self.invalidate(min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1)
+
+    def blit(self, fbuf, x, y, key=-1, w=None, h=None):
+        # FrameBuffer objects don't expose their size, pass w and h so only
+        # the covered area is resent. Without them the whole panel is.
+        self.framebuf.blit(fbuf, x, y, key)
+        if w is None or h is None:
+            self.invalidate()
+        else:
+            self.invalidate(x, y, w, h)
 
 
 class SSD1306_I2C(SSD1306):
-    def __init__(self, width, height, i2c, addr=0x3c, external_vcc=False):
+    def __init__(self, width, height, i2c, addr=0x3c, external_vcc=False, shadow=False):
         self.i2c = i2c
         self.addr = addr
         self.temp = bytearray(2)
+        self.cmd_list = [b'\x00', None]  # Co=0, D/C#=0: command stream
+        self.data_list = [b'\x40', None]  # Co=0, D/C#=1: data stream
+        self._flushing = False
+        self._worker = False
+        self._worker_id = None
         # Add an extra byte to the data buffer to hold an I2C data/command byte
         # to use hardware-compatible I2C transactions.  A memoryview of the
         # buffer is used to mask this byte from the framebuffer operations
@@ -112,21 +324,312 @@ class SSD1306_I2C(SSD1306):
         # buffer).
         self.buffer = bytearray(((height // 8) * width) + 1)
         self.buffer[0] = 0x40  # Set first byte of data buffer to Co=0, D/C=1
-        self.framebuf = framebuf.FrameBuffer1(memoryview(self.buffer)[1:], width, height)
+        self.bufmv = memoryview(self.buffer)
+        self.framebuf = framebuf.FrameBuffer1(self.bufmv[1:], width, height)
+        # Shadow mode keeps a copy of what GDDRAM holds and show() only sends
+        # the bytes that differ from it, so fill(0) + full redraw every tick
+        # costs no more bus time than the pixels that really changed.
+        self.shadow = bytearray(len(self.buffer)) if shadow else None
+        self._synced = False
+        self.lost = False
         super().__init__(width, height, external_vcc)
 
+    def init_display(self, clear=True):
+        # GDDRAM contents are unknown until the next full flush
+        self._synced = False
+        super().init_display(clear)
+        self.lost = False
+
+    def wake(self):
+        # Power may have dropped while the panel was asleep: it then comes
+        # back reset with garbage in GDDRAM, and its status reads "display
+        # off" just like a sleeping panel. So the whole init sequence goes
+        # out and the frame is resent, not just the power commands.
+        self.init_display(clear=False)
+
+    def _failed(self):
+        # A write that wasn't acknowledged: the panel may have lost power and
+        # what GDDRAM holds is unknown. check() or wake() re-initialise it.
+        self.lost = True
+        self._synced = False
+
+    def check(self):
+        # Cheap health poll, one status byte. The panel doesn't acknowledge
+        # while unpowered, and after a power loss it comes back reset, which
+        # means switched off. Either is remembered, and once the panel answers
+        # while it should be on it is re-initialised. Returns True then.
+        self._bus()
+        try:
+            status = self.i2c.readfrom(self.addr, 1)[0]
+        except OSError:
+            self.lost = True
+            return False
+        if self.awake and (self.lost or status & 0x40):
+            self.init_display(clear=False)
+            return True
+        return False
+
+    def blit_vlsb(self, data, x, y, w, h, fbuf=None):
+        # Opaque copy of a MONO_VLSB sprite (see host/sprite_convert.py).
+        # With y and h on page boundaries the sprite's pages already have the
+        # layout of self.buffer, so each page is one slice assignment instead
+        # of a per-pixel blit. Other positions fall back to framebuf.blit,
+        # pass the sprite's FrameBuffer as fbuf to avoid building one.
+        if y & 7 or h & 7:
+            if fbuf is None:
+                fbuf = framebuf.FrameBuffer(data, w, h, framebuf.MONO_VLSB)
+            self.blit(fbuf, x, y, -1, w, h)
+            return
+        x0 = max(x, 0)
+        x1 = min(x + w, self.width)
+        if x0 >= x1:
+            return
+        src = memoryview(data)
+        buf = self.bufmv
+        n = x1 - x0
+        for page in range(h >> 3):
+            p = (y >> 3) + page
+            if 0 <= p < self.pages:
+                s = page * w + x0 - x
+                d = 1 + p * self.width + x0
+                buf[d:d + n] = src[s:s + n]
+        self.invalidate(x, y, w, h)
+
+    def _bus(self):
+        # Anything but the worker waits for the frame being sent, so commands
+        # don't land in the middle of it or overwrite the window and command
+        # buffers it is using
+        if self._worker and self._get_ident() != self._worker_id:
+            self.wait()
+
     def write_cmd(self, cmd):
+        self._bus()
         self.temp[0] = 0x80 # Co=1, D/C#=0
         self.temp[1] = cmd
-        self.i2c.writeto(self.addr, self.temp)
+        try:
+            self.i2c.writeto(self.addr, self.temp)
+        except OSError:
+            self._failed()
+            raise
+
+    def write_cmds(self, cmds):
+        # The whole sequence goes out in one transaction behind a single
+        # Co=0 control byte instead of one 2-byte transaction per command.
+        self._bus()
+        self.cmd_list[1] = cmds
+        try:
+            self.i2c.writevto(self.addr, self.cmd_list)
+        except OSError:
+            self._failed()
+            raise
 
     def write_framebuf(self):
         # Blast out the frame buffer using a single I2C transaction to support
         # hardware I2C interfaces.
-        self.i2c.writeto(self.addr, self.buffer)
+        self._bus()
+        try:
+            self.i2c.writeto(self.addr, self.buffer)
+        except OSError:
+            self._failed()
+            raise
+
+    def write_window(self, x0, x1, p0, p1, mv=None):
+        # mv is the buffer to send from, the drawing buffer by default
+        if mv is None:
+            mv = self.bufmv
+        self.set_window(x0, x1, p0, p1)
+        if x0 == 0 and x1 == self.width - 1 and p0 == 0 and p1 == self.pages - 1:
+            try:
+                self.i2c.writeto(self.addr, mv)
+            except OSError:
+                self._failed()
+                raise
+            if self.shadow is not None:
+                self.shadow[:] = mv
+            return
+        # The window rows are not contiguous in the buffer, send them as one
+        # transaction behind a single data control byte.
+        data = [b'\x40']
+        for p in range(p0, p1 + 1):
+            start = 1 + p * self.width + x0
+            data.append(mv[start:start + x1 - x0 + 1])
+        try:
+            self.i2c.writevto(self.addr, data)
+        except OSError:
+            self._failed()
+            raise
+        if self.shadow is not None:
+            for p in range(p0, p1 + 1):
+                start = 1 + p * self.width + x0
+                end = start + x1 - x0 + 1
+                self.shadow[start:end] = mv[start:end]
+
+    def show(self):
+        if self._worker:
+            self.swap()
+        else:
+            super().show()
+
+    def start_worker(self):
+        # Double-buffered mode: show() hands the finished frame to a thread on
+        # core 1 and drawing carries on in a second buffer while it is sent.
+        # The worker owns the bus during a transfer: the driver's own commands
+        # (contrast, sleep, hw_scroll, check, ...) wait for it, call wait()
+        # before using other devices on the same I2C bus from core 0.
+        import _thread
+        if self._worker:
+            return
+        if self._flushing:
+            raise RuntimeError("show_async() is sending a frame")
+        spare = bytearray(len(self.buffer))
+        spare[0] = 0x40
+        spare_mv = memoryview(spare)
+        self._spare = (spare, spare_mv, framebuf.FrameBuffer1(spare_mv[1:], self.width, self.height))
+        self._job = None
+        self._pending = _thread.allocate_lock()
+        self._idle = _thread.allocate_lock()
+        self._pending.acquire()
+        self._get_ident = _thread.get_ident
+        self._worker = True
+        _thread.start_new_thread(self._flush_worker, ())
+
+    def stop_worker(self):
+        if not self._worker:
+            return
+        self._idle.acquire()
+        self._job = None
+        self._pending.release()
+        # The worker releases _idle once more on its way out
+        self._idle.acquire()
+        self._idle.release()
+        self._worker = False
+
+    def wait(self):
+        # Block until the worker has finished sending the last frame
+        if self._worker:
+            self._idle.acquire()
+            self._idle.release()
+
+    def swap(self):
+        # Waits for the previous frame to finish, then gives the worker the
+        # current buffer and switches drawing to the other one. The new back
+        # buffer starts as a copy so partial redraws keep working.
+        self._idle.acquire()
+        windows = self._windows(self._runs())
+        self._clean()
+        if not windows:
+            self._idle.release()
+            self._count(0)
+            return
+        self._count(sum((x1 - x0 + 1) * (p1 - p0 + 1) for x0, x1, p0, p1 in windows))
+        front = self.bufmv
+        spare = self._spare
+        self._spare = (self.buffer, self.bufmv, self.framebuf)
+        self.buffer, self.bufmv, self.framebuf = spare
+        self.bufmv[1:] = front[1:]
+        self._job = (front, windows)
+        self._pending.release()
+
+    def _flush_worker(self):
+        self._worker_id = self._get_ident()
+        while True:
+            self._pending.acquire()
+            job = self._job
+            if job is None:
+                break
+            mv, windows = job
+            try:
+                for x0, x1, p0, p1 in windows:
+                    self.write_window(x0, x1, p0, p1, mv)
+            except OSError:
+                # Already recorded in lost, check() recovers the panel
+                pass
+            self._idle.release()
+        self._idle.release()
+
+    async def show_async(self):
+        # Same windows as show(), but every page of a window is its own
+        # transaction and the uasyncio loop runs between them, so a frame
+        # never blocks other tasks for more than one page (~3 ms at 400 kHz).
+        # The GDDRAM pointer keeps its place between transactions. Anything
+        # drawn while the frame is going out is picked up by the next flush.
+        # Don't call show() on the same panel while this is running. With
+        # start_worker() the frame goes through show() instead: this path
+        # sets the window and writes the pages itself, around the worker.
+        while self._flushing:
+            await asyncio.sleep(0)
+        if self._worker:
+            raise RuntimeError("show_async() with the flush worker running, use show()")
+        self._flushing = True
+        try:
+            sent = 0
+            windows = self._windows(self._runs())
+            self._clean()
+            for x0, x1, p0, p1 in windows:
+                self.set_window(x0, x1, p0, p1)
+                for p in range(p0, p1 + 1):
+                    start = 1 + p * self.width + x0
+                    end = start + x1 - x0 + 1
+                    self.data_list[1] = self.bufmv[start:end]
+                    try:
+                        self.i2c.writevto(self.addr, self.data_list)
+                    except OSError:
+                        self._failed()
+                        raise
+                    if self.shadow is not None:
+                        self.shadow[start:end] = self.bufmv[start:end]
+                    await asyncio.sleep(0)
+                sent += (x1 - x0 + 1) * (p1 - p0 + 1)
+            self._count(sent)
+        finally:
+            self._flushing = False
+
+    def _runs(self):
+        if self.shadow is None:
+            return super()._runs()
+        if not self._synced:
+            self._synced = True
+            return [((0, self.width - 1),)] * self.pages
+        # Compare the dirty span of each page with the shadow and keep the
+        # runs of changed bytes. Unchanged gaps shorter than opening a new
+        # window are sent along instead of splitting the run.
+        buf, shadow = self.buffer, self.shadow
+        runs = []
+        for p in range(self.pages):
+            lo, hi = self._dlo[p], self._dhi[p]
+            base = 1 + p * self.width
+            if lo > hi or buf[base + lo:base + hi + 1] == shadow[base + lo:base + hi + 1]:
+                runs.append(())
+                continue
+            page = []
+            x = lo
+            while x <= hi:
+                if buf[base + x] == shadow[base + x]:
+                    x += 1
+                    continue
+                start = end = x
+                x += 1
+                while x <= hi and x - end <= _WINDOW_COST:
+                    if buf[base + x] != shadow[base + x]:
+                        end = x
+                    x += 1
+                page.append((start, end))
+            runs.append(page)
+        return runs
+
+    def dirty_bytes(self):
+        # With a shadow the bytes the next show() really sends: the windows
+        # of the changed runs, not the dirty span
+        if self.shadow is None or not self._synced:
+            return super().dirty_bytes()
+        return sum((x1 - x0 + 1) * (p1 - p0 + 1) for x0, x1, p0, p1 in self._windows(self._runs()))
+
+    def hw_scroll_stop(self):
+        super().hw_scroll_stop()
+        self._synced = False
 
     def poweron(self):
         pass
     
     def pw_on(self):
-        self.init_display()
+        self.wake()
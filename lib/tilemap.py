@@ -0,0 +1,172 @@
+# Tile world larger than the screen, with a scrolling camera
+#
+# The world is one bytearray of tile indices, a byte per tile, row by row.
+# Only tiles inside the viewport are drawn. When the camera moves the pixels
+# already on screen are shifted and only the strip that scrolled into view is
+# drawn, so a step costs an edge of tiles instead of the whole screen.
+#
+#   tiles = [None, atlas['grass_left'], atlas['grass_mid'], atlas['grass_right']]
+#   world = TileMap(oled, tiles, 32, 16, tile_w=16, tile_h=16)
+#   world.set(3, 2, 2)
+#   world.draw()
+#   world.move(4, 0)            # or world.center_on(pet_x, pet_y)
+#   ... draw sprites at world.to_screen(x, y), then oled.show()
+#
+# Tile None (index 0 by convention) is background, filled with colour 0, as
+# is anything outside the world when it is smaller than the screen.
+#
+# Shifting saves drawing, not bus time: every pixel on screen has moved, so
+# the whole panel is invalidated and the next show() sends it all (with
+# shadow=True only the bytes that really differ). The SSD1306 scroll unit
+# can't help, it scrolls continuously rather than by a given step.
+# The tilemap is the bottom layer: sprites drawn on top move with the
+# pixels when the camera shifts, so erase them first with restore().
+
+MAX_INDEX = const(255)
+
+
+class TileMap:
+    def __init__(self, disp, tiles, cols, rows, data=None, tile_w=8, tile_h=8):
+        if len(tiles) > MAX_INDEX + 1:
+            raise ValueError("Too many tiles")
+        self.disp = disp
+        self.tiles = tiles
+        self.cols = cols
+        self.rows = rows
+        self.tile_w = tile_w
+        self.tile_h = tile_h
+        self.data = bytearray(cols * rows) if data is None else data
+        if len(self.data) != cols * rows:
+            raise ValueError("Tile data doesn't match the map size")
+        self.width = cols * tile_w
+        self.height = rows * tile_h
+        # Camera: world position of the screen's top left pixel
+        self.x = 0
+        self.y = 0
+        # One page row, for moving bytes within the display buffer
+        self._row = bytearray(disp.width)
+
+    def get(self, col, row):
+        return self.data[row * self.cols + col]
+
+    def set(self, col, row, tile):
+        self.data[row * self.cols + col] = tile
+        x = col * self.tile_w - self.x
+        y = row * self.tile_h - self.y
+        self._draw_tiles(x, y, x + self.tile_w, y + self.tile_h)
+
+    def to_screen(self, x, y):
+        return x - self.x, y - self.y
+
+    def to_world(self, x, y):
+        return x + self.x, y + self.y
+
+    def draw(self):
+        # Whole viewport
+        self._draw_tiles(0, 0, self.disp.width, self.disp.height)
+
+    def restore(self, x, y, w, h):
+        # Redraws the tiles under a screen rectangle, e.g. to erase a sprite
+        self._draw_tiles(x, y, x + w, y + h)
+
+    def center_on(self, x, y):
+        # Dynamic camera, centred view: keeps world point x, y mid screen
+        self.move_to(x - self.disp.width // 2, y - self.disp.height // 2)
+
+    def move(self, dx, dy):
+        self.move_to(self.x + dx, self.y + dy)
+
+    def move_to(self, x, y):
+        # Clamped to the world, returns the (dx, dy) the camera really moved
+        sw, sh = self.disp.width, self.disp.height
+        x = max(0, min(x, self.width - sw))
+        y = max(0, min(y, self.height - sh))
+        dx = x - self.x
+        dy = y - self.y
+        if not dx and not dy:
+            return 0, 0
+        self.x = x
+        self.y = y
+        if abs(dx) >= sw or abs(dy) >= sh:
+            self.draw()
+            return dx, dy
+        # Screen content moves against the camera, _draw_tiles fills the strip
+        # that scrolled in, clearing what lies outside the world
+        self._shift(-dx, -dy)
+        if dx > 0:
+            self._draw_tiles(sw - dx, 0, sw, sh)
+        elif dx < 0:
+            self._draw_tiles(0, 0, -dx, sh)
+        if dy > 0:
+            self._draw_tiles(0, sh - dy, sw, sh)
+        elif dy < 0:
+            self._draw_tiles(0, 0, sw, -dy)
+        return dx, dy
+
+    def _shift(self, dx, dy):
+        # Moves the screen content by dx, dy. With whole pages vertically the
+        # SSD1306 buffer is moved a page row at a time with slice copies,
+        # framebuf.scroll goes pixel by pixel.
+        disp = self.disp
+        buf = getattr(disp, 'bufmv', None)
+        if buf is None or dy & 7:
+            disp.scroll(dx, dy)
+            return
+        w = disp.width
+        pages = disp.pages
+        dp = dy >> 3
+        n = w - abs(dx)
+        sx = max(-dx, 0)
+        tx = max(dx, 0)
+        row = self._row
+        order = range(pages - 1, -1, -1) if dp > 0 else range(pages)
+        for p in order:
+            s = p - dp
+            if 0 <= s < pages:
+                # Through row, source and destination may overlap
+                src = 1 + s * w + sx
+                dst = 1 + p * w + tx
+                row[:n] = buf[src:src + n]
+                buf[dst:dst + n] = row[:n]
+        disp.invalidate()
+
+    def _draw_tiles(self, x0, y0, x1, y1):
+        # Draws every tile overlapping the screen rectangle [x0, x1) x [y0, y1)
+        disp = self.disp
+        x0 = max(x0, 0)
+        y0 = max(y0, 0)
+        x1 = min(x1, disp.width)
+        y1 = min(y1, disp.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        fb = getattr(disp, 'framebuf', disp)
+        dirty = hasattr(disp, 'invalidate')
+        # Past the world's edge there are no tiles, clear the rectangle first
+        if x1 > self.width - self.x or y1 > self.height - self.y:
+            fb.fill_rect(x0, y0, x1 - x0, y1 - y0, 0)
+            if dirty:
+                disp.invalidate(x0, y0, x1 - x0, y1 - y0)
+        tw, th = self.tile_w, self.tile_h
+        c0 = (x0 + self.x) // tw
+        c1 = min((x1 - 1 + self.x) // tw, self.cols - 1)
+        r0 = (y0 + self.y) // th
+        r1 = min((y1 - 1 + self.y) // th, self.rows - 1)
+        if c0 > c1 or r0 > r1:
+            return
+        tiles = self.tiles
+        data = self.data
+        for r in range(r0, r1 + 1):
+            y = r * th - self.y
+            base = r * self.cols
+            for c in range(c0, c1 + 1):
+                x = c * tw - self.x
+                tile = tiles[data[base + c]]
+                # Whole tiles, the part outside the rectangle gets the same pixels again
+                if tile is None:
+                    fb.fill_rect(x, y, tw, th, 0)
+                else:
+                    fb.blit(tile, x, y)
+        if dirty:
+            x = c0 * tw - self.x
+            y = r0 * th - self.y
+            disp.invalidate(x, y, (c1 + 1) * tw - self.x - x, (r1 + 1) * th - self.y - y)
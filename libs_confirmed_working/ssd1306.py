@@ -29,6 +29,8 @@ class SSD1306:
         self.height = height
         self.external_vcc = external_vcc
         self.pages = self.height // 8
+        # Preallocated SET_COL_ADDR/SET_PAGE_ADDR sequence for show()
+        self._win = bytearray((SET_COL_ADDR, 0, 0, SET_PAGE_ADDR, 0, 0))
         # Note the subclass must initialize self.framebuf to a framebuffer.
         # This is necessary because the underlying data buffer is different
         # between I2C and SPI implementations (I2C needs an extra byte).
@@ -36,7 +38,7 @@ class SSD1306:
         self.init_display()
 
     def init_display(self):
-        for cmd in (
+        self.write_cmds(bytes((
             SET_DISP | 0x00, # off
             # address setting
             SET_MEM_ADDR, 0x00, # horizontal
@@ -57,17 +59,20 @@ class SSD1306:
             SET_NORM_INV, # not inverted
             # charge pump
             SET_CHARGE_PUMP, 0x10 if self.external_vcc else 0x14,
-            SET_DISP | 0x01): # on
-            self.write_cmd(cmd)
+            SET_DISP | 0x01))) # on
         self.fill(0)
         self.show()
 
+    def write_cmds(self, cmds):
+        # Interfaces that can't batch commands send them one by one
+        for cmd in cmds:
+            self.write_cmd(cmd)
+
     def poweroff(self):
         self.write_cmd(SET_DISP | 0x00)
 
     def contrast(self, contrast):
-        self.write_cmd(SET_CONTRAST)
-        self.write_cmd(contrast)
+        self.write_cmds(bytes((SET_CONTRAST, contrast)))
 
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
@@ -79,12 +84,10 @@ class SSD1306:
             # displays with width of 64 pixels are shifted by 32
             x0 += 32
             x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
+        self._win[1] = x0
+        self._win[2] = x1
+        self._win[5] = self.pages - 1
+        self.write_cmds(self._win)
         self.write_framebuf()
 
     def fill(self, col):
@@ -130,8 +133,12 @@ class SSD1306_I2C(SSD1306):
 
 
 class SSD1306_SPI(SSD1306):
-    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False):
-        self.rate = 10 * 1024 * 1024
+    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False, baudrate=10 * 1024 * 1024, shared=False):
+        # The bus is configured once here. Pass shared=True when other devices
+        # on the same SPI bus change its settings, then it is re-configured
+        # before every transfer like before.
+        self.rate = baudrate
+        self.shared = shared
         dc.init(dc.OUT, value=0)
         res.init(res.OUT, value=0)
         cs.init(cs.OUT, value=1)
@@ -139,20 +146,30 @@ class SSD1306_SPI(SSD1306):
         self.dc = dc
         self.res = res
         self.cs = cs
+        self.cmd = bytearray(1)
         self.buffer = bytearray((height // 8) * width)
         self.framebuf = framebuf.FrameBuffer1(self.buffer, width, height)
+        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        self.cmd[0] = cmd
+        self.write_cmds(self.cmd)
+
+    def write_cmds(self, cmds):
+        # D/C# stays low for the whole sequence, so it goes out under a single
+        # chip select like a data transfer
+        if self.shared:
+            self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.cs.high()
         self.dc.low()
         self.cs.low()
-        self.spi.write(bytearray([cmd]))
+        self.spi.write(cmds)
         self.cs.high()
 
     def write_framebuf(self):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        if self.shared:
+            self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.cs.high()
         self.dc.high()
         self.cs.low()
@@ -12,8 +12,10 @@ import mfs
 from machine import Pin, ADC, I2C, Timer
 import neopixel
 import time
-import env
+import env_vlsb
 import framebuf
+from atlas import Atlas
+import digits
 
 # Initializing I2C
 i2c=machine.I2C(0,sda=Pin(0), scl=Pin(1), freq=400000)
@@ -25,9 +27,10 @@ l1 = Pin(22, Pin.OUT)
 l2 = Pin(23, Pin.OUT)
 np = neopixel.NeoPixel(Pin(23, Pin.OUT), 1)
 rtc = ds3231.DS3231(i2c)
-oled = ssd1306.SSD1306_I2C(128, 64, i2c)
+oled = ssd1306.SSD1306_I2C(128, 64, i2c, shadow=True)
 aht = aht20.AHT20(i2c)
-tree = env.tree
+sprites = Atlas(env_vlsb, framebuf.MONO_VLSB)
+font = digits.small()
 
 month_list = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
 counter = None # Syncs time every 1000 seconds and power on
@@ -50,11 +53,11 @@ def updateFace(timer):
     led.toggle()
     l1.toggle()
     l2.toggle()
-    if (not display_status):
-        oled.poweroff()
+    if (not display_status) and flag:
+        oled.sleep()
         flag = False
     if (display_status) and (not flag):
-        oled.pw_on()
+        oled.wake()
         flag = True
             
     if (counter == None) or (counter >= 1000):
@@ -62,30 +65,29 @@ def updateFace(timer):
         curr = list(rtc.get_time())
     if (counter == None) or (counter % 10 == 0):
         h, t = aht.measure(rounding=2)
+        oled.check() # re-inits the display if it lost power
 
     if (counter == None) or (counter % 2 == 0):
         l = ptr.read_u16()
         
     counter += 1
     oled.fill(0)
-    fbuf = framebuf.FrameBuffer(tree, 8, 8, framebuf.MONO_HLSB)
-    #fbuf1 = framebuf.FrameBuffer(block, 32, 24, framebuf.MONO_HLSB)
-    oled.blit(fbuf, 75, 85)
-    #oled.blit(fbuf, 0, 0)
-    oled.text(str(curr[3]), 0, 0)
-    oled.text(str(curr[4]), 20, 0)
-    oled.text(str(curr[5]), 40, 0)
+    sprites.draw(oled, 'tree', 75, 85)
+    #sprites.draw(oled, 'tree', 0, 0)
+    font.number(oled, curr[3], 0, 0)
+    font.number(oled, curr[4], 20, 0)
+    font.number(oled, curr[5], 40, 0)
 
-    oled.text(str(curr[2]), 0, 12)
+    font.number(oled, curr[2], 0, 12)
     oled.text(month_list[curr[1] - 1], 20, 12)
-    oled.text(str(curr[0]), 55, 12)
+    font.number(oled, curr[0], 55, 12)
     
-    oled.text(str(h), 0, 33)
+    font.fixed(oled, h, 0, 33, 2)
     oled.text("%", 45, 33)
-    oled.text(str(t), 70, 33)
+    font.fixed(oled, t, 70, 33, 2)
     oled.text("C", 115, 33)
     
-    oled.text(str(l), 0, 45)
+    font.number(oled, l, 0, 45)
     oled.text("L", 45, 45)
     
     # Maintain the time until update
@@ -0,0 +1,52 @@
+# Analog clock with AHT20 humidity and temperature gauges, integer raster only
+# Prints how long each face takes to draw (without the flush).
+
+# Add lib dir to sys
+import sys
+if '/lib' not in sys.path:
+    sys.path.append('/lib')
+
+import ds3231
+import ssd1306
+import aht20
+import raster
+from machine import Pin, I2C, Timer
+import time
+
+i2c = I2C(0, sda=Pin(0), scl=Pin(1), freq=400000)
+rtc = ds3231.DS3231(i2c)
+aht = aht20.AHT20(i2c)
+oled = ssd1306.SSD1306_I2C(128, 64, i2c, shadow=True)
+
+CX, CY, R = 32, 32, 31
+curr = list(rtc.get_time())
+h, t = aht.measure(rounding=1)
+counter = 0
+
+def draw_face(timer):
+    global h, t, counter
+    counter += 1
+    if counter % 10 == 0:
+        h, t = aht.measure(rounding=1)
+    curr[:] = rtc.get_time()
+    hour, minute, second = curr[3], curr[4], curr[5]
+
+    start = time.ticks_us()
+    oled.fill(0)
+    raster.circle(oled, CX, CY, R)
+    raster.ticks(oled, CX, CY, R, 12, 4)
+    raster.hand(oled, CX, CY, 16, (hour % 12) * 30 + minute // 2, 3)
+    raster.hand(oled, CX, CY, 25, minute * 6, 2)
+    raster.hand(oled, CX, CY, 28, second * 6, 1, tail=6)
+    raster.circle(oled, CX, CY, 2, fill=True)
+    raster.gauge(oled, 96, 20, 14, h, 0, 100)
+    raster.gauge(oled, 96, 52, 14, t, -10, 50)
+    elapsed = time.ticks_diff(time.ticks_us(), start)
+
+    oled.text("%", 93, 28)
+    oled.text("C", 93, 56)
+    oled.show()
+    print("face drawn in", elapsed, "us")
+
+timer = Timer()
+timer.init(period=1000, mode=Timer.PERIODIC, callback=draw_face)
@@ -5,21 +5,31 @@ import ds3231
 import ssd1306
 from machine import Pin, I2C, Timer
 import mfs
+import digits
+import handpack
 
 # Constants
 I2C_FREQ = 400000
 SYNC_INTERVAL = 1000
 DAYS_IN_MONTH = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
 MONTH_LIST = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+HAND_PACK = '/assets/clock_hands.bin'   # built by host/hands_compile.py
 
 class ClockDisplay:
-    def __init__(self):
+    def __init__(self, analog=False):
         self.i2c = I2C(0, sda=Pin(0), scl=Pin(1), freq=I2C_FREQ)
         self.led = Pin(25, Pin.OUT)
         self.rtc = ds3231.DS3231(self.i2c)
-        self.oled = ssd1306.SSD1306_I2C(128, 64, self.i2c)
+        self.oled = ssd1306.SSD1306_I2C(128, 64, self.i2c, shadow=True)
         self.counter = None
         self.curr = []
+        # Built once, every update only blits
+        self.big = digits.seg7(16, 32, 3)
+        self.small = digits.small()
+        # Analog face on the left half, hands read from the pack in flash
+        self.face = None
+        if analog:
+            self.face = handpack.AnalogFace(self.oled, handpack.HandPack(HAND_PACK), 0, 0)
 
     def print_time(self, timer):
         self.led.toggle()
@@ -31,13 +41,28 @@ class ClockDisplay:
         self.increment_time()
 
     def update_display(self):
+        if self.face is not None:
+            self.update_analog()
+            return
         self.oled.fill(0)
-        self.oled.text(str(self.curr[3]), 0, 10)
-        self.oled.text(str(self.curr[4]), 25, 10)
-        self.oled.text(str(self.curr[5]), 50, 10)
-        self.oled.text(str(self.curr[2]), 0, 40)
-        self.oled.text(MONTH_LIST[self.curr[1] - 1], 25, 40)
-        self.oled.text(str(self.curr[0]), 60, 40)
+        # HH:MM in 7-segment digits, seconds beside them, date below
+        x = self.big.number(self.oled, self.curr[3], 0, 0, 2)
+        x = self.big.text(self.oled, ':', x, 0)
+        self.big.number(self.oled, self.curr[4], x, 0, 2)
+        self.small.number(self.oled, self.curr[5], 96, 24, 2)
+        self.small.number(self.oled, self.curr[2], 0, 48)
+        self.oled.text(MONTH_LIST[self.curr[1] - 1], 25, 48)
+        self.small.number(self.oled, self.curr[0], 60, 48)
+        self.oled.show()
+
+    def update_analog(self):
+        # The dial is opaque, only the right half needs clearing
+        self.face.draw(self.curr[3], self.curr[4], self.curr[5])
+        self.oled.fill_rect(64, 0, 64, 64, 0)
+        self.small.number(self.oled, self.curr[5], 104, 8, 2)
+        self.small.number(self.oled, self.curr[2], 72, 32, 2)
+        self.oled.text(MONTH_LIST[self.curr[1] - 1], 96, 32)
+        self.small.number(self.oled, self.curr[0], 80, 48)
         self.oled.show()
 
     def increment_time(self):
@@ -0,0 +1,39 @@
+# Two SSD1306 panels on the same I2C bus, flushed through a DisplayGroup
+# Clock on the 0x3C panel, temperature/humidity on the 0x3D one
+
+import sys
+if '/lib' not in sys.path:
+    sys.path.append('/lib')
+
+import ds3231
+import ssd1306
+import aht20
+from display_group import DisplayGroup
+from machine import Pin, I2C, Timer
+
+i2c = I2C(0, sda=Pin(0), scl=Pin(1), freq=400000)
+rtc = ds3231.DS3231(i2c)
+aht = aht20.AHT20(i2c)
+
+group = DisplayGroup(budget=1024)
+clock = group.add('clock', ssd1306.SSD1306_I2C(128, 64, i2c, addr=0x3c, shadow=True), max_latency=100)
+env = group.add('env', ssd1306.SSD1306_I2C(128, 64, i2c, addr=0x3d, shadow=True), max_latency=1000)
+counter = 0
+
+def update(timer):
+    global counter
+    curr = rtc.get_time()
+    clock.fill(0)
+    clock.text("%02d:%02d:%02d" % (curr[3], curr[4], curr[5]), 0, 0)
+    if counter % 10 == 0:
+        h, t = aht.measure(rounding=1)
+        env.fill(0)
+        env.text(str(h) + " %", 0, 0)
+        env.text(str(t) + " C", 0, 16)
+    counter += 1
+    group.tick()
+    if counter % 60 == 0:
+        print(group.stats('clock'), group.stats('env'))
+
+timer = Timer()
+timer.init(period=1000, mode=Timer.PERIODIC, callback=update)
@@ -0,0 +1,42 @@
+# Dynamic camera demo: a 32x8 tile grass world panned back and forth
+# Only the tile column that scrolls into view is drawn each frame.
+
+# Add lib dir to sys
+import sys
+if '/lib' not in sys.path:
+    sys.path.append('/lib')
+if '/assets' not in sys.path:
+    sys.path.append('/assets')
+
+import ssd1306
+import env
+from atlas import Atlas
+from tilemap import TileMap
+from machine import Pin, I2C
+import time
+
+i2c = I2C(0, sda=Pin(0), scl=Pin(1), freq=400000)
+oled = ssd1306.SSD1306_I2C(128, 64, i2c, shadow=True)
+sprites = Atlas(env)
+
+tiles = [None, sprites['grass_left'], sprites['grass_mid'], sprites['grass_right']]
+COLS, ROWS = 32, 4
+data = bytearray(COLS * ROWS)
+# Patches of grass along the bottom two rows
+for col in range(0, COLS - 2, 5):
+    for row in (2, 3):
+        data[row * COLS + col] = 1
+        data[row * COLS + col + 1] = 2
+        data[row * COLS + col + 2] = 3
+
+world = TileMap(oled, tiles, COLS, ROWS, data, tile_w=16, tile_h=16)
+world.draw()
+oled.show()
+
+step = 2
+while True:
+    dx, dy = world.move(step, 0)
+    if not dx:
+        step = -step # hit the edge of the world, turn around
+    oled.show()
+    time.sleep_ms(30)
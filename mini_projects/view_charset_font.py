@@ -0,0 +1,37 @@
+# Printing all the characters of a compiled font, the lib/font.py version of view_charset_fb.py
+# Compile one first: python host/font_compile.py font.bdf assets/font_spartan16.py
+
+# Add lib dir to sys
+import sys
+if '/lib' not in sys.path:
+    sys.path.append('/lib')
+if '/assets' not in sys.path:
+    sys.path.append('/assets')
+
+import ssd1306
+import font
+import font_spartan16
+from machine import Pin, I2C
+import time
+
+i2c = I2C(0, sda=Pin(0), scl=Pin(1), freq=400000)
+oled = ssd1306.SSD1306_I2C(128, 64, i2c)
+f = font.Font(font_spartan16)
+
+buffer = []
+row = 0
+for letter in range(f.first, f.last + 1):
+    buffer.append(chr(letter))
+    if f.width(''.join(buffer)) > oled.width:
+        f.text(oled, ''.join(buffer[:-1]), 0, row)
+        row += f.height
+        buffer = buffer[-1:]
+        if row + f.height > oled.height:
+            # Screen full, show it and start the next one
+            oled.show()
+            time.sleep(2)
+            oled.fill(0)
+            row = 0
+f.text(oled, ''.join(buffer), 0, row)
+
+oled.show()